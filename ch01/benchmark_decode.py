@@ -0,0 +1,115 @@
+"""
+이미지 디코딩 벤치마크
+전체 해상도 디코딩과 JPEG 축소 디코딩(draft 모드)의 속도와 메모리 사용량을 비교합니다.
+
+사용 예:
+    python benchmark_decode.py
+    python benchmark_decode.py --count 20 --size 6000x4000
+    python benchmark_decode.py --folder D:/Photos
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from PIL import Image
+
+from image_loader import DISPLAY_SIZE, decode_image
+
+
+def decode_full_then_resize(image_path):
+    """전체 해상도로 디코딩한 뒤 축소 (draft 없음)"""
+    with Image.open(image_path) as image:
+        image.load()
+        decoded_size = image.size
+        image.thumbnail(DISPLAY_SIZE, Image.Resampling.LANCZOS, reducing_gap=None)
+    return decoded_size
+
+
+def decode_pillow_default(image_path):
+    """기존 방식: thumbnail 기본값 (표시 크기의 2배를 기준으로 자동 draft)"""
+    with Image.open(image_path) as image:
+        # thumbnail 내부와 같은 기준의 draft를 먼저 적용해 디코딩 크기를 기록
+        if image.format == "JPEG":
+            image.draft(None, (DISPLAY_SIZE[0] * 2, DISPLAY_SIZE[1] * 2))
+        decoded_size = image.size
+        image.thumbnail(DISPLAY_SIZE, Image.Resampling.LANCZOS)
+    return decoded_size
+
+
+def decode_reduced(image_path):
+    """축소 디코딩: 표시 크기에 맞춘 DCT 스케일링 후 축소"""
+    return decode_image(image_path).decoded_size
+
+
+def create_synthetic_folder(folder, count, size):
+    """카메라 사진 크기의 합성 JPEG 파일 생성"""
+    width, height = size
+    # 노이즈를 섞어 실제 사진처럼 압축률이 낮은 이미지를 만듦
+    base = Image.merge("RGB", [Image.effect_noise((width // 8, height // 8), 60 + 10 * i) for i in range(3)])
+    base = base.resize(size, Image.Resampling.BILINEAR)
+
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"synthetic_{i:03d}.jpg")
+        base.rotate(i * 3).save(path, quality=90)
+        paths.append(path)
+    return paths
+
+
+def run_benchmark(name, decode_func, paths, repeat):
+    """디코딩 함수를 반복 실행해 평균 시간과 디코딩 버퍼 크기 측정"""
+    elapsed = []
+    peak_pixels = 0
+    for _ in range(repeat):
+        for path in paths:
+            start = time.perf_counter()
+            width, height = decode_func(path)
+            elapsed.append(time.perf_counter() - start)
+            peak_pixels = max(peak_pixels, width * height)
+
+    avg_ms = sum(elapsed) / len(elapsed) * 1000
+    # RGB 기준 디코딩 버퍼 크기 (최대 메모리 사용량의 대략적인 지표)
+    peak_mb = peak_pixels * 3 / (1024 * 1024)
+    print(f"  {name:<12} 평균 {avg_ms:8.1f} ms/장 | 디코딩 버퍼 최대 {peak_mb:7.1f} MB")
+    return avg_ms, peak_mb
+
+
+def benchmark_paths(title, paths, repeat):
+    """세 가지 디코딩 방식 비교"""
+    print(f"\n=== {title} ({len(paths)}장 x {repeat}회) ===")
+    full_ms, full_mb = run_benchmark("전체 디코딩", decode_full_then_resize, paths, repeat)
+    run_benchmark("기존 방식", decode_pillow_default, paths, repeat)
+    reduced_ms, reduced_mb = run_benchmark("축소 디코딩", decode_reduced, paths, repeat)
+    print(f"  -> 전체 디코딩 대비 속도 {full_ms / reduced_ms:.1f}배, 메모리 {full_mb / reduced_mb:.1f}배 절감")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이미지 디코딩 벤치마크")
+    parser.add_argument("--folder", help="측정할 실제 이미지 폴더 (지정하지 않으면 합성 이미지 사용)")
+    parser.add_argument("--count", type=int, default=10, help="합성 이미지 개수")
+    parser.add_argument("--size", default="6000x4000", help="합성 이미지 크기 (예: 6000x4000)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    # 1. 예제 이미지
+    sample_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_image.JPG")
+    if os.path.exists(sample_path):
+        benchmark_paths("test_image.JPG", [sample_path], args.repeat * 10)
+
+    # 2. 실제 폴더 또는 합성 폴더
+    if args.folder:
+        image_extensions = ('.jpg', '.jpeg')
+        paths = [os.path.join(args.folder, f) for f in sorted(os.listdir(args.folder))
+                 if f.lower().endswith(image_extensions)]
+        benchmark_paths(args.folder, paths, args.repeat)
+    else:
+        size = tuple(int(v) for v in args.size.lower().split("x"))
+        with tempfile.TemporaryDirectory() as folder:
+            print(f"\n합성 이미지 생성 중... ({args.count}장, {size[0]}x{size[1]})")
+            paths = create_synthetic_folder(folder, args.count, size)
+            benchmark_paths("합성 폴더", paths, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
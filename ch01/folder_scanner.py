@@ -0,0 +1,118 @@
+"""
+폴더 스캔 모듈
+os.scandir로 이미지 파일을 찾는 즉시 조금씩 전달하여,
+파일이 많은 폴더(네트워크 드라이브 등)에서도 첫 이미지를 바로 표시할 수 있게 합니다.
+"""
+
+import os
+import queue
+import re
+import threading
+import time
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff')
+
+# 정렬 방식
+SORT_BY_NAME = "name"
+SORT_BY_MTIME = "mtime"
+
+
+def natural_key(path):
+    """자연 정렬 키 (img2.jpg가 img10.jpg보다 앞에 오도록 숫자를 수치로 비교)"""
+    return [int(part) if part.isdigit() else part
+            for part in re.split(r"(\d+)", path.lower())]
+
+
+def sort_paths(paths, file_stats, sort_mode=SORT_BY_NAME):
+    """경로 목록 정렬 (이름순: 자연 정렬, 수정 시각순: 오래된 것부터)"""
+    if sort_mode == SORT_BY_MTIME:
+        return sorted(paths, key=lambda p: (file_stats[p].st_mtime_ns, natural_key(p)))
+    return sorted(paths, key=natural_key)
+
+
+def iter_image_entries(folder_path, recursive=False, stop_event=None):
+    """폴더에서 이미지 파일을 찾는 대로 (경로, stat) 생성
+
+    recursive가 True이면 하위 폴더까지 탐색합니다. (심볼릭 링크 폴더는 따라가지 않음)
+    접근할 수 없는 폴더나 파일은 건너뜁니다.
+    """
+    folders = [folder_path]
+    while folders:
+        current = folders.pop()
+        subfolders = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if stop_event is not None and stop_event.is_set():
+                        return
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                subfolders.append(entry.path)
+                        elif entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file():
+                            yield entry.path, entry.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+        # 이름순으로 방문하도록 역순으로 쌓음
+        folders.extend(sorted(subfolders, key=natural_key, reverse=True))
+
+
+class FolderScanner:
+    """백그라운드 스레드에서 폴더를 스캔하고 결과를 작은 묶음으로 전달
+
+    스캔 스레드는 큐에 결과를 넣기만 하고, Tk 메인 스레드는 drain으로 꺼내 갑니다.
+    """
+
+    def __init__(self, folder_path, recursive=False, batch_size=200, flush_interval=0.1):
+        self.folder_path = folder_path
+        self.recursive = recursive
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.results = queue.Queue()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        """스캔 스레드 본체"""
+        batch = []
+        first = True
+        last_flush = time.monotonic()
+        try:
+            for path, stat in iter_image_entries(self.folder_path, self.recursive, self.stop_event):
+                batch.append((path, stat))
+                # 첫 이미지는 바로 보내고, 이후에는 개수나 시간 기준으로 묶어서 보냄
+                now = time.monotonic()
+                if first or len(batch) >= self.batch_size or now - last_flush >= self.flush_interval:
+                    self.results.put(batch)
+                    batch = []
+                    first = False
+                    last_flush = now
+            if batch:
+                self.results.put(batch)
+        finally:
+            # 스캔 완료 표시
+            self.results.put(None)
+
+    def drain(self):
+        """지금까지 찾은 결과를 꺼냄: ([(경로, stat), ...], 완료 여부)"""
+        found = []
+        finished = False
+        while True:
+            try:
+                batch = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if batch is None:
+                finished = True
+                break
+            found.extend(batch)
+        return found, finished
@@ -0,0 +1,225 @@
+"""
+격자 보기 모듈
+폴더의 이미지를 썸네일 격자로 보여줍니다.
+화면에 보이는 줄의 썸네일만 PhotoImage로 만들고, 스크롤하면 화면 밖으로 나간 칸을
+재사용하므로 이미지가 수천 장이어도 메모리와 Tk 이미지 핸들 사용량이 일정합니다.
+"""
+
+import math
+import os
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageTk
+
+from image_loader import ThumbnailCache, load_display_image, make_cache_key
+
+# 썸네일 및 칸 크기
+THUMB_SIZE = (128, 128)
+CELL_PADDING = 8
+LABEL_HEIGHT = 18
+CELL_WIDTH = THUMB_SIZE[0] + CELL_PADDING * 2
+CELL_HEIGHT = THUMB_SIZE[1] + LABEL_HEIGHT + CELL_PADDING * 2
+
+# 화면 위아래로 미리 준비해 둘 줄 수
+BUFFER_ROWS = 1
+
+# 격자용 썸네일 캐시 메모리 한도 (바이트)
+GRID_CACHE_BYTES = 32 * 1024 * 1024
+
+# 썸네일 디코딩 완료 여부를 확인하는 주기 (ms)
+POLL_INTERVAL_MS = 30
+
+TILE_BACKGROUND = "#f0f0f0"
+SELECTED_COLOR = "#3b82f6"
+
+
+class Tile:
+    """격자의 칸 하나
+
+    캔버스 아이템과 PhotoImage를 한 번만 만들고, 다른 이미지를 표시할 때는
+    내용만 바꿔서 재사용합니다.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.path = None
+        self.photo = ImageTk.PhotoImage("RGB", THUMB_SIZE)
+        self.frame_item = canvas.create_rectangle(0, 0, 0, 0, outline="", fill=TILE_BACKGROUND)
+        self.image_item = canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
+        self.text_item = canvas.create_text(0, 0, anchor=tk.N, text="", font=("Arial", 8))
+
+    def place(self, x, y, selected):
+        """칸 위치와 선택 표시 갱신"""
+        self.canvas.coords(self.frame_item, x - 3, y - 3, x + THUMB_SIZE[0] + 3, y + THUMB_SIZE[1] + 3)
+        self.canvas.coords(self.image_item, x, y)
+        self.canvas.coords(self.text_item, x + THUMB_SIZE[0] // 2, y + THUMB_SIZE[1] + 4)
+        self.canvas.itemconfigure(self.frame_item, fill=SELECTED_COLOR if selected else TILE_BACKGROUND)
+        for item in (self.frame_item, self.image_item, self.text_item):
+            self.canvas.itemconfigure(item, state=tk.NORMAL)
+
+    def hide(self):
+        """화면 밖으로 나간 칸 숨기기 (재사용 대기)"""
+        self.path = None
+        for item in (self.frame_item, self.image_item, self.text_item):
+            self.canvas.itemconfigure(item, state=tk.HIDDEN)
+
+    def show_thumbnail(self, image):
+        """썸네일을 칸 가운데에 그려서 표시 (image가 None이면 빈 칸)"""
+        tile_image = Image.new("RGB", THUMB_SIZE, TILE_BACKGROUND)
+        if image is not None:
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            tile_image.paste(image, ((THUMB_SIZE[0] - image.width) // 2,
+                                     (THUMB_SIZE[1] - image.height) // 2))
+        self.photo.paste(tile_image)
+
+
+class GridView:
+    """이미지 뷰어의 폴더 목록을 격자로 보여주는 창"""
+
+    def __init__(self, viewer):
+        self.viewer = viewer
+        self.window = tk.Toplevel(viewer.root)
+        self.window.title("격자 보기")
+        self.window.geometry("820x600")
+
+        self.canvas = tk.Canvas(self.window, bg="white", highlightthickness=0,
+                                yscrollincrement=CELL_HEIGHT // 4)
+        self.scrollbar = tk.Scrollbar(self.window, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.canvas.config(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        # 화면에 보이는 칸만 유지 (이미지 인덱스 -> Tile), 나머지는 재사용 대기
+        self.tiles = {}
+        self.free_tiles = []
+        self.columns = 1
+
+        # 격자용 썸네일 캐시와 백그라운드 디코딩 작업 (이미지 인덱스 -> (경로, 캐시 키, Future))
+        self.cache = ThumbnailCache(max_bytes=GRID_CACHE_BYTES)
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="grid")
+        self.futures = {}
+        self.poll_job = None
+
+        self.canvas.bind("<Configure>", lambda e: self.refresh())
+        self.canvas.bind("<Button-1>", self.on_click)
+        self.canvas.bind("<MouseWheel>", self.on_mousewheel)
+        self.canvas.bind("<Button-4>", self.on_mousewheel)
+        self.canvas.bind("<Button-5>", self.on_mousewheel)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+    def on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self.refresh()
+
+    def on_mousewheel(self, event):
+        """마우스 휠 스크롤 (Windows/macOS: delta, Linux: Button-4/5)"""
+        if event.num == 4 or event.delta > 0:
+            self.canvas.yview_scroll(-1, "units")
+        else:
+            self.canvas.yview_scroll(1, "units")
+        self.refresh()
+
+    def on_click(self, event):
+        """클릭한 칸의 이미지를 메인 창에 표시"""
+        column = int(self.canvas.canvasx(event.x) // CELL_WIDTH)
+        row = int(self.canvas.canvasy(event.y) // CELL_HEIGHT)
+        index = row * self.columns + column
+        if column < self.columns and index < len(self.viewer.image_list):
+            self.viewer.show_image_at(index)
+
+    def refresh(self):
+        """보이는 영역에 해당하는 칸만 배치 (목록 변경, 스크롤, 창 크기 변경 시 호출)"""
+        image_list = self.viewer.image_list
+        count = len(image_list)
+
+        self.columns = max(1, self.canvas.winfo_width() // CELL_WIDTH)
+        rows = math.ceil(count / self.columns)
+        self.canvas.config(scrollregion=(0, 0, self.columns * CELL_WIDTH, rows * CELL_HEIGHT))
+
+        # 보이는 줄 범위 계산 (위아래로 BUFFER_ROWS 줄 여유)
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first_row = max(0, int(top // CELL_HEIGHT) - BUFFER_ROWS)
+        last_row = min(rows - 1, int(bottom // CELL_HEIGHT) + BUFFER_ROWS)
+        visible = range(first_row * self.columns, min(count, (last_row + 1) * self.columns))
+
+        # 화면 밖으로 나간 칸은 숨기고 재사용 목록으로, 진행 중인 디코딩은 취소
+        for index in list(self.tiles):
+            if index not in visible:
+                tile = self.tiles.pop(index)
+                tile.hide()
+                self.free_tiles.append(tile)
+        for index in list(self.futures):
+            if index not in visible:
+                self.futures.pop(index)[2].cancel()
+
+        for index in visible:
+            tile = self.tiles.get(index)
+            if tile is None:
+                tile = self.free_tiles.pop() if self.free_tiles else Tile(self.canvas)
+                self.tiles[index] = tile
+            self.place_tile(tile, index, image_list[index])
+
+        if self.futures and self.poll_job is None:
+            self.poll_job = self.window.after(POLL_INTERVAL_MS, self.poll_thumbnails)
+
+    def place_tile(self, tile, index, image_path):
+        """칸을 위치에 배치하고, 이미지가 바뀌었으면 썸네일 표시 또는 디코딩 요청"""
+        row, column = divmod(index, self.columns)
+        tile.place(column * CELL_WIDTH + CELL_PADDING, row * CELL_HEIGHT + CELL_PADDING,
+                   selected=(index == self.viewer.current_index))
+        if tile.path == image_path:
+            return
+
+        tile.path = image_path
+        filename = os.path.basename(image_path)
+        if len(filename) > 20:
+            filename = filename[:17] + "..."
+        self.canvas.itemconfigure(tile.text_item, text=filename)
+
+        key = make_cache_key(image_path, THUMB_SIZE, self.viewer.file_stats.get(image_path))
+        decoded = self.cache.get(key) if key is not None else None
+        if decoded is not None:
+            tile.show_thumbnail(decoded.image)
+            return
+
+        tile.show_thumbnail(None)
+        pending = self.futures.get(index)
+        if pending is None or pending[0] != image_path:
+            if pending is not None:
+                pending[2].cancel()
+            future = self.executor.submit(load_display_image, image_path, THUMB_SIZE,
+                                          self.viewer.thumbnail_index)
+            self.futures[index] = (image_path, key, future)
+
+    def poll_thumbnails(self):
+        """디코딩이 끝난 썸네일을 캐시에 넣고 해당 칸에 표시"""
+        self.poll_job = None
+        for index, (image_path, key, future) in list(self.futures.items()):
+            if not future.done():
+                continue
+            del self.futures[index]
+            if future.cancelled() or future.exception() is not None:
+                continue
+
+            decoded = future.result()
+            if key is not None:
+                self.cache.put(key, decoded)
+            tile = self.tiles.get(index)
+            if tile is not None and tile.path == image_path:
+                tile.show_thumbnail(decoded.image)
+
+        if self.futures:
+            self.poll_job = self.window.after(POLL_INTERVAL_MS, self.poll_thumbnails)
+
+    def close(self):
+        """창을 닫고 백그라운드 작업 정리"""
+        if self.poll_job is not None:
+            self.window.after_cancel(self.poll_job)
+        for _, _, future in self.futures.values():
+            future.cancel()
+        self.futures.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.viewer.grid_view = None
+        self.window.destroy()
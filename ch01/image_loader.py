@@ -0,0 +1,242 @@
+"""
+이미지 디코딩 및 백그라운드 프리페치 모듈
+이미지 뷰어가 Tk 메인 스레드를 막지 않도록 디코딩과 축소 작업을 워커 스레드에서 수행합니다.
+"""
+
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+
+# 화면에 표시할 최대 이미지 크기
+DISPLAY_SIZE = (700, 500)
+
+# 표시용 이미지 캐시의 기본 메모리 한도 (바이트)
+CACHE_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+class DecodedImage:
+    """표시용으로 축소된 이미지와 원본 정보"""
+
+    def __init__(self, path, image, original_size, mode, image_format, decoded_size=None):
+        self.path = path
+        self.image = image                  # 표시 크기로 축소된 PIL 이미지
+        self.original_size = original_size  # 원본 (너비, 높이)
+        self.mode = mode
+        self.format = image_format
+        # 디코더가 실제로 풀어낸 크기 (JPEG 축소 디코딩 시 원본보다 작음)
+        self.decoded_size = decoded_size or original_size
+
+    @property
+    def nbytes(self):
+        """축소된 이미지가 차지하는 대략적인 메모리 크기 (바이트)"""
+        return self.image.width * self.image.height * len(self.image.getbands())
+
+
+def fit_size(image_size, display_size=DISPLAY_SIZE):
+    """가로세로 비율을 유지하면서 display_size 안에 들어가는 크기 계산"""
+    width, height = image_size
+    ratio = min(display_size[0] / width, display_size[1] / height, 1.0)
+    return max(1, round(width * ratio)), max(1, round(height * ratio))
+
+
+def decode_image(image_path, display_size=DISPLAY_SIZE):
+    """이미지를 열어 표시 크기로 축소 (워커 스레드에서 호출됨)"""
+    with Image.open(image_path) as image:
+        original_size = image.size
+        mode = image.mode
+        image_format = image.format
+
+        # JPEG는 디코더 단계에서 1/2, 1/4, 1/8 배율로 축소해서 읽음 (DCT 스케일링)
+        # 실제 표시 크기 이상을 유지하는 가장 작은 배율이 선택되므로 화질 손실이 없음
+        if image_format == "JPEG":
+            image.draft(None, fit_size(original_size, display_size))
+        decoded_size = image.size
+
+        # 축소 디코딩을 직접 했으므로 thumbnail의 자동 draft는 끔
+        image.thumbnail(display_size, Image.Resampling.LANCZOS, reducing_gap=None)
+        # 파일 핸들을 닫아도 되도록 픽셀 데이터를 메모리에 올림
+        image.load()
+
+    return DecodedImage(image_path, image, original_size, mode, image_format, decoded_size)
+
+
+def load_display_image(image_path, display_size=DISPLAY_SIZE, index=None):
+    """썸네일 인덱스에 저장된 이미지가 있으면 사용하고, 없으면 디코딩 후 인덱스에 저장"""
+    if index is None:
+        return decode_image(image_path, display_size)
+
+    stat = os.stat(image_path)
+    decoded = index.get(image_path, stat, display_size)
+    if decoded is None:
+        decoded = decode_image(image_path, display_size)
+        try:
+            index.put(decoded, stat, display_size)
+        except Exception as e:
+            # 인덱스 저장에 실패해도 디코딩한 이미지는 그대로 표시
+            print(f"썸네일 저장 실패: {image_path} ({e})")
+    return decoded
+
+
+def decode_full_image(image_path):
+    """원본 해상도 그대로 디코딩 (확대 보기 등 명시적인 요청에만 사용)"""
+    with Image.open(image_path) as image:
+        image.load()
+        return image
+
+
+def make_cache_key(image_path, display_size=DISPLAY_SIZE, stat=None):
+    """캐시 키 생성: (경로, 수정 시각, 표시 크기)
+
+    파일이 수정되면 키가 달라지므로 오래된 이미지가 표시되지 않습니다.
+    폴더 스캔에서 얻은 stat을 넘기면 파일 정보를 다시 읽지 않습니다.
+    파일 정보를 읽을 수 없으면 None을 반환합니다.
+    """
+    if stat is None:
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+    return (image_path, stat.st_mtime_ns, tuple(display_size))
+
+
+class ThumbnailCache:
+    """표시용으로 축소된 이미지를 보관하는 LRU 캐시
+
+    항목 수가 아니라 이미지가 차지하는 바이트 수를 기준으로
+    max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_bytes=CACHE_BUDGET_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # 키 -> DecodedImage (오래된 순)
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        """통계에 반영하지 않고 캐시 보유 여부만 확인"""
+        return key in self.entries
+
+    def get(self, key):
+        """캐시에서 이미지 조회 (없으면 None)"""
+        decoded = self.entries.get(key)
+        if decoded is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return decoded
+
+    def put(self, key, decoded):
+        """캐시에 이미지 저장 후 한도를 넘으면 오래된 항목 제거"""
+        if key in self.entries:
+            self.current_bytes -= self.entries.pop(key).nbytes
+
+        # 한도보다 큰 이미지는 저장하지 않음
+        if decoded.nbytes > self.max_bytes:
+            return
+
+        self.entries[key] = decoded
+        self.current_bytes += decoded.nbytes
+
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.current_bytes -= evicted.nbytes
+
+    def clear(self):
+        """캐시 비우기 (통계는 유지)"""
+        self.entries.clear()
+        self.current_bytes = 0
+
+    def stats_text(self):
+        """상태바에 표시할 캐시 통계 문자열"""
+        megabytes = self.current_bytes / (1024 * 1024)
+        return f"캐시: 적중 {self.hits} / 실패 {self.misses} / {megabytes:.1f}MB"
+
+
+class ImagePrefetcher:
+    """현재 위치 앞뒤 N장의 이미지를 백그라운드에서 미리 디코딩
+
+    모든 메서드는 Tk 메인 스레드에서만 호출합니다.
+    워커 스레드는 decode_image만 실행하므로 별도의 잠금이 필요 없습니다.
+    """
+
+    def __init__(self, cache, radius=2, max_workers=2, display_size=DISPLAY_SIZE):
+        self.cache = cache
+        self.radius = radius
+        self.display_size = display_size
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="prefetch")
+        self.futures = {}  # 경로 -> Future
+        self.index = None  # 현재 폴더의 썸네일 인덱스 (ThumbnailIndex, 선택)
+
+    def request(self, image_path):
+        """이미지 디코딩 작업을 요청하고 Future 반환 (이미 요청된 작업은 재사용)"""
+        future = self.futures.get(image_path)
+        if future is None or future.cancelled():
+            future = self.executor.submit(load_display_image, image_path,
+                                          self.display_size, self.index)
+            self.futures[image_path] = future
+        return future
+
+    def request_full_image(self, image_path):
+        """원본 해상도 디코딩 작업을 요청하고 Future 반환 (캐시하지 않음)"""
+        return self.executor.submit(decode_full_image, image_path)
+
+    def collect(self, image_path):
+        """완료된 디코딩 결과를 캐시로 옮기고 반환 (아직 진행 중이면 None)
+
+        디코딩 중 발생한 예외는 호출한 쪽으로 그대로 전달됩니다.
+        """
+        future = self.futures.get(image_path)
+        if future is None or not future.done():
+            return None
+        del self.futures[image_path]
+
+        decoded = future.result()
+        key = make_cache_key(image_path, self.display_size)
+        if key is not None:
+            self.cache.put(key, decoded)
+        return decoded
+
+    def update_window(self, image_list, index):
+        """현재 인덱스 앞뒤 radius장만 유지하고 범위를 벗어난 작업은 취소"""
+        if not image_list:
+            self.cancel_all()
+            return
+
+        # 현재 이미지 -> 다음 -> 이전 순으로 가까운 것부터 요청
+        wanted = [image_list[index]]
+        for offset in range(1, self.radius + 1):
+            if index + offset < len(image_list):
+                wanted.append(image_list[index + offset])
+            if index - offset >= 0:
+                wanted.append(image_list[index - offset])
+
+        # 더 이상 필요 없는 작업 정리
+        # (완료된 결과는 캐시에 보관하고, 대기 중인 작업은 취소하고,
+        #  이미 실행 중인 작업은 결과만 버림)
+        wanted_set = set(wanted)
+        for path in list(self.futures):
+            future = self.futures[path]
+            if future.done() and not future.cancelled() and future.exception() is None:
+                self.collect(path)
+            elif path not in wanted_set:
+                self.futures.pop(path).cancel()
+
+        # 이미 캐시에 있는 이미지는 다시 디코딩하지 않음
+        for path in wanted:
+            if make_cache_key(path, self.display_size) not in self.cache:
+                self.request(path)
+
+    def cancel_all(self):
+        """대기 중인 모든 작업 취소"""
+        for future in self.futures.values():
+            future.cancel()
+        self.futures.clear()
+
+    def shutdown(self):
+        """워커 스레드 종료"""
+        self.cancel_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
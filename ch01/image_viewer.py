@@ -1,10 +1,22 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from PIL import Image, ImageTk
+from PIL import ImageTk
 import os
+import sqlite3
+import threading
+
+from folder_scanner import SORT_BY_MTIME, SORT_BY_NAME, FolderScanner, sort_paths
+from grid_view import GridView
+from image_loader import CACHE_BUDGET_BYTES, ImagePrefetcher, ThumbnailCache, make_cache_key
+from thumbnail_index import ThumbnailIndex
+
+# 백그라운드 디코딩 완료 여부를 확인하는 주기 (ms)
+POLL_INTERVAL_MS = 15
+# 폴더 스캔 결과를 가져오는 주기 (ms)
+SCAN_POLL_INTERVAL_MS = 50
 
 class ImageViewer:
-    def __init__(self, root):
+    def __init__(self, root, cache_bytes=CACHE_BUDGET_BYTES):
         self.root = root
         self.root.title("이미지 뷰어")
         self.root.geometry("800x600")
@@ -14,8 +26,28 @@ class ImageViewer:
         self.current_image_path = None
         self.image_list = []
         self.current_index = 0
+        self.current_info = None
+        
+        # 표시용 이미지 LRU 캐시와 앞뒤 이미지를 미리 디코딩하는 백그라운드 워커
+        self.cache = ThumbnailCache(max_bytes=cache_bytes)
+        self.prefetcher = ImagePrefetcher(self.cache, radius=2)
+        self.pending_path = None  # 디코딩 완료를 기다리는 이미지 경로
+        self.poll_job = None      # 예약된 poll_pending 호출
+        
+        # 현재 폴더의 영구 썸네일 인덱스와 백그라운드 갱신 중단 신호
+        self.thumbnail_index = None
+        self.index_stop = threading.Event()
+        
+        # 백그라운드 폴더 스캔 상태
+        self.scanner = None
+        self.file_stats = {}   # 경로 -> os.stat 결과
+        self.scan_status = ""  # 상태바에 덧붙일 스캔 진행 상황
+        
+        # 격자 보기 창 (열려 있을 때만)
+        self.grid_view = None
         
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
         
     def setup_ui(self):
         # 메뉴바 생성
@@ -27,8 +59,10 @@ class ImageViewer:
         menubar.add_cascade(label="파일", menu=file_menu)
         file_menu.add_command(label="이미지 열기", command=self.open_image)
         file_menu.add_command(label="폴더 열기", command=self.open_folder)
+        file_menu.add_command(label="폴더 열기 (하위 폴더 포함)",
+                              command=lambda: self.open_folder(recursive=True))
         file_menu.add_separator()
-        file_menu.add_command(label="종료", command=self.root.quit)
+        file_menu.add_command(label="종료", command=self.quit)
         
         # 도구 메뉴
         tools_menu = tk.Menu(menubar, tearoff=0)
@@ -36,6 +70,17 @@ class ImageViewer:
         tools_menu.add_command(label="이전 이미지", command=self.prev_image)
         tools_menu.add_command(label="다음 이미지", command=self.next_image)
         tools_menu.add_command(label="이미지 정보", command=self.show_image_info)
+        tools_menu.add_command(label="원본 크기로 보기", command=self.show_full_resolution)
+        tools_menu.add_command(label="격자 보기", command=self.show_grid_view)
+        
+        # 정렬 메뉴
+        self.sort_mode = tk.StringVar(value=SORT_BY_NAME)
+        sort_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="정렬", menu=sort_menu)
+        sort_menu.add_radiobutton(label="이름순", variable=self.sort_mode,
+                                  value=SORT_BY_NAME, command=self.sort_image_list)
+        sort_menu.add_radiobutton(label="수정 시각순", variable=self.sort_mode,
+                                  value=SORT_BY_MTIME, command=self.sort_image_list)
         
         # 메인 프레임
         main_frame = tk.Frame(self.root)
@@ -59,6 +104,7 @@ class ImageViewer:
         self.root.bind("<Right>", lambda e: self.next_image())
         self.root.bind("<Control-o>", lambda e: self.open_image())
         self.root.bind("<Control-f>", lambda e: self.open_folder())
+        self.root.bind("<Control-g>", lambda e: self.show_grid_view())
         
     def open_image(self):
         """단일 이미지 파일 열기"""
@@ -71,78 +117,301 @@ class ImageViewer:
         )
         
         if file_path:
+            self.stop_scan()
+            self.image_list = []
+            self.prefetcher.cancel_all()
+            self.close_thumbnail_index()
             self.load_image(file_path)
             
-    def open_folder(self):
-        """폴더에서 이미지 파일들 로드"""
+    def open_folder(self, recursive=False):
+        """폴더에서 이미지 파일들 로드 (스캔은 백그라운드에서 진행)"""
         folder_path = filedialog.askdirectory(title="이미지 폴더 선택")
         
         if folder_path:
+            self.stop_scan()
+            self.prefetcher.cancel_all()
             self.image_list = []
-            image_extensions = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff')
+            self.file_stats = {}
+            self.current_index = 0
+            self.refresh_grid_view()
             
-            for file in os.listdir(folder_path):
-                if file.lower().endswith(image_extensions):
-                    self.image_list.append(os.path.join(folder_path, file))
+            # 스캔하는 동안 찾은 이미지부터 바로 표시
+            self.open_thumbnail_index(folder_path, recursive)
+            scanner = FolderScanner(folder_path, recursive)
+            scanner.start()
+            self.scanner = scanner
+            self.scan_status = "폴더 스캔 중..."
+            self.status_bar.config(text=self.scan_status)
+            self.root.after(SCAN_POLL_INTERVAL_MS, lambda: self.poll_scan(scanner))
             
-            if self.image_list:
-                self.current_index = 0
-                self.load_image(self.image_list[0])
-                self.status_bar.config(text=f"폴더 로드됨: {len(self.image_list)}개 이미지")
-            else:
-                messagebox.showwarning("경고", "선택한 폴더에 이미지 파일이 없습니다.")
-                
-    def load_image(self, image_path):
-        """이미지 로드 및 표시"""
+    def poll_scan(self, scanner):
+        """스캔 스레드가 찾은 이미지를 목록에 추가 (메인 스레드에서 주기적으로 호출)"""
+        # 다른 폴더를 열어 중단된 스캔이면 무시
+        if scanner is not self.scanner:
+            return
+        
+        found, finished = scanner.drain()
+        was_empty = not self.image_list
+        for path, stat in found:
+            self.image_list.append(path)
+            self.file_stats[path] = stat
+        
+        if finished:
+            self.finish_scan(show_first=was_empty)
+            return
+        
+        if found:
+            if was_empty:
+                # 첫 이미지는 찾자마자 표시
+                self.show_image_at(0)
+            elif len(self.image_list) - len(found) <= self.current_index + self.prefetcher.radius:
+                # 프리페치 범위에 새 이미지가 들어왔을 때만 갱신
+                self.prefetcher.update_window(self.image_list, self.current_index)
+            self.scan_status = f"폴더 스캔 중: {len(self.image_list)}개 발견"
+            self.update_status()
+            self.refresh_grid_view()
+        self.root.after(SCAN_POLL_INTERVAL_MS, lambda: self.poll_scan(scanner))
+        
+    def finish_scan(self, show_first=False):
+        """스캔 완료 후 목록 정렬 및 썸네일 인덱스 갱신"""
+        self.scanner = None
+        self.scan_status = ""
+        
+        if not self.image_list:
+            self.close_thumbnail_index()
+            self.status_bar.config(text="준비됨")
+            messagebox.showwarning("경고", "선택한 폴더에 이미지 파일이 없습니다.")
+            return
+        
+        if show_first:
+            # 스캔이 바로 끝난 작은 폴더는 정렬 후 첫 이미지를 표시
+            self.image_list = sort_paths(self.image_list, self.file_stats, self.sort_mode.get())
+            self.show_image_at(0)
+        else:
+            self.sort_image_list()
+        self.refresh_grid_view()
+        self.status_bar.config(text=f"폴더 로드됨: {len(self.image_list)}개 이미지")
+        
+        if self.thumbnail_index is not None:
+            threading.Thread(target=self.thumbnail_index.sync,
+                             args=(dict(self.file_stats), self.index_stop),
+                             daemon=True).start()
+        
+    def stop_scan(self):
+        """진행 중인 폴더 스캔 중단"""
+        if self.scanner is not None:
+            self.scanner.stop()
+            self.scanner = None
+        self.scan_status = ""
+        
+    def sort_image_list(self):
+        """선택한 정렬 방식으로 목록을 정렬하고 현재 이미지 위치 유지"""
+        if not self.image_list or self.scanner is not None:
+            # 스캔 중에는 찾은 순서대로 두고 완료 시 정렬
+            return
+        
+        current_path = self.image_list[self.current_index]
+        self.image_list = sort_paths(self.image_list, self.file_stats, self.sort_mode.get())
+        self.current_index = self.image_list.index(current_path)
+        self.prefetcher.update_window(self.image_list, self.current_index)
+        self.refresh_grid_view()
+        
+    def open_thumbnail_index(self, folder_path, recursive=False):
+        """폴더의 썸네일 인덱스 열기 (갱신은 스캔이 끝난 뒤 finish_scan에서 시작)"""
+        self.close_thumbnail_index()
         try:
-            # 이미지 열기
-            image = Image.open(image_path)
-            
-            # 이미지 크기 조정
-            display_size = (700, 500)
-            image.thumbnail(display_size, Image.Resampling.LANCZOS)
-            
-            # PhotoImage로 변환
-            photo = ImageTk.PhotoImage(image)
-            
-            # 이미지 표시
-            self.image_label.config(image=photo, text="")
-            self.image_label.image = photo  # 참조 유지
-            
-            self.current_image = image
-            self.current_image_path = image_path
+            index = ThumbnailIndex(folder_path, recursive)
+        except (OSError, sqlite3.Error) as e:
+            # 인덱스 없이도 뷰어는 정상 동작
+            print(f"썸네일 인덱스를 열 수 없습니다: {e}")
+            return
+        
+        self.thumbnail_index = index
+        self.prefetcher.index = index
+        self.index_stop = threading.Event()
+        
+    def close_thumbnail_index(self):
+        """백그라운드 갱신을 멈추고 썸네일 인덱스 닫기"""
+        self.index_stop.set()
+        self.prefetcher.index = None
+        if self.thumbnail_index is not None:
+            self.thumbnail_index.close()
+            self.thumbnail_index = None
+        
+    def show_image_at(self, index):
+        """폴더 목록의 index번째 이미지 표시 및 주변 이미지 프리페치"""
+        self.current_index = index
+        self.prefetcher.update_window(self.image_list, index)
+        self.load_image(self.image_list[index])
+        self.refresh_grid_view()
+        
+    def load_image(self, image_path):
+        """이미지 로드 및 표시 (디코딩은 백그라운드에서 수행)"""
+        # 이전 이미지를 기다리던 폴링은 중단
+        if self.poll_job is not None:
+            self.root.after_cancel(self.poll_job)
+            self.poll_job = None
+        
+        # 최근에 본 이미지는 캐시에서 바로 표시
+        key = make_cache_key(image_path)
+        decoded = self.cache.get(key) if key is not None else None
+        if decoded is not None:
+            self.pending_path = None
+            self.display_image(decoded)
+            return
+        
+        future = self.prefetcher.request(image_path)
+        self.pending_path = image_path
+        
+        if future.done():
+            self.finish_loading(image_path)
+        else:
+            self.status_bar.config(text=f"로딩 중: {os.path.basename(image_path)}")
+            self.poll_job = self.root.after(POLL_INTERVAL_MS, self.poll_pending)
             
-            # 상태바 업데이트
-            filename = os.path.basename(image_path)
-            size = f"{image.width} x {image.height}"
-            self.status_bar.config(text=f"파일: {filename} | 크기: {size}")
+    def poll_pending(self):
+        """대기 중인 이미지의 디코딩이 끝났는지 확인 (메인 스레드에서 주기적으로 호출)"""
+        self.poll_job = None
+        image_path = self.pending_path
+        if image_path is None:
+            return
+        
+        future = self.prefetcher.request(image_path)
+        if future.done():
+            self.finish_loading(image_path)
+        else:
+            self.poll_job = self.root.after(POLL_INTERVAL_MS, self.poll_pending)
             
+    def finish_loading(self, image_path):
+        """디코딩이 끝난 이미지를 캐시에 넣고 화면에 표시"""
+        # 그 사이 다른 이미지로 이동했다면 결과를 버림
+        if image_path != self.pending_path:
+            return
+        self.pending_path = None
+        
+        try:
+            self.display_image(self.prefetcher.collect(image_path))
         except Exception as e:
             messagebox.showerror("오류", f"이미지를 로드할 수 없습니다: {str(e)}")
             
+    def display_image(self, decoded):
+        """디코딩된 이미지를 라벨에 표시"""
+        image = decoded.image
+        
+        # PhotoImage로 변환 (Tk 객체이므로 메인 스레드에서 생성)
+        photo = ImageTk.PhotoImage(image)
+        
+        # 이미지 표시
+        self.image_label.config(image=photo, text="")
+        self.image_label.image = photo  # 참조 유지
+        
+        self.current_image = image
+        self.current_image_path = decoded.path
+        self.current_info = decoded
+        self.update_status()
+        
+    def update_status(self):
+        """상태바 업데이트 (현재 파일, 크기, 캐시 통계, 스캔 진행 상황)"""
+        if self.current_image is None:
+            self.status_bar.config(text=self.scan_status or "준비됨")
+            return
+        
+        filename = os.path.basename(self.current_image_path)
+        size = f"{self.current_image.width} x {self.current_image.height}"
+        text = f"파일: {filename} | 크기: {size} | {self.cache.stats_text()}"
+        if self.scan_status:
+            text += f" | {self.scan_status}"
+        self.status_bar.config(text=text)
+            
     def prev_image(self):
         """이전 이미지"""
         if self.image_list and self.current_index > 0:
-            self.current_index -= 1
-            self.load_image(self.image_list[self.current_index])
+            self.show_image_at(self.current_index - 1)
             
     def next_image(self):
         """다음 이미지"""
         if self.image_list and self.current_index < len(self.image_list) - 1:
-            self.current_index += 1
-            self.load_image(self.image_list[self.current_index])
+            self.show_image_at(self.current_index + 1)
             
     def show_image_info(self):
         """이미지 정보 표시"""
         if self.current_image:
             info = f"파일명: {os.path.basename(self.current_image_path)}\n"
-            info += f"크기: {self.current_image.width} x {self.current_image.height}\n"
-            info += f"모드: {self.current_image.mode}\n"
-            info += f"형식: {self.current_image.format}"
+            info += f"크기: {self.current_info.original_size[0]} x {self.current_info.original_size[1]}\n"
+            info += f"모드: {self.current_info.mode}\n"
+            info += f"형식: {self.current_info.format}"
             
             messagebox.showinfo("이미지 정보", info)
         else:
             messagebox.showwarning("경고", "표시할 이미지가 없습니다.")
+            
+    def show_full_resolution(self):
+        """현재 이미지를 원본 해상도로 새 창에 표시 (이때만 전체 디코딩 수행)"""
+        if not self.current_image_path:
+            messagebox.showwarning("경고", "표시할 이미지가 없습니다.")
+            return
+        
+        image_path = self.current_image_path
+        self.status_bar.config(text=f"원본 디코딩 중: {os.path.basename(image_path)}")
+        future = self.prefetcher.request_full_image(image_path)
+        self.root.after(POLL_INTERVAL_MS, lambda: self.poll_full_resolution(image_path, future))
+        
+    def poll_full_resolution(self, image_path, future):
+        """원본 해상도 디코딩이 끝나면 확대 보기 창 열기"""
+        if not future.done():
+            self.root.after(POLL_INTERVAL_MS, lambda: self.poll_full_resolution(image_path, future))
+            return
+        
+        try:
+            image = future.result()
+        except Exception as e:
+            messagebox.showerror("오류", f"이미지를 로드할 수 없습니다: {str(e)}")
+            return
+        
+        # 확대 보기 창 (스크롤 가능한 캔버스)
+        window = tk.Toplevel(self.root)
+        window.title(f"원본 크기 - {os.path.basename(image_path)}")
+        window.geometry("900x700")
+        
+        canvas = tk.Canvas(window, bg="white")
+        h_scroll = tk.Scrollbar(window, orient=tk.HORIZONTAL, command=canvas.xview)
+        v_scroll = tk.Scrollbar(window, orient=tk.VERTICAL, command=canvas.yview)
+        canvas.config(xscrollcommand=h_scroll.set, yscrollcommand=v_scroll.set,
+                      scrollregion=(0, 0, image.width, image.height))
+        v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+        canvas.pack(fill=tk.BOTH, expand=True)
+        
+        photo = ImageTk.PhotoImage(image)
+        canvas.create_image(0, 0, anchor=tk.NW, image=photo)
+        canvas.image = photo  # 참조 유지
+        
+        self.status_bar.config(text=f"원본 크기: {image.width} x {image.height}")
+            
+    def show_grid_view(self):
+        """폴더 이미지를 격자로 보여주는 창 열기 (이미 열려 있으면 앞으로 가져옴)"""
+        if not self.image_list:
+            messagebox.showwarning("경고", "먼저 폴더를 열어주세요.")
+            return
+        
+        if self.grid_view is None:
+            self.grid_view = GridView(self)
+        self.grid_view.window.lift()
+        self.grid_view.refresh()
+        
+    def refresh_grid_view(self):
+        """목록이나 현재 위치가 바뀌면 격자 보기 갱신"""
+        if self.grid_view is not None:
+            self.grid_view.refresh()
+            
+    def quit(self):
+        """백그라운드 워커를 정리하고 종료"""
+        if self.grid_view is not None:
+            self.grid_view.close()
+        self.stop_scan()
+        self.close_thumbnail_index()
+        self.prefetcher.shutdown()
+        self.root.quit()
 
 def main():
     root = tk.Tk()
@@ -0,0 +1,180 @@
+"""
+폴더별 썸네일 인덱스 모듈
+표시 크기로 축소한 썸네일과 원본 정보(크기, 모드, 형식)를 SQLite 파일에 저장해 두고,
+같은 폴더를 다시 열 때 원본을 디코딩하지 않고 바로 사용합니다.
+"""
+
+import hashlib
+import io
+import os
+import sqlite3
+import threading
+from PIL import Image
+
+from image_loader import DISPLAY_SIZE, DecodedImage, decode_image
+
+# 썸네일 인덱스 파일을 저장할 기본 폴더
+DEFAULT_INDEX_DIR = os.path.join(os.path.expanduser("~"), ".image_viewer", "thumbnails")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS thumbnails (
+    path TEXT NOT NULL,
+    display_width INTEGER NOT NULL,
+    display_height INTEGER NOT NULL,
+    file_size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    format TEXT,
+    data BLOB NOT NULL,
+    PRIMARY KEY (path, display_width, display_height)
+)
+"""
+
+
+# JPEG 대신 PNG로 그대로 저장하는 모드 (그 외 모드는 PNG가 저장하지 못하므로 변환)
+PNG_MODES = ("1", "LA", "P", "RGBA", "I;16")
+
+# RGBA로 변환하는 알파 채널 포함 모드 (나머지는 RGB로 변환)
+ALPHA_MODES = ("PA", "RGBa")
+
+
+def encode_thumbnail(image):
+    """썸네일을 저장용 바이트로 변환 (RGB/흑백은 JPEG, 그 외는 PNG)
+
+    CMYK, YCbCr, LAB, F 등 PNG로 저장할 수 없는 모드는 RGB(알파가 있으면 RGBA)로 변환해서 저장합니다.
+    """
+    if image.mode not in ("RGB", "L") + PNG_MODES:
+        image = image.convert("RGBA" if image.mode in ALPHA_MODES else "RGB")
+    buffer = io.BytesIO()
+    if image.mode in ("RGB", "L"):
+        image.save(buffer, format="JPEG", quality=90)
+    else:
+        image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class ThumbnailIndex:
+    """폴더 하나에 대한 영구 썸네일 인덱스
+
+    (경로, 표시 크기)를 키로 하고 파일 크기와 수정 시각이 바뀌면 무효로 처리합니다.
+    여러 워커 스레드에서 동시에 사용할 수 있도록 하나의 연결을 잠금으로 보호합니다.
+    """
+
+    def __init__(self, folder_path, recursive=False, index_dir=DEFAULT_INDEX_DIR):
+        os.makedirs(index_dir, exist_ok=True)
+        # 하위 폴더 포함 여부에 따라 파일 목록이 다르므로 인덱스도 따로 둠
+        scope = f"{os.path.abspath(folder_path)}|{'recursive' if recursive else 'flat'}"
+        folder_key = hashlib.sha1(scope.encode("utf-8")).hexdigest()[:16]
+        self.db_path = os.path.join(index_dir, f"{folder_key}.sqlite")
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(SCHEMA)
+        self.conn.commit()
+
+    def contains(self, image_path, stat, display_size=DISPLAY_SIZE):
+        """유효한 썸네일이 저장되어 있는지 확인 (이미지 데이터는 읽지 않음)"""
+        with self.lock:
+            if self.conn is None:
+                return False
+            row = self.conn.execute(
+                "SELECT file_size, mtime_ns FROM thumbnails "
+                "WHERE path = ? AND display_width = ? AND display_height = ?",
+                (image_path, display_size[0], display_size[1]),
+            ).fetchone()
+        return row is not None and row == (stat.st_size, stat.st_mtime_ns)
+
+    def get(self, image_path, stat, display_size=DISPLAY_SIZE):
+        """저장된 썸네일 조회 (없거나 파일이 바뀌었으면 None)"""
+        with self.lock:
+            if self.conn is None:
+                return None
+            row = self.conn.execute(
+                "SELECT file_size, mtime_ns, width, height, mode, format, data FROM thumbnails "
+                "WHERE path = ? AND display_width = ? AND display_height = ?",
+                (image_path, display_size[0], display_size[1]),
+            ).fetchone()
+
+        if row is None:
+            return None
+        file_size, mtime_ns, width, height, mode, image_format, data = row
+        if file_size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+            return None
+
+        image = Image.open(io.BytesIO(data))
+        image.load()
+        return DecodedImage(image_path, image, (width, height), mode, image_format)
+
+    def put(self, decoded, stat, display_size=DISPLAY_SIZE):
+        """썸네일과 원본 정보 저장"""
+        data = encode_thumbnail(decoded.image)
+        with self.lock:
+            if self.conn is None:
+                return
+            self.conn.execute(
+                "INSERT OR REPLACE INTO thumbnails VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (decoded.path, display_size[0], display_size[1], stat.st_size, stat.st_mtime_ns,
+                 decoded.original_size[0], decoded.original_size[1], decoded.mode, decoded.format, data),
+            )
+            self.conn.commit()
+
+    def refresh(self, file_stats, display_size=DISPLAY_SIZE):
+        """현재 폴더 상태와 인덱스를 비교해 정리
+
+        file_stats: {경로: os.stat 결과}
+        사라지거나 바뀐 파일의 항목은 삭제하고, 썸네일을 새로 만들어야 하는 경로 목록을 반환합니다.
+        """
+        with self.lock:
+            if self.conn is None:
+                return []
+            rows = self.conn.execute(
+                "SELECT path, display_width, display_height, file_size, mtime_ns FROM thumbnails"
+            ).fetchall()
+
+            stale = []
+            indexed = set()
+            for path, width, height, file_size, mtime_ns in rows:
+                stat = file_stats.get(path)
+                if stat is None or stat.st_size != file_size or stat.st_mtime_ns != mtime_ns:
+                    stale.append((path, width, height))
+                elif (width, height) == tuple(display_size):
+                    indexed.add(path)
+
+            self.conn.executemany(
+                "DELETE FROM thumbnails WHERE path = ? AND display_width = ? AND display_height = ?",
+                stale,
+            )
+            self.conn.commit()
+
+        return [path for path in file_stats if path not in indexed]
+
+    def sync(self, file_stats, stop_event, display_size=DISPLAY_SIZE):
+        """폴더 스캔 결과와 인덱스를 맞추고, 바뀐 파일의 썸네일만 새로 생성
+
+        file_stats: 폴더 스캔에서 얻은 {경로: os.stat 결과}
+        디코딩이 오래 걸릴 수 있으므로 백그라운드 스레드에서 실행합니다.
+        stop_event가 설정되면 (다른 폴더를 열거나 종료할 때) 중단합니다.
+        """
+        for image_path in self.refresh(file_stats, display_size):
+            if stop_event.is_set():
+                return
+            try:
+                # 그 사이 프리페치 워커가 이미 저장했을 수 있음
+                stat = file_stats[image_path]
+                if self.contains(image_path, stat, display_size):
+                    continue
+                self.put(decode_image(image_path, display_size), stat, display_size)
+            except Exception as e:
+                print(f"썸네일 생성 실패: {image_path} ({e})")
+
+    def close(self):
+        """인덱스 파일 닫기"""
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
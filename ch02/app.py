@@ -1,90 +1,193 @@
 import os
+import math
 import numpy as np
 from flask import Flask, request, jsonify, render_template
-from PIL import Image, ImageOps
+from PIL import Image
 import base64
 import io
-import tensorflow as tf
-from tensorflow.keras.models import load_model, Sequential
-from tensorflow.keras.layers import Flatten, Dense, Dropout
-from tensorflow.keras.datasets import mnist
 
-# 모델 파일 경로
-MODEL_PATH = 'mnist_cnn.h5'
+from fast_inference import NumpyMLP
+from micro_batcher import MicroBatcher
+from model_loader import ERROR, READY, ModelLoader, find_model, predictor_for
+from preprocessing import preprocess_batch, to_ink
+
 IMG_SIZE = 28
+# /predict_batch 한 번에 받을 수 있는 최대 이미지 수
+MAX_BATCH_IMAGES = 256
+# 동시 /predict 요청을 묶는 마이크로 배칭 설정 (환경 변수로 변경 가능)
+MICRO_BATCH_SIZE = int(os.environ.get('MNIST_MICRO_BATCH_SIZE', 32))
+MICRO_BATCH_WAIT_MS = float(os.environ.get('MNIST_MICRO_BATCH_WAIT_MS', 0))
+PREDICT_TIMEOUT = 10  # 초
+# application/octet-stream으로 받을 수 있는 원시 이미지의 최대 한 변 크기 (웹 캔버스 크기)
+MAX_RAW_SIZE = 280
 
-# 모델 준비 함수
-def get_or_train_model():
-    if os.path.exists(MODEL_PATH):
-        try:
-            model = load_model(MODEL_PATH)
-            return model
-        except Exception as e:
-            print('모델 로드 실패:', e)
-            os.remove(MODEL_PATH)
-    (x_train, y_train), (x_test, y_test) = mnist.load_data()
-    x_train, x_test = x_train / 255.0, x_test / 255.0
-    model = Sequential([
-        Flatten(input_shape=(28, 28)),
-        Dense(128, activation='relu'),
-        Dropout(0.2),
-        Dense(10, activation='softmax')
-    ])
-    model.compile(optimizer='adam',
-                  loss='sparse_categorical_crossentropy',
-                  metrics=['accuracy'])
-    model.fit(x_train, y_train, epochs=3, validation_data=(x_test, y_test), verbose=2)
-    model.save(MODEL_PATH)
-    return model
+# 인코딩된 이미지 파일(PNG 등) 바이트를 글씨 배열(0~1, 글씨가 1, 원본 크기)로 변환하는 함수
+def decode_image_bytes(img_bytes):
+    try:
+        img = Image.open(io.BytesIO(img_bytes)).convert('L')
+        return to_ink(img)
+    except Exception as e:
+        print('이미지 전처리 오류:', e)
+        return None
 
-# base64 이미지를 28x28 numpy 배열로 변환하는 함수
-def preprocess_image(data_url):
+# base64 data URL을 글씨 배열로 변환하는 함수
+def decode_data_url(data_url):
     try:
         # data:image/png;base64,... 부분 제거
         header, encoded = data_url.split(',', 1)
         img_bytes = base64.b64decode(encoded)
-        img = Image.open(io.BytesIO(img_bytes)).convert('L')
-        img = ImageOps.invert(img)
-        img = img.resize((IMG_SIZE, IMG_SIZE))
-        img = np.array(img) / 255.0
-        return img
     except Exception as e:
         print('이미지 전처리 오류:', e)
         return None
+    return decode_image_bytes(img_bytes)
 
-# 예측 함수
-def predict_digit(model, img):
+# 원시 그레이스케일 바이트(정사각형, 흰 배경에 검은 글씨, 한 픽셀당 1바이트)를 글씨 배열로 변환하는 함수
+# 이미지 디코딩 없이 바로 배열로 사용
+def decode_raw(raw):
+    size = math.isqrt(len(raw))
+    if size == 0 or size * size != len(raw) or size > MAX_RAW_SIZE:
+        print('이미지 전처리 오류: 정사각형 그레이스케일 이미지가 아닙니다.', len(raw))
+        return None
+    return to_ink(np.frombuffer(raw, dtype=np.uint8).reshape(size, size))
+
+# 글씨 배열 하나를 MNIST 방식(20x20 상자, 무게 중심 정렬)의 28x28 배열로 변환하는 함수
+def center_one(ink):
+    return None if ink is None else preprocess_batch([ink])[0]
+
+# base64 이미지를 28x28 numpy 배열로 변환하는 함수
+def preprocess_image(data_url):
+    return center_one(decode_data_url(data_url))
+
+# 이미지 파일 바이트를 28x28 numpy 배열로 변환하는 함수
+def preprocess_image_bytes(img_bytes):
+    return center_one(decode_image_bytes(img_bytes))
+
+# 원시 그레이스케일 바이트를 28x28 numpy 배열로 변환하는 함수
+def preprocess_raw(raw):
+    return center_one(decode_raw(raw))
+
+# 예측 함수 (predictor: build_predictor로 만든 저지연 예측 함수)
+def predict_digit(predictor, img):
     try:
         img = img.reshape(1, 28, 28)
-        pred = model.predict(img)
+        pred = predictor(img)
         return int(np.argmax(pred)), float(np.max(pred))
     except Exception as e:
         print('예측 오류:', e)
         return None, None
 
+# 여러 이미지를 한 번의 forward pass로 예측하는 함수
+def predict_digits(predictor, imgs):
+    try:
+        batch = np.stack(imgs).reshape(-1, IMG_SIZE, IMG_SIZE)
+        preds = predictor(batch)
+        return [(int(np.argmax(p)), float(np.max(p))) for p in preds]
+    except Exception as e:
+        print('예측 오류:', e)
+        return None
+
+# 마이크로 배칭 큐를 거쳐 예측하는 함수 (동시에 들어온 요청을 모아 한 번에 처리)
+def predict_digit_batched(batcher, img):
+    try:
+        pred = batcher.submit(img).result(timeout=PREDICT_TIMEOUT)
+        return int(np.argmax(pred)), float(np.max(pred))
+    except Exception as e:
+        print('예측 오류:', e)
+        return None, None
+
+# 모델 파일 확인 (체크섬이 맞지 않거나 모델이 없으면 여기서 예외가 발생해 서버가 시작되지 않음)
+# 서버는 학습을 하지 않으므로 모델은 train_model.py로 미리 만들어 둬야 함
+manifest = find_model()
+
 # Flask 앱 생성
+# 모델은 백그라운드에서 로딩하므로 서버는 바로 요청을 받을 수 있음
 app = Flask(__name__)
-model = get_or_train_model()
+loader = ModelLoader(lambda: predictor_for(manifest)).start()
+batcher = MicroBatcher(loader.predict, max_batch_size=MICRO_BATCH_SIZE, max_wait_ms=MICRO_BATCH_WAIT_MS)
 
 # 메인 페이지 라우트
 @app.route('/')
 def index():
     return render_template('index.html')
 
+# 모델 준비 상태 확인 라우트 (준비되면 200, 로딩 중이거나 실패하면 503)
+@app.route('/health')
+def health():
+    body = {'status': loader.status, 'model_version': manifest['version'] if manifest else None}
+    if loader.load_seconds is not None:
+        body['load_seconds'] = round(loader.load_seconds, 3)
+    if loader.error:
+        body['error'] = loader.error
+    return jsonify(body), 200 if loader.status == READY else 503
+
+def model_not_ready():
+    """모델이 준비되지 않았을 때의 응답"""
+    message = '모델을 불러오지 못했습니다.' if loader.status == ERROR else '모델을 준비하는 중입니다.'
+    return jsonify({'error': message, 'status': loader.status}), 503
+
+# /predict 요청에서 이미지를 꺼내 전처리하는 함수 (반환: (28x28 배열, 오류 메시지))
+# application/octet-stream: 원시 그레이스케일 바이트, multipart/form-data: 'image' 파일, 그 외: JSON data URL
+def image_from_request():
+    if request.mimetype == 'application/octet-stream':
+        raw = request.get_data()
+        img = preprocess_raw(raw) if raw else None
+    elif request.mimetype == 'multipart/form-data':
+        file = request.files.get('image')
+        raw = file.read() if file is not None else None
+        img = preprocess_image_bytes(raw) if raw else None
+    else:
+        data = request.get_json(silent=True) or {}
+        raw = data.get('image')
+        img = preprocess_image(raw) if isinstance(raw, str) and raw else None
+    if not raw:
+        return None, '이미지 데이터가 없습니다.'
+    if img is None:
+        return None, '이미지 전처리 실패'
+    return img, None
+
 # 예측 API 라우트
 @app.route('/predict', methods=['POST'])
 def predict():
-    data = request.get_json()
-    img_data = data.get('image')
-    if not img_data:
-        return jsonify({'error': '이미지 데이터가 없습니다.'}), 400
-    img = preprocess_image(img_data)
+    if loader.status != READY:
+        return model_not_ready()
+    img, error = image_from_request()
     if img is None:
-        return jsonify({'error': '이미지 전처리 실패'}), 400
-    pred, conf = predict_digit(model, img)
+        return jsonify({'error': error}), 400
+    # NumPy 예측은 한 번에 약 0.05 ms라 큐를 거치는 비용이 더 크므로 요청 스레드에서 바로 예측하고,
+    # 호출마다 고정 비용이 큰 tf.function 예측 함수만 마이크로 배칭 큐로 묶음 (benchmark_batch.py --tf 참고)
+    if isinstance(loader.predictor, NumpyMLP):
+        pred, conf = predict_digit(loader.predictor, img)
+    else:
+        pred, conf = predict_digit_batched(batcher, img)
     if pred is None:
         return jsonify({'error': '예측 실패'}), 500
     return jsonify({'result': pred, 'confidence': round(conf if conf is not None else 0.0, 2)})
 
+# 여러 이미지 일괄 예측 API 라우트
+@app.route('/predict_batch', methods=['POST'])
+def predict_batch():
+    if loader.status != READY:
+        return model_not_ready()
+    data = request.get_json(silent=True) or {}
+    images = data.get('images')
+    if not isinstance(images, list) or not images:
+        return jsonify({'error': '이미지 목록이 없습니다.'}), 400
+    if len(images) > MAX_BATCH_IMAGES:
+        return jsonify({'error': f'한 번에 최대 {MAX_BATCH_IMAGES}개까지 예측할 수 있습니다.'}), 400
+
+    # 디코딩에 성공한 이미지만 모아서 한 번에 MNIST 방식 전처리 후 예측
+    inks = [decode_data_url(img_data) if isinstance(img_data, str) else None for img_data in images]
+    valid = [i for i, ink in enumerate(inks) if ink is not None]
+    imgs = preprocess_batch([inks[i] for i in valid]) if valid else []
+    preds = predict_digits(loader.predictor, imgs) if valid else []
+    if preds is None:
+        return jsonify({'error': '예측 실패'}), 500
+
+    # 요청 순서대로 결과 정리 (실패한 이미지는 error 항목)
+    results = [{'error': '이미지 전처리 실패'} for _ in images]
+    for i, (pred, conf) in zip(valid, preds):
+        results[i] = {'result': pred, 'confidence': round(conf, 2)}
+    return jsonify({'results': results})
+
 if __name__ == '__main__':
     app.run(debug=True) 
\ No newline at end of file
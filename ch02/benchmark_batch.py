@@ -0,0 +1,134 @@
+"""
+일괄 예측 벤치마크
+N번의 단일 예측과 한 번의 일괄 예측(/predict_batch)의 처리량을 비교하고,
+마이크로 배칭 큐가 혼자 온 요청의 지연을 늘리지 않는지, 동시 요청에서 처리량을 올리는지 측정합니다.
+
+사용 예:
+    python benchmark_batch.py
+    python benchmark_batch.py --count 256 --repeat 5 --concurrency 16
+    python benchmark_batch.py --tf      # tf.function 예측 함수에서의 마이크로 배칭 효과도 측정
+"""
+
+import argparse
+import base64
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from PIL import Image, ImageDraw
+
+from app import (MICRO_BATCH_SIZE, MICRO_BATCH_WAIT_MS, app, batcher, loader, predict_digit,
+                 predict_digit_batched, predict_digits, preprocess_image)
+from fast_inference import build_tf_predictor
+from micro_batcher import MicroBatcher
+from model_loader import MODEL_PATH, load_keras_model
+
+
+def make_data_url(seed):
+    """웹 캔버스와 같은 280x280 PNG data URL 생성 (무작위 획 몇 개)"""
+    rng = np.random.default_rng(seed)
+    img = Image.new('L', (280, 280), 'white')
+    draw = ImageDraw.Draw(img)
+    points = [tuple(int(v) for v in p) for p in rng.integers(60, 220, size=(4, 2))]
+    draw.line(points, fill='black', width=18)
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return 'data:image/png;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def measure(func, repeat):
+    """func를 repeat번 실행한 평균 시간 (초)"""
+    func()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def median_latency(func, items, repeat):
+    """항목마다 func를 하나씩 호출한 지연 시간의 중앙값 (초)"""
+    func(items[0])  # 워밍업
+    latencies = []
+    for _ in range(repeat):
+        for item in items:
+            start = time.perf_counter()
+            func(item)
+            latencies.append(time.perf_counter() - start)
+    return float(np.median(latencies))
+
+
+def report_concurrency(title, predictor, batcher, requests, concurrency, repeat):
+    """동시 요청에서 요청별 예측과 마이크로 배칭 큐의 처리량 비교"""
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        direct = measure(lambda: list(pool.map(lambda img: predict_digit(predictor, img), requests)), repeat)
+        batches, items = batcher.batches, batcher.items
+        batched = measure(lambda: list(pool.map(lambda img: predict_digit_batched(batcher, img), requests)),
+                          repeat)
+        average_batch = (batcher.items - items) / max(1, batcher.batches - batches)
+    print(f"\n=== {title} ({len(requests)}건) ===")
+    print(f"  요청별 예측:   {direct * 1000:8.1f} ms ({len(requests) / direct:8.1f} 건/초)")
+    print(f"  마이크로 배칭: {batched * 1000:8.1f} ms ({len(requests) / batched:8.1f} 건/초, "
+          f"평균 배치 {average_batch:.1f}개)")
+    print(f"  -> {direct / batched:.1f}배 빠름")
+
+
+def report(title, count, single_sec, batch_sec):
+    print(f"\n=== {title} ({count}장) ===")
+    print(f"  단일 예측 {count}번: {single_sec * 1000:8.1f} ms ({count / single_sec:8.1f} 장/초)")
+    print(f"  일괄 예측 1번:    {batch_sec * 1000:8.1f} ms ({count / batch_sec:8.1f} 장/초)")
+    print(f"  -> {single_sec / batch_sec:.1f}배 빠름")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='일괄 예측 벤치마크')
+    parser.add_argument('--count', type=int, default=64, help='이미지 개수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--concurrency', type=int, default=16, help='동시 요청 수')
+    parser.add_argument('--concurrency-rounds', type=int, default=8,
+                        help='동시 요청 측정에서 이미지 목록을 반복해 보낼 횟수')
+    parser.add_argument('--tf', action='store_true',
+                        help=f'{MODEL_PATH}을 tf.function 예측 함수로도 측정 (TensorFlow 필요)')
+    args = parser.parse_args()
+
+    predictor = loader.wait()
+    data_urls = [make_data_url(i) for i in range(args.count)]
+    imgs = [preprocess_image(url) for url in data_urls]
+
+    # 1. 모델 예측만 비교
+    single = measure(lambda: [predict_digit(predictor, img) for img in imgs], args.repeat)
+    batch = measure(lambda: predict_digits(predictor, imgs), args.repeat)
+    report('모델 예측', args.count, single, batch)
+
+    # 2. HTTP 엔드포인트 비교 (전처리와 JSON 처리 포함)
+    client = app.test_client()
+    single = measure(lambda: [client.post('/predict', json={'image': url}) for url in data_urls], args.repeat)
+    batch = measure(lambda: client.post('/predict_batch', json={'images': data_urls}), args.repeat)
+    report('/predict vs /predict_batch', args.count, single, batch)
+
+    # 3. 혼자 온 요청: 마이크로 배칭 큐를 거쳐도 다른 요청을 기다리지 않아야 함
+    direct = median_latency(lambda img: predict_digit(predictor, img), imgs, args.repeat)
+    batched = median_latency(lambda img: predict_digit_batched(batcher, img), imgs, args.repeat)
+    print(f"\n=== 혼자 온 요청의 지연 (p50, {args.count * args.repeat}번) ===")
+    print(f"  요청별 예측:   {direct * 1000:8.3f} ms")
+    print(f"  마이크로 배칭: {batched * 1000:8.3f} ms (큐를 거치는 비용 {(batched - direct) * 1000:+.3f} ms)")
+
+    # 4. 동시 요청: 요청마다 따로 예측 vs 마이크로 배칭 큐 (워커가 예측하는 동안 쌓인 요청을 묶음)
+    requests = imgs * args.concurrency_rounds
+    report_concurrency(f'동시 요청 {args.concurrency}개, {type(predictor).__name__}',
+                       predictor, batcher, requests, args.concurrency, args.repeat)
+
+    # 5. 호출마다 고정 비용이 큰 tf.function 예측 함수 (Dense 층이 아닌 모델에서 사용하는 경로)
+    if args.tf:
+        tf_predictor = build_tf_predictor(load_keras_model(MODEL_PATH))
+        tf_batcher = MicroBatcher(tf_predictor, max_batch_size=MICRO_BATCH_SIZE, max_wait_ms=MICRO_BATCH_WAIT_MS)
+        direct = median_latency(lambda img: predict_digit(tf_predictor, img), imgs, args.repeat)
+        batched = median_latency(lambda img: predict_digit_batched(tf_batcher, img), imgs, args.repeat)
+        print(f"\n=== 혼자 온 요청의 지연 (p50, tf.function) ===")
+        print(f"  요청별 예측:   {direct * 1000:8.3f} ms")
+        print(f"  마이크로 배칭: {batched * 1000:8.3f} ms (큐를 거치는 비용 {(batched - direct) * 1000:+.3f} ms)")
+        report_concurrency(f'동시 요청 {args.concurrency}개, tf.function',
+                           tf_predictor, tf_batcher, requests, args.concurrency, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+단일 예측 지연 시간 벤치마크
+28x28 이미지 한 장에 대한 model.predict와 저지연 경로(build_predictor)의
+p50/p99 지연 시간을 비교하고, 두 경로의 결과가 같은지 확인합니다.
+
+사용 예:
+    python benchmark_latency.py
+    python benchmark_latency.py --count 500
+"""
+
+import argparse
+import os
+import time
+import numpy as np
+
+from fast_inference import build_predictor
+from model_loader import MODEL_PATH, find_model, load_keras_model
+
+
+def percentiles(samples):
+    """지연 시간 목록 (초) -> (p50, p99) (ms)"""
+    p50, p99 = np.percentile(np.array(samples) * 1000, [50, 99])
+    return p50, p99
+
+
+def measure_latency(func, imgs):
+    """이미지마다 func를 한 번씩 호출한 지연 시간 목록 (초)"""
+    func(imgs[0])  # 워밍업
+    samples = []
+    for img in imgs:
+        start = time.perf_counter()
+        func(img)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description='단일 예측 지연 시간 벤치마크')
+    parser.add_argument('--count', type=int, default=200, help='측정할 예측 횟수')
+    args = parser.parse_args()
+
+    manifest = find_model()
+    model = load_keras_model(os.path.join(manifest['model_dir'], manifest['model']) if manifest else MODEL_PATH)
+    predictor = build_predictor(model)
+    rng = np.random.default_rng(0)
+    imgs = rng.random((args.count, 1, 28, 28), dtype=np.float32)
+
+    # 1. 결과 일치 확인
+    expected = model.predict(imgs[:, 0], verbose=0)
+    actual = predictor(imgs[:, 0])
+    same_digit = np.mean(expected.argmax(axis=1) == actual.argmax(axis=1))
+    print(f"최대 확률 차이: {np.abs(expected - actual).max():.2e}, 예측 숫자 일치율: {same_digit * 100:.1f}%")
+    if not np.allclose(expected, actual, atol=1e-5):
+        print("경고: model.predict와 결과가 다릅니다.")
+
+    # 2. 지연 시간 비교
+    results = [
+        ('model.predict', measure_latency(lambda img: model.predict(img, verbose=0), imgs)),
+        ('저지연 경로', measure_latency(predictor, imgs)),
+    ]
+    print(f"\n=== 단일 예측 지연 시간 ({args.count}회) ===")
+    for name, samples in results:
+        p50, p99 = percentiles(samples)
+        print(f"  {name:14s} p50 {p50:8.3f} ms   p99 {p99:8.3f} ms")
+    base_p50 = percentiles(results[0][1])[0]
+    fast_p50 = percentiles(results[1][1])[0]
+    print(f"  -> p50 기준 {base_p50 / fast_p50:.1f}배 빠름")
+
+
+if __name__ == '__main__':
+    main()
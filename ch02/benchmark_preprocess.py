@@ -0,0 +1,98 @@
+"""
+전처리 벤치마크
+280x280 캔버스 이미지 N장(및 작은 56x56 크기)을 28x28로 만드는 시간을 비교합니다.
+  - 단순 리사이즈: 이미지마다 PIL로 반전 후 28x28 리사이즈 (이전 방식)
+  - MNIST 방식 (한 장씩): preprocess_batch를 이미지마다 호출
+  - MNIST 방식 (일괄): preprocess_batch 한 번 호출
+또한 같은 숫자를 작게/구석에 그렸을 때 두 방식의 예측이 원래 그림과 같은지 확인합니다.
+
+사용 예:
+    python benchmark_preprocess.py
+    python benchmark_preprocess.py --count 256
+"""
+
+import argparse
+import time
+import numpy as np
+from PIL import Image, ImageDraw, ImageOps
+
+from model_loader import load_predictor
+from preprocessing import preprocess_batch, to_ink
+
+CANVAS_SIZE = 280
+
+# 숫자 모양 (0~1 좌표의 획 목록)
+DIGIT_STROKES = {
+    0: [[(0.5, 0.1), (0.2, 0.3), (0.2, 0.7), (0.5, 0.9), (0.8, 0.7), (0.8, 0.3), (0.5, 0.1)]],
+    1: [[(0.4, 0.2), (0.55, 0.1), (0.55, 0.9)]],
+    4: [[(0.6, 0.1), (0.15, 0.65), (0.85, 0.65)], [(0.6, 0.1), (0.6, 0.9)]],
+    7: [[(0.15, 0.1), (0.85, 0.1), (0.4, 0.9)]],
+}
+
+
+def draw_digit(digit, box):
+    """box=(왼쪽, 위, 크기) 안에 숫자를 그린 280x280 흰 배경 이미지"""
+    img = Image.new('L', (CANVAS_SIZE, CANVAS_SIZE), 'white')
+    draw = ImageDraw.Draw(img)
+    left, top, size = box
+    width = max(4, size // 10)
+    for stroke in DIGIT_STROKES[digit]:
+        points = [(left + x * size, top + y * size) for x, y in stroke]
+        draw.line(points, fill='black', width=width, joint='curve')
+    return img
+
+
+def resize_only(img):
+    """이전 방식: 반전 후 28x28 리사이즈"""
+    return np.array(ImageOps.invert(img).resize((28, 28))) / 255.0
+
+
+def measure(func, repeat=3):
+    func()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='전처리 벤치마크')
+    parser.add_argument('--count', type=int, default=64, help='이미지 개수')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    digits = list(DIGIT_STROKES)
+    imgs = [draw_digit(digits[i % len(digits)], (int(rng.integers(0, 120)), int(rng.integers(0, 120)),
+                                                   int(rng.integers(60, 160))))
+            for i in range(args.count)]
+
+    # 1. 처리 시간
+    for size in (CANVAS_SIZE, 56):
+        sized = imgs if size == CANVAS_SIZE else [img.resize((size, size), Image.BOX) for img in imgs]
+        inks = [to_ink(img) for img in sized]
+        plain = measure(lambda: [resize_only(img) for img in sized])
+        one_by_one = measure(lambda: [preprocess_batch([ink]) for ink in inks])
+        batch = measure(lambda: preprocess_batch(inks))
+        print(f"=== 전처리 시간 ({args.count}장, {size}x{size}) ===")
+        print(f"  단순 리사이즈 (PIL, 한 장씩): {plain * 1000:8.1f} ms")
+        print(f"  MNIST 방식 (한 장씩):         {one_by_one * 1000:8.1f} ms")
+        print(f"  MNIST 방식 (일괄):            {batch * 1000:8.1f} ms -> 한 장씩보다 {one_by_one / batch:.1f}배 빠름\n")
+
+    # 2. 위치와 크기를 바꿔 그린 숫자의 예측 비교 (기준: 가운데에 크게 그린 숫자)
+    predictor = load_predictor()
+    boxes = [(40, 40, 200), (10, 10, 70), (190, 180, 80), (150, 20, 110), (20, 160, 100)]
+    plain_ok = centered_ok = total = 0
+    for digit in digits:
+        variants = [draw_digit(digit, box) for box in boxes]
+        plain_preds = predictor(np.stack([resize_only(img) for img in variants])).argmax(axis=1)
+        centered_preds = predictor(preprocess_batch([to_ink(img) for img in variants])).argmax(axis=1)
+        plain_ok += int((plain_preds[1:] == plain_preds[0]).sum())
+        centered_ok += int((centered_preds[1:] == centered_preds[0]).sum())
+        total += len(boxes) - 1
+    print(f"=== 작게/구석에 그린 숫자가 가운데에 그린 숫자와 같게 예측된 비율 ({total}개) ===")
+    print(f"  단순 리사이즈: {plain_ok / total * 100:5.1f}%")
+    print(f"  MNIST 방식:    {centered_ok / total * 100:5.1f}%")
+
+
+if __name__ == '__main__':
+    main()
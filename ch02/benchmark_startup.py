@@ -0,0 +1,111 @@
+"""
+서버 시작 시간 벤치마크
+새 파이썬 프로세스에서 app.py를 import하고,
+'/' 요청에 응답할 수 있을 때까지와 /health가 ready가 될 때까지의 시간을 측정합니다.
+매니페스트에 NumPy 가중치 파일이 있을 때와 Keras 모델만 있을 때(TensorFlow로 로드)를 비교합니다.
+측정은 임시 폴더에 복사한 모델 결과물로 수행하므로 models/ 폴더는 바뀌지 않습니다.
+
+사용 예:
+    python benchmark_startup.py
+    python benchmark_startup.py --repeat 5
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from model_loader import MANIFEST_PATH, MODEL_DIR, MODEL_PATH
+
+# 자식 프로세스에서 실행할 코드 (측정 결과를 JSON 한 줄로 출력)
+CHILD_CODE = '''
+import json, sys, time
+start = time.perf_counter()
+from app import app, loader
+client = app.test_client()
+index_status = client.get('/').status_code
+index_sec = time.perf_counter() - start
+loader.ready.wait()
+ready_sec = time.perf_counter() - start
+health = client.get('/health').get_json()
+print(json.dumps({'index': index_sec, 'ready': ready_sec, 'index_status': index_status,
+                  'status': health['status'], 'tensorflow': 'tensorflow' in sys.modules}))
+'''
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_child(work_dir):
+    """work_dir을 현재 폴더로 하는 새 프로세스에서 시작 시간 측정 (표준 출력의 마지막 줄이 결과)"""
+    env = dict(os.environ, PYTHONPATH=APP_DIR)
+    output = subprocess.run([sys.executable, '-c', CHILD_CODE], capture_output=True, text=True,
+                            cwd=work_dir, env=env, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(title, work_dir, repeat):
+    """repeat번 실행해 가장 빠른 시간 출력"""
+    results = [run_child(work_dir) for _ in range(repeat)]
+    index = min(r['index'] for r in results)
+    ready = min(r['ready'] for r in results)
+    last = results[-1]
+    print(f"\n=== {title} (최솟값, {repeat}회) ===")
+    print(f"  '/' 응답 가능: {index * 1000:8.1f} ms (HTTP {last['index_status']})")
+    print(f"  모델 준비 완료: {ready * 1000:8.1f} ms (상태: {last['status']}, TensorFlow import: {last['tensorflow']})")
+    return ready
+
+
+def prepare_models(work_dir):
+    """work_dir/models에 모델 결과물 준비 (models/가 없으면 mnist_cnn.h5를 변환)"""
+    target = os.path.join(work_dir, MODEL_DIR)
+    if os.path.exists(MANIFEST_PATH):
+        shutil.copytree(MODEL_DIR, target)
+        return True
+    if not os.path.exists(MODEL_PATH):
+        return False
+    from model_loader import load_keras_model
+    from train_model import save_artifact
+    save_artifact(load_keras_model(MODEL_PATH), {'source': MODEL_PATH}, target)
+    return True
+
+
+def without_weights(work_dir):
+    """NumPy 가중치 파일을 빼고 Keras 모델만 남긴 매니페스트를 가진 복사본 생성"""
+    keras_dir = os.path.join(work_dir, 'keras_only')
+    shutil.copytree(os.path.join(work_dir, MODEL_DIR), os.path.join(keras_dir, MODEL_DIR))
+    manifest_path = os.path.join(keras_dir, MANIFEST_PATH)
+    with open(manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('weights'):
+        manifest['files'].pop(manifest['weights'])
+        manifest['weights'] = None
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    return keras_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description='서버 시작 시간 벤치마크')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    args = parser.parse_args()
+
+    os.chdir(APP_DIR)
+    work_dir = tempfile.mkdtemp()
+    try:
+        if not prepare_models(work_dir):
+            print('모델이 없습니다. 먼저 python train_model.py를 실행하세요.')
+            return
+        # 1. Keras 모델만 있음: TensorFlow import 후 로드
+        cold = measure('Keras 모델 + TensorFlow', without_weights(work_dir), args.repeat)
+        # 2. NumPy 가중치 파일 있음: TensorFlow 없이 .npz만 로드
+        warm = measure('NumPy 가중치 파일', work_dir, args.repeat)
+        print(f"\n  -> 모델 준비 시간 {cold / warm:.1f}배 단축")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
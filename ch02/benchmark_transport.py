@@ -0,0 +1,99 @@
+"""
+이미지 전송 방식 벤치마크
+/predict에 보내는 세 가지 형식의 요청 크기와 서버 전처리 시간을 비교합니다.
+  - JSON data URL: 280x280 PNG를 base64로 인코딩 (기존 방식)
+  - multipart: 280x280 PNG 파일
+  - 원시 바이트: 브라우저에서 글씨 영역을 28x28로 줄인 그레이스케일 784바이트
+
+사용 예:
+    python benchmark_transport.py
+    python benchmark_transport.py --count 200
+"""
+
+import argparse
+import base64
+import io
+import json
+import time
+import numpy as np
+from PIL import Image, ImageOps
+
+from app import app, loader, preprocess_image, preprocess_image_bytes, preprocess_raw
+from benchmark_batch import make_data_url
+
+
+def to_raw(data_url):
+    """브라우저의 canvasToGrayBytes와 같은 28x28 그레이스케일 바이트 생성 (글씨 둘레 정사각형만 사용)"""
+    png = base64.b64decode(data_url.split(',', 1)[1])
+    img = Image.open(io.BytesIO(png)).convert('L')
+    ys, xs = np.nonzero(np.asarray(img) < 230)
+    if len(ys) == 0:
+        box = (0, 0, img.width, img.height)
+    else:
+        side = max(ys.max() - ys.min(), xs.max() - xs.min()) * 1.2 + 4
+        left = (xs.min() + xs.max() - side) / 2
+        top = (ys.min() + ys.max() - side) / 2
+        box = (left, top, left + side, top + side)
+    # 캔버스 밖 영역은 흰색 (브라우저에서 흰색으로 채운 뒤 그리는 것과 같음)
+    pad = img.width
+    img = ImageOps.expand(img, border=pad, fill=255)
+    return img.resize((28, 28), Image.BOX, box=tuple(v + pad for v in box)).tobytes()
+
+
+def measure(func, items):
+    """items 각각에 func를 호출한 평균 시간 (초)"""
+    func(items[0])  # 워밍업
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='이미지 전송 방식 벤치마크')
+    parser.add_argument('--count', type=int, default=100, help='이미지 개수')
+    args = parser.parse_args()
+
+    data_urls = [make_data_url(i) for i in range(args.count)]
+    pngs = [base64.b64decode(url.split(',', 1)[1]) for url in data_urls]
+    raws = [to_raw(url) for url in data_urls]
+
+    # 1. 요청 본문 크기
+    json_size = np.mean([len(json.dumps({'image': url})) for url in data_urls])
+    png_size = np.mean([len(png) for png in pngs])
+    raw_size = np.mean([len(raw) for raw in raws])
+    print(f"=== 요청 본문 크기 (평균, {args.count}장) ===")
+    print(f"  JSON data URL: {json_size:8.0f} 바이트")
+    print(f"  multipart PNG: {png_size:8.0f} 바이트 (+ multipart 헤더)")
+    print(f"  원시 바이트:   {raw_size:8.0f} 바이트 -> data URL 대비 {json_size / raw_size:.1f}배 작음")
+
+    # 2. 서버 전처리 시간
+    url_sec = measure(preprocess_image, data_urls)
+    png_sec = measure(preprocess_image_bytes, pngs)
+    raw_sec = measure(preprocess_raw, raws)
+    print("\n=== 서버 전처리 시간 (한 장 평균) ===")
+    print(f"  JSON data URL: {url_sec * 1e6:8.1f} µs")
+    print(f"  multipart PNG: {png_sec * 1e6:8.1f} µs")
+    print(f"  원시 바이트:   {raw_sec * 1e6:8.1f} µs -> data URL 대비 {url_sec / raw_sec:.0f}배 빠름")
+
+    # 3. /predict 전체 처리 시간과 결과 일치 여부
+    loader.wait()
+    client = app.test_client()
+    url_results = [client.post('/predict', json={'image': url}).get_json() for url in data_urls]
+    raw_results = [client.post('/predict', data=raw, content_type='application/octet-stream').get_json()
+                   for raw in raws]
+    same = np.mean([a['result'] == b['result'] for a, b in zip(url_results, raw_results)])
+    url_sec = measure(lambda url: client.post('/predict', json={'image': url}), data_urls)
+    png_sec = measure(lambda png: client.post('/predict', data={'image': (io.BytesIO(png), 'digit.png')},
+                                              content_type='multipart/form-data'), pngs)
+    raw_sec = measure(lambda raw: client.post('/predict', data=raw, content_type='application/octet-stream'),
+                      raws)
+    print("\n=== /predict 요청 처리 시간 (한 장 평균) ===")
+    print(f"  JSON data URL: {url_sec * 1000:8.2f} ms")
+    print(f"  multipart PNG: {png_sec * 1000:8.2f} ms")
+    print(f"  원시 바이트:   {raw_sec * 1000:8.2f} ms")
+    print(f"  data URL과 원시 바이트의 예측 숫자 일치율: {same * 100:.1f}%")
+
+
+if __name__ == '__main__':
+    main()
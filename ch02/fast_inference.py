@@ -0,0 +1,102 @@
+"""
+경량 추론 모듈
+model.predict는 호출할 때마다 tf.data 파이프라인과 콜백을 준비하므로 28x28 입력 하나에도
+수 ms 이상의 오버헤드가 생깁니다. 학습된 Keras 모델의 가중치를 NumPy 배열로 꺼내
+같은 계산(Flatten → Dense → Dropout(추론 시 무시) → Dense)을 직접 수행합니다.
+"""
+
+import numpy as np
+
+
+def relu(x):
+    return np.maximum(x, 0)
+
+
+def softmax(x):
+    # 오버플로 방지를 위해 행별 최댓값을 빼고 계산
+    e = np.exp(x - x.max(axis=1, keepdims=True))
+    return e / e.sum(axis=1, keepdims=True)
+
+
+def linear(x):
+    return x
+
+
+ACTIVATIONS = {'relu': relu, 'softmax': softmax, 'linear': linear}
+
+
+class NumpyMLP:
+    """Dense 층만으로 이루어진 모델의 NumPy forward pass
+
+    layers: [(가중치, 편향, 활성화 함수 이름), ...]
+    """
+
+    def __init__(self, layers):
+        self.layers = [(np.asarray(w, dtype=np.float32), np.asarray(b, dtype=np.float32), activation)
+                       for w, b, activation in layers]
+
+    @classmethod
+    def from_keras(cls, model):
+        """Keras Sequential 모델에서 가중치 추출 (지원하지 않는 층이 있으면 ValueError)"""
+        layers = []
+        for layer in model.layers:
+            kind = type(layer).__name__
+            if kind in ('InputLayer', 'Flatten', 'Dropout'):
+                # Flatten은 predict에서 reshape로 처리, Dropout은 추론 시 아무 일도 하지 않음
+                continue
+            if kind != 'Dense':
+                raise ValueError(f'지원하지 않는 층입니다: {kind}')
+            activation = layer.get_config()['activation']
+            if activation not in ACTIVATIONS:
+                raise ValueError(f'지원하지 않는 활성화 함수입니다: {activation}')
+            weights, bias = layer.get_weights()
+            layers.append((weights, bias, activation))
+        if not layers:
+            raise ValueError('Dense 층이 없습니다.')
+        return cls(layers)
+
+    def save(self, path):
+        """가중치를 .npz 파일 하나로 저장 (TensorFlow 없이 다시 불러올 수 있음)"""
+        arrays = {}
+        for i, (weights, bias, activation) in enumerate(self.layers):
+            arrays[f'w{i}'] = weights
+            arrays[f'b{i}'] = bias
+            arrays[f'a{i}'] = np.array(activation)
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """save로 저장한 .npz 파일에서 모델 생성"""
+        with np.load(path) as data:
+            count = sum(1 for name in data.files if name.startswith('w'))
+            return cls([(data[f'w{i}'], data[f'b{i}'], str(data[f'a{i}'])) for i in range(count)])
+
+    def predict(self, x):
+        """(N, 28, 28) 입력에 대한 (N, 10) 확률 배열 반환"""
+        x = np.asarray(x, dtype=np.float32).reshape(len(x), -1)
+        for weights, bias, activation in self.layers:
+            x = ACTIVATIONS[activation](x @ weights + bias)
+        return x
+
+    __call__ = predict
+
+
+def build_predictor(model):
+    """model.predict 대신 사용할 저지연 예측 함수 생성
+
+    Dense 층으로만 된 모델은 NumPy forward pass를 사용하고,
+    그 외 구조는 tf.function으로 한 번 컴파일한 model 호출을 사용합니다.
+    반환된 함수는 (N, 28, 28) 배열을 받아 (N, 10) NumPy 배열을 돌려줍니다.
+    """
+    try:
+        return NumpyMLP.from_keras(model)
+    except ValueError as e:
+        print('NumPy 추론을 사용할 수 없어 tf.function으로 대체합니다:', e)
+    return build_tf_predictor(model)
+
+
+def build_tf_predictor(model):
+    """tf.function으로 한 번 컴파일한 model 호출 예측 함수 ((N, 28, 28) -> (N, 10) NumPy 배열)"""
+    import tensorflow as tf
+    compiled = tf.function(lambda x: model(x, training=False), reduce_retracing=True)
+    return lambda x: compiled(tf.convert_to_tensor(x, dtype=tf.float32)).numpy()
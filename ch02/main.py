@@ -1,64 +1,36 @@
+import collections
+import time
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image, ImageDraw, ImageOps
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageDraw
 import numpy as np
-import tensorflow as tf
-import os
 
-# keras를 명확히 import
-from tensorflow.keras.models import load_model, Sequential
-from tensorflow.keras.layers import Flatten, Dense, Dropout
-from tensorflow.keras.datasets import mnist
+from model_loader import ERROR, READY, ModelLoader
+from preprocessing import preprocess_batch, to_ink
 
-# 모델 파일 경로
-MODEL_PATH = 'mnist_cnn.h5'
+# 모델 로딩 완료 여부를 확인하는 주기 (ms)
+LOADER_POLL_MS = 100
+
+# 실시간 예측 설정: 그림이 바뀐 뒤 변경을 모아 두는 시간, 결과 확인 주기 (ms)
+LIVE_DEBOUNCE_MS = 40
+LIVE_POLL_MS = 10
 
 # 28x28 크기의 캔버스 설정
 CANVAS_SIZE = 280  # 실제 그리는 캔버스 크기 (10배)
 IMG_SIZE = 28      # 모델 입력 크기
 
-# 모델이 없으면 자동으로 학습해서 저장하는 함수
-def get_or_train_model():
-    # 모델 파일이 있으면 로드
-    if os.path.exists(MODEL_PATH):
-        try:
-            model = load_model(MODEL_PATH)
-            return model
-        except Exception as e:
-            print('모델 로드 실패:', e)
-            os.remove(MODEL_PATH)
-    # 모델이 없으면 새로 학습
-    (x_train, y_train), (x_test, y_test) = mnist.load_data()
-    x_train, x_test = x_train / 255.0, x_test / 255.0
-    model = Sequential([
-        Flatten(input_shape=(28, 28)),
-        Dense(128, activation='relu'),
-        Dropout(0.2),
-        Dense(10, activation='softmax')
-    ])
-    model.compile(optimizer='adam',
-                  loss='sparse_categorical_crossentropy',
-                  metrics=['accuracy'])
-    model.fit(x_train, y_train, epochs=3, validation_data=(x_test, y_test), verbose=2)
-    model.save(MODEL_PATH)
-    return model
-
-# tkinter 캔버스에서 그린 그림을 28x28 이미지로 변환하는 함수
-def get_image_from_canvas(canvas, canvas_widget):
-    # 캔버스 내용을 이미지로 저장
-    canvas_widget.postscript(file='temp.ps', colormode='mono')
-    img = Image.open('temp.ps')
-    img = img.resize((IMG_SIZE, IMG_SIZE))
-    img = ImageOps.invert(img.convert('L'))  # 흑백 반전
-    img = np.array(img) / 255.0
-    os.remove('temp.ps')
-    return img
-
-# 예측 함수
-def predict_digit(model, img):
+# 캔버스와 똑같이 그려 둔 메모리 이미지(pil_img)를 28x28 배열로 변환하는 함수
+# (캔버스를 PostScript 파일로 저장하고 Ghostscript로 다시 읽는 과정이 필요 없음)
+# 흑백 반전 후 MNIST 방식(20x20 상자, 무게 중심 정렬)으로 맞춤
+def get_image_from_canvas(pil_img):
+    return preprocess_batch([to_ink(pil_img)])[0]
+
+# 예측 함수 (predictor: build_predictor로 만든 저지연 예측 함수)
+def predict_digit(predictor, img):
     try:
         img = img.reshape(1, 28, 28)
-        pred = model.predict(img)
+        pred = predictor(img)
         return np.argmax(pred), float(np.max(pred))
     except Exception as e:
         print('예측 오류:', e)
@@ -76,6 +48,8 @@ def paint(event, canvas, draw, last_pos):
     if last_pos[0] is not None and last_pos[1] is not None:
         canvas.create_line(last_pos[0], last_pos[1], x, y, width=r*2, fill='black', capstyle=tk.ROUND, smooth=True)
         draw.line([last_pos[0], last_pos[1], x, y], fill='black', width=r*2)
+        # ImageDraw 선에는 둥근 끝이 없으므로 끝점에 원을 그려 캔버스와 같은 모양으로 맞춤
+        draw.ellipse([x-r, y-r, x+r, y+r], fill='black')
     else:
         canvas.create_oval(x-r, y-r, x+r, y+r, fill='black', outline='black')
         draw.ellipse([x-r, y-r, x+r, y+r], fill='black')
@@ -85,18 +59,105 @@ def reset_last_pos(event, last_pos):
     last_pos[0], last_pos[1] = None, None
 
 # 예측 버튼 클릭 시 동작 함수
-def on_predict(model, canvas, canvas_widget, result_label, draw):
-    img = get_image_from_canvas(canvas_widget, canvas_widget)
-    pred, conf = predict_digit(model, img)
+def on_predict(predictor, pil_img, result_label):
+    img = get_image_from_canvas(pil_img)
+    pred, conf = predict_digit(predictor, img)
     if pred is not None:
         result_label.config(text=f'예측 결과: {pred} (신뢰도: {conf:.2f})')
     else:
         result_label.config(text='예측 실패')
 
+# 그리는 동안 예측 결과를 계속 갱신하는 객체
+# 예측은 워커 스레드 하나에서 수행하고 한 번에 하나만 진행하므로 그리기(UI 스레드)가 밀리지 않음.
+# 예측 중에 새로 그린 내용은 모아 두었다가 끝나면 최신 그림으로 한 번만 다시 예측함.
+class LivePredictor:
+    def __init__(self, root, loader, pil_img, result_label, rate_label):
+        self.root = root
+        self.loader = loader
+        self.pil_img = pil_img
+        self.result_label = result_label
+        self.rate_label = rate_label
+        self.enabled = tk.BooleanVar(value=False)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.debounce_job = None
+        self.poll_job = None
+        self.future = None
+        self.dirty = False
+        # 요청 번호: 초기화 이전에 보낸 요청의 결과는 버림
+        self.sequence = 0
+        self.drop_before = 0
+        self.update_times = collections.deque()
+
+    def schedule(self):
+        """그림이 바뀔 때 호출 (LIVE_DEBOUNCE_MS 동안의 변경을 모아 한 번만 예측)"""
+        if not self.enabled.get() or self.loader.status != READY or self.debounce_job is not None:
+            return
+        self.debounce_job = self.root.after(LIVE_DEBOUNCE_MS, self.start)
+
+    def start(self):
+        """현재 그림으로 예측 시작 (이미 진행 중이면 끝난 뒤 다시 예측하도록 표시만 함)"""
+        self.debounce_job = None
+        if self.future is not None:
+            self.dirty = True
+            return
+        self.dirty = False
+        self.sequence += 1
+        snapshot = self.pil_img.copy()
+        self.future = self.executor.submit(self.predict, self.sequence, snapshot)
+        if self.poll_job is None:
+            self.poll_job = self.root.after(LIVE_POLL_MS, self.poll)
+
+    def predict(self, sequence, snapshot):
+        """워커 스레드에서 실행"""
+        return sequence, predict_digit(self.loader.predictor, get_image_from_canvas(snapshot))
+
+    def poll(self):
+        """예측이 끝났으면 결과 표시 후, 그동안 바뀐 그림이 있으면 다시 예측"""
+        self.poll_job = None
+        if not self.future.done():
+            self.poll_job = self.root.after(LIVE_POLL_MS, self.poll)
+            return
+        sequence, (pred, conf) = self.future.result()
+        self.future = None
+        if sequence >= self.drop_before and pred is not None:
+            self.result_label.config(text=f'예측 결과: {pred} (신뢰도: {conf:.2f})')
+            self.record_update()
+        if self.dirty and self.enabled.get():
+            self.start()
+
+    def record_update(self):
+        """최근 1초 동안 표시한 결과 수로 갱신 속도 표시"""
+        now = time.perf_counter()
+        self.update_times.append(now)
+        while now - self.update_times[0] > 1.0:
+            self.update_times.popleft()
+        self.rate_label.config(text=f'갱신: {len(self.update_times)}회/초')
+
+    def reset(self):
+        """캔버스 초기화 시 호출 (대기 중인 예측 취소, 진행 중인 예측 결과는 버림)"""
+        if self.debounce_job is not None:
+            self.root.after_cancel(self.debounce_job)
+            self.debounce_job = None
+        self.dirty = False
+        self.drop_before = self.sequence + 1
+        self.update_times.clear()
+        self.rate_label.config(text='')
+
+# 모델 로딩이 끝나면 예측 버튼을 활성화하는 함수
+def poll_loader(root, loader, predict_btn, result_label):
+    if loader.status == READY:
+        predict_btn.config(state=tk.NORMAL)
+        result_label.config(text='숫자를 그리고 예측 버튼을 누르세요')
+    elif loader.status == ERROR:
+        result_label.config(text='모델 로드 실패')
+        messagebox.showerror('오류', f'모델을 불러오지 못했습니다: {loader.error}')
+    else:
+        root.after(LOADER_POLL_MS, poll_loader, root, loader, predict_btn, result_label)
+
 # 메인 함수
 def main():
-    # 모델 준비
-    model = get_or_train_model()
+    # 모델은 백그라운드에서 준비하고 창은 바로 띄움 (예측은 model.predict 대신 저지연 경로 사용)
+    loader = ModelLoader().start()
 
     # tkinter 윈도우 생성
     root = tk.Tk()
@@ -109,26 +170,43 @@ def main():
     draw = ImageDraw.Draw(pil_img)
     last_pos = [None, None]
 
-    # 마우스 이벤트 바인딩
-    canvas.bind('<B1-Motion>', lambda e: paint(e, canvas, draw, last_pos))
-    canvas.bind('<ButtonRelease-1>', lambda e: reset_last_pos(e, last_pos))
-
-    # 결과 표시 라벨
-    result_label = tk.Label(root, text='숫자를 그리고 예측 버튼을 누르세요')
+    # 결과 표시 라벨과 실시간 예측 갱신 속도 라벨
+    result_label = tk.Label(root, text='모델을 불러오는 중...')
     result_label.pack()
+    rate_label = tk.Label(root, text='', fg='gray')
+    rate_label.pack()
+    live = LivePredictor(root, loader, pil_img, result_label, rate_label)
+
+    # 마우스 이벤트 바인딩 (실시간 예측이 켜져 있으면 그릴 때마다 예측 예약)
+    def on_paint(event):
+        paint(event, canvas, draw, last_pos)
+        live.schedule()
+
+    def on_clear():
+        clear_canvas(canvas, draw)
+        live.reset()
+
+    canvas.bind('<B1-Motion>', on_paint)
+    canvas.bind('<ButtonRelease-1>', lambda e: reset_last_pos(e, last_pos))
 
     # 버튼 프레임
     btn_frame = tk.Frame(root)
     btn_frame.pack()
 
     # 예측 버튼
-    predict_btn = tk.Button(btn_frame, text='예측', command=lambda: on_predict(model, pil_img, canvas, result_label, draw))
+    predict_btn = tk.Button(btn_frame, text='예측', state=tk.DISABLED,
+                            command=lambda: on_predict(loader.predictor, pil_img, result_label))
     predict_btn.pack(side='left')
 
     # 초기화 버튼
-    clear_btn = tk.Button(btn_frame, text='초기화', command=lambda: clear_canvas(canvas, draw))
+    clear_btn = tk.Button(btn_frame, text='초기화', command=on_clear)
     clear_btn.pack(side='left')
 
+    # 실시간 예측 켜기/끄기
+    live_check = tk.Checkbutton(btn_frame, text='실시간 예측', variable=live.enabled, command=live.schedule)
+    live_check.pack(side='left')
+
+    poll_loader(root, loader, predict_btn, result_label)
     root.mainloop()
 
 if __name__ == '__main__':
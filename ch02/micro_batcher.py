@@ -0,0 +1,85 @@
+"""
+마이크로 배칭 모듈
+동시에 들어온 예측 요청을 모아 한 번의 배치 추론으로 처리하고,
+각 요청에는 자기 몫의 결과만 돌려줍니다.
+기다리는 요청이 없으면 바로 예측하고, 워커가 예측하는 동안 쌓인 요청만 다음 배치로 묶으므로
+요청이 적을 때는 지연이 늘지 않고 요청이 몰릴 때만 배치가 커집니다.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+import numpy as np
+
+
+class MicroBatcher:
+    """예측 요청을 모아서 처리하는 큐
+
+    predict_fn: (N, 28, 28) 배열을 받아 (N, 10) 확률 배열을 반환하는 함수
+    max_batch_size: 한 번에 묶을 최대 요청 수
+    max_wait_ms: 이미 다른 요청이 쌓여 있을 때(부하가 있을 때) 요청을 더 기다리는 최대 시간 (ms)
+                 0이면 기다리지 않고 쌓인 요청만 묶음 (예측이 빠른 NumPy 모델에 적합)
+    """
+
+    def __init__(self, predict_fn, max_batch_size=32, max_wait_ms=0):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.requests = queue.Queue()
+        # 처리한 배치 수와 요청 수 (평균 배치 크기 확인용)
+        self.batches = 0
+        self.items = 0
+
+        # 모델 호출은 이 워커 스레드 하나에서만 수행
+        self.worker = threading.Thread(target=self.run, daemon=True)
+        self.worker.start()
+
+    def submit(self, img):
+        """이미지 하나를 큐에 넣고 결과(확률 배열)를 받을 Future 반환"""
+        future = Future()
+        self.requests.put((img, future))
+        return future
+
+    def collect_batch(self):
+        """첫 요청을 기다린 뒤 이미 쌓여 있는 요청을 최대 max_batch_size개까지 모음
+
+        첫 요청 뒤에 쌓인 요청이 없으면 기다리지 않고 바로 처리합니다 (혼자 온 요청은 지연 없음).
+        쌓인 요청이 있으면 부하가 있다는 뜻이므로 max_wait 동안 요청을 더 모읍니다.
+        """
+        batch = [self.requests.get()]
+        # 워커가 이전 배치를 예측하는 동안 쌓인 요청
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self.requests.get_nowait())
+            except queue.Empty:
+                break
+        if len(batch) == 1 or self.max_wait <= 0:
+            return batch
+
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def run(self):
+        """워커 스레드 본체"""
+        while True:
+            batch = self.collect_batch()
+            self.batches += 1
+            self.items += len(batch)
+            try:
+                preds = self.predict_fn(np.stack([img for img, _ in batch]))
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), pred in zip(batch, preds):
+                future.set_result(pred)
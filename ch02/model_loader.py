@@ -0,0 +1,164 @@
+"""
+모델 로딩 모듈
+TensorFlow는 import만 해도 수 초가 걸리므로 실제로 Keras 모델이 필요할 때만 가져옵니다.
+모델은 train_model.py가 models/ 폴더에 만든 버전별 결과물을 사용하며, manifest.json에 기록된
+SHA-256 체크섬이 맞지 않으면 불러오지 않습니다. 서버는 학습을 하지 않습니다.
+ModelLoader는 모델 준비를 백그라운드 스레드에서 수행합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from fast_inference import NumpyMLP, build_predictor
+
+# train_model.py가 만든 모델 결과물과 매니페스트 경로
+MODEL_DIR = 'models'
+MANIFEST_PATH = os.path.join(MODEL_DIR, 'manifest.json')
+
+# 매니페스트가 없을 때 사용하는 이전 방식의 모델 파일과, 그로부터 자동 생성하는 가중치 파일
+MODEL_PATH = 'mnist_cnn.h5'
+WEIGHTS_PATH = 'mnist_mlp.npz'
+
+# 로딩 상태
+LOADING = 'loading'
+READY = 'ready'
+ERROR = 'error'
+
+
+class ModelIntegrityError(Exception):
+    """모델 파일이 매니페스트의 체크섬과 다를 때 발생"""
+
+
+def file_sha256(path):
+    """파일의 SHA-256 (16진수 문자열)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_manifest(path=MANIFEST_PATH):
+    """매니페스트를 읽고 기록된 파일의 체크섬 확인 (없으면 None, 맞지 않으면 ModelIntegrityError)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    model_dir = os.path.dirname(path)
+    for name, checksum in manifest['files'].items():
+        file_path = os.path.join(model_dir, name)
+        if not os.path.exists(file_path):
+            raise ModelIntegrityError(f'모델 파일이 없습니다: {file_path}')
+        if file_sha256(file_path) != checksum:
+            raise ModelIntegrityError(f'모델 파일의 체크섬이 매니페스트와 다릅니다: {file_path}')
+    manifest['model_dir'] = model_dir
+    return manifest
+
+
+def find_model(path=MANIFEST_PATH):
+    """사용할 모델 확인 (반환: 검증된 매니페스트, 이전 방식 mnist_cnn.h5를 쓸 때는 None)
+
+    체크섬이 맞지 않으면 ModelIntegrityError, 모델이 전혀 없으면 FileNotFoundError
+    """
+    manifest = read_manifest(path)
+    if manifest is not None:
+        return manifest
+    if not os.path.exists(MODEL_PATH):
+        raise FileNotFoundError('학습된 모델이 없습니다. 먼저 python train_model.py를 실행하세요.')
+    print(f'경고: {path}가 없어 체크섬 확인 없이 이전 방식의 {MODEL_PATH}를 사용합니다. '
+          'python train_model.py --from-h5 mnist_cnn.h5로 변환할 수 있습니다.')
+    return None
+
+
+# Keras 모델 로드 함수 (TensorFlow는 이 함수 안에서만 import)
+def load_keras_model(path):
+    from tensorflow.keras.models import load_model
+    return load_model(path)
+
+
+def weights_are_fresh():
+    """가중치 파일이 있고 mnist_cnn.h5보다 오래되지 않았는지 확인"""
+    if not os.path.exists(WEIGHTS_PATH):
+        return False
+    return os.path.getmtime(WEIGHTS_PATH) >= os.path.getmtime(MODEL_PATH)
+
+
+def load_legacy_predictor():
+    """매니페스트 없이 mnist_cnn.h5로 예측 함수 준비 (가중치 파일을 캐시로 사용)"""
+    if weights_are_fresh():
+        try:
+            return NumpyMLP.load(WEIGHTS_PATH)
+        except Exception as e:
+            print('가중치 파일 로드 실패:', e)
+
+    predictor = build_predictor(load_keras_model(MODEL_PATH))
+    if isinstance(predictor, NumpyMLP):
+        try:
+            predictor.save(WEIGHTS_PATH)
+        except OSError as e:
+            print('가중치 파일 저장 실패:', e)
+    return predictor
+
+
+# 예측 함수 준비 (가능하면 TensorFlow를 import하지 않음)
+def load_predictor(path=MANIFEST_PATH):
+    return predictor_for(find_model(path))
+
+
+def predictor_for(manifest):
+    """find_model로 확인한 모델의 예측 함수 (manifest가 None이면 이전 방식의 mnist_cnn.h5)"""
+    if manifest is None:
+        return load_legacy_predictor()
+    if manifest.get('weights'):
+        return NumpyMLP.load(os.path.join(manifest['model_dir'], manifest['weights']))
+    return build_predictor(load_keras_model(os.path.join(manifest['model_dir'], manifest['model'])))
+
+
+class ModelLoader:
+    """백그라운드 스레드에서 예측 함수를 준비하고 상태를 알려주는 객체"""
+
+    def __init__(self, load_fn=load_predictor):
+        self.load_fn = load_fn
+        self.status = LOADING
+        self.error = None
+        self.load_seconds = None
+        self.predictor = None
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def run(self):
+        """워커 스레드 본체"""
+        start = time.perf_counter()
+        try:
+            predictor = self.load_fn()
+            status = READY
+        except Exception as e:
+            print('모델 준비 실패:', e)
+            predictor = None
+            self.error = str(e)
+            status = ERROR
+        # 다른 스레드(/health 등)가 상태를 보고 나머지 값을 읽으므로 상태는 마지막에 바꿈
+        self.predictor = predictor
+        self.load_seconds = time.perf_counter() - start
+        self.status = status
+        self.ready.set()
+
+    def wait(self, timeout=None):
+        """로딩이 끝날 때까지 기다린 뒤 예측 함수 반환 (실패하면 RuntimeError)"""
+        self.ready.wait(timeout)
+        if self.status != READY:
+            raise RuntimeError(self.error or '모델이 아직 준비되지 않았습니다.')
+        return self.predictor
+
+    def predict(self, batch):
+        """MicroBatcher 등에 넘길 예측 함수 (준비되지 않았으면 RuntimeError)"""
+        if self.status != READY:
+            raise RuntimeError(self.error or '모델이 아직 준비되지 않았습니다.')
+        return self.predictor(batch)
@@ -0,0 +1,104 @@
+"""
+MNIST 방식 전처리 모듈
+MNIST 숫자는 글씨를 둘러싼 사각형을 가로세로 비율을 유지한 채 20x20 안에 맞추고,
+무게 중심이 28x28 가운데에 오도록 옮겨 만들었습니다. 캔버스 그림도 같은 방식으로 맞춰야
+정확도가 올라갑니다. 이미지마다 PIL로 자르고 줄이는 대신, 크기가 같은 이미지를 한 배열로 묶어
+NumPy로 한 번에 처리합니다.
+"""
+
+import numpy as np
+
+IMG_SIZE = 28
+# 글씨를 맞춰 넣을 상자 크기
+DIGIT_BOX = 20
+# 28x28 배열의 가운데 좌표 (픽셀 중심 기준)
+CENTER = (IMG_SIZE - 1) / 2
+# 이 값보다 진한 픽셀을 글씨로 보고 테두리 사각형을 계산
+INK_THRESHOLD = 0.1
+# 출력 픽셀 하나당 가로/세로 샘플 수 (크게 줄일 때 계단 현상 방지)
+SUPERSAMPLE = 4
+# center_digits 한 번에 넘길 최대 픽셀 수 (280x280 기준 8장, 큰 배열이 CPU 캐시를 벗어나지 않도록)
+CHUNK_PIXELS = 8 * 280 * 280
+
+
+def to_ink(gray):
+    """흰 배경에 검은 글씨인 0~255 그레이스케일 배열 -> 글씨가 1에 가까운 0~1 배열"""
+    return (255 - np.asarray(gray, dtype=np.float32)) / 255.0
+
+
+def center_digits(batch):
+    """(N, H, W) 글씨 배열(0~1, 글씨가 1)을 MNIST 방식으로 맞춘 (N, 28, 28) float32 배열로 변환
+
+    1. INK_THRESHOLD보다 진한 픽셀의 테두리 사각형을 구하고, 긴 변이 DIGIT_BOX가 되는 배율을 계산
+    2. 무게 중심이 CENTER에 오도록 출력 좌표 -> 원본 좌표 변환을 만들고
+    3. 출력 픽셀마다 SUPERSAMPLE x SUPERSAMPLE 위치를 쌍선형 보간으로 읽어 평균
+    글씨가 없는 이미지는 0으로 채운 배열이 됩니다.
+    """
+    batch = np.asarray(batch, dtype=np.float32)
+    count, height, width = batch.shape
+
+    # 1. 테두리 사각형과 배율 (줄/열마다 가장 진한 값으로 판단)
+    rows = batch.max(axis=2) > INK_THRESHOLD
+    cols = batch.max(axis=1) > INK_THRESHOLD
+    has_ink = rows.any(axis=1)
+    top = rows.argmax(axis=1)
+    bottom = height - rows[:, ::-1].argmax(axis=1)
+    left = cols.argmax(axis=1)
+    right = width - cols[:, ::-1].argmax(axis=1)
+    scale = DIGIT_BOX / np.maximum(np.maximum(bottom - top, right - left), 1)
+
+    # 2. 무게 중심 (원본 좌표)
+    row_sums = batch.sum(axis=2)
+    col_sums = batch.sum(axis=1)
+    total = np.maximum(row_sums.sum(axis=1), 1e-6)
+    center_y = row_sums @ np.arange(height, dtype=np.float32) / total
+    center_x = col_sums @ np.arange(width, dtype=np.float32) / total
+
+    # 3. 출력 픽셀 안의 샘플 위치 -> 원본 좌표
+    # 변환이 축마다 따로(배율 + 이동) 이루어지므로 세로/가로 보간 가중치 행렬을 만들어
+    # out = Wy @ 이미지 @ Wx^T 두 번의 행렬 곱으로 계산
+    offsets = (np.arange(IMG_SIZE * SUPERSAMPLE) + 0.5) / SUPERSAMPLE - 0.5 - CENTER
+    weights_y = interpolation_weights(center_y[:, None] + offsets / scale[:, None], height)
+    weights_x = interpolation_weights(center_x[:, None] + offsets / scale[:, None], width)
+    out = weights_y @ batch @ weights_x.transpose(0, 2, 1)
+    out[~has_ink] = 0
+    return np.clip(out, 0, 1)
+
+
+def interpolation_weights(source, size):
+    """샘플 위치 (N, 28 * SUPERSAMPLE) -> 선형 보간 후 샘플 평균을 내는 가중치 행렬 (N, 28, size)
+
+    원본 범위를 벗어난 위치는 0(배경)으로 취급합니다.
+    """
+    count, samples = source.shape
+    # 양쪽에 배경 한 칸씩을 둔 좌표계(0과 size + 1이 배경)에서 계산한 뒤 바깥 칸은 잘라냄
+    source = np.clip(source + 1, 0, size + 1)
+    # lower + 1이 size + 1(오른쪽 배경)을 넘지 않도록 제한 (이때 frac = 1이라 가중치는 배경에만 감)
+    lower = np.minimum(np.floor(source), size).astype(np.intp)
+    frac = (source - lower).astype(np.float32)
+    # 샘플마다 평균을 낼 것이므로 가중치를 미리 SUPERSAMPLE로 나눠 둠
+    frac /= SUPERSAMPLE
+    weights = np.zeros((count, samples, size + 2), dtype=np.float32)
+    n = np.arange(count)[:, None]
+    k = np.arange(samples)
+    weights[n, k, lower] = 1 / SUPERSAMPLE - frac
+    weights[n, k, lower + 1] = frac
+    weights = weights.reshape(count, IMG_SIZE, SUPERSAMPLE, size + 2).sum(axis=2)
+    return weights[:, :, 1:-1]
+
+
+def preprocess_batch(images):
+    """크기가 제각각인 글씨 배열 목록을 (N, 28, 28) 배열로 변환 (입력 순서 유지)
+
+    같은 크기의 이미지끼리 묶어 CHUNK_PIXELS 단위로 center_digits를 호출합니다.
+    """
+    out = np.zeros((len(images), IMG_SIZE, IMG_SIZE), dtype=np.float32)
+    groups = {}
+    for i, img in enumerate(images):
+        groups.setdefault(np.shape(img), []).append(i)
+    for shape, indices in groups.items():
+        chunk = max(1, CHUNK_PIXELS // max(1, shape[0] * shape[1]))
+        for start in range(0, len(indices), chunk):
+            part = indices[start:start + chunk]
+            out[part] = center_digits(np.stack([images[i] for i in part]))
+    return out
@@ -4,10 +4,22 @@ const ctx = canvas.getContext('2d');
 let drawing = false;
 let lastX = 0, lastY = 0;
 
+// 실시간 예측 관련 변수
+const liveToggle = document.getElementById('liveToggle');
+const liveRate = document.getElementById('liveRate');
+const LIVE_DEBOUNCE_MS = 80;   // 그림이 바뀐 뒤 변경을 모아 두는 시간
+let liveTimer = null;          // 예약된 실시간 예측
+let liveInFlight = false;      // 서버로 보낸 요청이 있는지 (한 번에 하나만)
+let liveDirty = false;         // 요청 중에 그림이 바뀌었는지
+let liveSeq = 0;               // 요청 번호
+let liveDropBefore = 0;        // 이 번호보다 작은 요청의 응답은 버림 (초기화 이전 요청)
+let liveUpdates = [];          // 최근 1초 동안 결과를 표시한 시각
+
 // 캔버스 초기화 함수
 function clearCanvas() {
     ctx.fillStyle = 'white';
     ctx.fillRect(0, 0, canvas.width, canvas.height);
+    resetLive();
 }
 
 // 마우스 이벤트 처리
@@ -25,6 +37,7 @@ canvas.addEventListener('mousemove', e => {
     ctx.lineTo(e.offsetX, e.offsetY);
     ctx.stroke();
     [lastX, lastY] = [e.offsetX, e.offsetY];
+    scheduleLive();
 });
 canvas.addEventListener('mouseup', () => drawing = false);
 canvas.addEventListener('mouseleave', () => drawing = false);
@@ -62,43 +75,146 @@ function showResult(message, type = 'info') {
     resultDiv.innerHTML = `<span class="${textClass} text-lg font-medium">${message}</span>`;
 }
 
+// 서버로 보낼 크기로 줄이는 데 쓰는 화면에 보이지 않는 캔버스
+const SEND_SIZE = 28;
+const smallCanvas = document.createElement('canvas');
+smallCanvas.width = SEND_SIZE;
+smallCanvas.height = SEND_SIZE;
+const smallCtx = smallCanvas.getContext('2d', { willReadFrequently: true });
+
+// 글씨를 둘러싼 정사각형 영역 (글씨가 없으면 캔버스 전체)
+// 서버가 글씨를 잘라 20x20으로 맞추므로, 글씨 부분만 28x28로 보내야 작게 그린 글씨도 흐려지지 않음
+function inkSquare() {
+    const rgba = ctx.getImageData(0, 0, canvas.width, canvas.height).data;
+    let top = canvas.height, bottom = -1, left = canvas.width, right = -1;
+    for (let y = 0; y < canvas.height; y++) {
+        for (let x = 0; x < canvas.width; x++) {
+            if (rgba[(y * canvas.width + x) * 4] < 230) {
+                if (y < top) top = y;
+                if (y > bottom) bottom = y;
+                if (x < left) left = x;
+                if (x > right) right = x;
+            }
+        }
+    }
+    if (bottom < 0) return [0, 0, canvas.width];
+    // 긴 변 기준 정사각형에 여백을 조금 두어 가로세로 비율 유지
+    const side = Math.max(bottom - top, right - left) * 1.2 + 4;
+    return [(left + right - side) / 2, (top + bottom - side) / 2, side];
+}
+
+// 글씨 영역을 28x28로 줄여 픽셀당 1바이트 그레이스케일 배열로 변환 (흰 배경 255, 검은 글씨 0)
+function canvasToGrayBytes() {
+    const [sx, sy, side] = inkSquare();
+    smallCtx.fillStyle = 'white';
+    smallCtx.fillRect(0, 0, SEND_SIZE, SEND_SIZE);
+    smallCtx.imageSmoothingEnabled = true;
+    smallCtx.imageSmoothingQuality = 'high';
+    smallCtx.drawImage(canvas, sx, sy, side, side, 0, 0, SEND_SIZE, SEND_SIZE);
+    const rgba = smallCtx.getImageData(0, 0, SEND_SIZE, SEND_SIZE).data;
+    const gray = new Uint8Array(SEND_SIZE * SEND_SIZE);
+    for (let i = 0; i < gray.length; i++) {
+        gray[i] = rgba[i * 4];  // 흑백으로만 그리므로 R 채널만 사용
+    }
+    return gray;
+}
+
+// 캔버스 이미지를 서버로 보내 예측 결과(JSON) 받기
+// base64 PNG data URL 대신 28x28 원시 바이트(784바이트)를 전송
+async function requestPrediction() {
+    const res = await fetch('/predict', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/octet-stream' },
+        body: canvasToGrayBytes()
+    });
+    return res.json();
+}
+
+// 예측 결과 표시
+function showPrediction(data) {
+    if (data.result !== undefined) {
+        const confidence = data.confidence;
+        let confidenceText = '';
+        if (confidence >= 0.9) {
+            confidenceText = '매우 높음';
+        } else if (confidence >= 0.7) {
+            confidenceText = '높음';
+        } else if (confidence >= 0.5) {
+            confidenceText = '보통';
+        } else {
+            confidenceText = '낮음';
+        }
+        
+        showResult(`🎯 예측 결과: <span class="text-2xl font-bold text-green-600">${data.result}</span><br><span class="text-sm">신뢰도: ${(confidence * 100).toFixed(1)}% (${confidenceText})</span>`, 'success');
+    } else {
+        showResult(`❌ ${data.error || '예측 실패'}`, 'error');
+    }
+}
+
 // 예측 버튼 클릭 시 서버로 이미지 전송
 async function predict() {
-    // 캔버스 이미지를 base64로 변환
-    const dataUrl = canvas.toDataURL('image/png');
     showResult('AI가 분석 중입니다...', 'loading');
     
     try {
-        const res = await fetch('/predict', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ image: dataUrl })
-        });
-        const data = await res.json();
-        
-        if (data.result !== undefined) {
-            const confidence = data.confidence;
-            let confidenceText = '';
-            if (confidence >= 0.9) {
-                confidenceText = '매우 높음';
-            } else if (confidence >= 0.7) {
-                confidenceText = '높음';
-            } else if (confidence >= 0.5) {
-                confidenceText = '보통';
-            } else {
-                confidenceText = '낮음';
-            }
-            
-            showResult(`🎯 예측 결과: <span class="text-2xl font-bold text-green-600">${data.result}</span><br><span class="text-sm">신뢰도: ${(confidence * 100).toFixed(1)}% (${confidenceText})</span>`, 'success');
-        } else {
-            showResult(`❌ ${data.error || '예측 실패'}`, 'error');
-        }
+        showPrediction(await requestPrediction());
     } catch (err) {
         showResult('❌ 서버 연결 오류', 'error');
     }
 }
 
+// 실시간 예측: 그림이 바뀌면 LIVE_DEBOUNCE_MS 동안의 변경을 모아 한 번만 예측
+function scheduleLive() {
+    if (!liveToggle.checked || liveTimer !== null) return;
+    liveTimer = setTimeout(livePredict, LIVE_DEBOUNCE_MS);
+}
+
+// 요청은 한 번에 하나만 보내고, 응답을 기다리는 동안 바뀐 그림은 응답 후 최신 상태로 한 번만 다시 보냄
+// (fetch는 비동기이므로 그리기는 응답을 기다리지 않음)
+async function livePredict() {
+    liveTimer = null;
+    if (liveInFlight) {
+        liveDirty = true;
+        return;
+    }
+    liveInFlight = true;
+    liveDirty = false;
+    const seq = ++liveSeq;
+    try {
+        const data = await requestPrediction();
+        if (seq >= liveDropBefore && data.result !== undefined) {
+            showPrediction(data);
+            recordLiveUpdate();
+        }
+    } catch (err) {
+        // 실시간 예측 중 오류는 무시 (다음 획에서 다시 시도)
+    } finally {
+        liveInFlight = false;
+    }
+    if (liveDirty && liveToggle.checked) {
+        livePredict();
+    }
+}
+
+// 최근 1초 동안 표시한 결과 수로 갱신 속도 표시
+function recordLiveUpdate() {
+    const now = performance.now();
+    liveUpdates.push(now);
+    liveUpdates = liveUpdates.filter(t => now - t <= 1000);
+    liveRate.textContent = `갱신: ${liveUpdates.length}회/초`;
+}
+
+// 캔버스 초기화 시 대기 중인 실시간 예측 취소 (진행 중인 요청의 응답은 버림)
+function resetLive() {
+    clearTimeout(liveTimer);
+    liveTimer = null;
+    liveDirty = false;
+    liveDropBefore = liveSeq + 1;
+    liveUpdates = [];
+    liveRate.textContent = '';
+}
+
 document.getElementById('predictBtn').onclick = predict;
+liveToggle.onchange = scheduleLive;
 
 // 페이지 로드 시 캔버스 초기화
 clearCanvas(); 
\ No newline at end of file
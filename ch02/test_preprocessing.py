@@ -0,0 +1,35 @@
+"""
+preprocessing 모듈 테스트
+실행: python -m pytest test_preprocessing.py
+"""
+
+import numpy as np
+
+from preprocessing import center_digits
+
+
+def test_mirror_symmetry():
+    """좌우(상하)로 뒤집은 이미지를 맞추면 결과도 정확히 뒤집힌 모양이어야 함"""
+    rng = np.random.default_rng(0)
+    batch = np.zeros((4, 280, 280), dtype=np.float32)
+    # 오른쪽/아래 가장자리에 닿는 획, 안쪽 획, 임의의 글씨
+    batch[0, 100:180, 250:280] = 1
+    batch[1, 250:280, 60:200] = 1
+    batch[2, 80:200, 120:140] = 1
+    batch[3] = (rng.random((280, 280)) > 0.97).astype(np.float32)
+
+    out = center_digits(batch)
+    np.testing.assert_allclose(center_digits(batch[:, :, ::-1]), out[:, :, ::-1], atol=1e-5)
+    np.testing.assert_allclose(center_digits(batch[:, ::-1, :]), out[:, ::-1, :], atol=1e-5)
+
+
+def test_edge_stroke_not_smeared():
+    """가장자리에 닿은 획이 바깥 샘플로 번지지 않아야 함 (바깥은 배경)"""
+    batch = np.zeros((2, 280, 280), dtype=np.float32)
+    batch[0, 100:180, 250:280] = 1
+    batch[1, 100:180, 0:30] = 1
+
+    out = center_digits(batch)
+    right_columns = np.nonzero(out[0].sum(axis=0) > 0.01)[0]
+    left_columns = np.nonzero(out[1].sum(axis=0) > 0.01)[0]
+    np.testing.assert_array_equal(right_columns, left_columns)
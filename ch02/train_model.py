@@ -0,0 +1,171 @@
+"""
+MNIST 모델 학습 스크립트
+웹 서버와 데스크톱 앱은 학습을 하지 않고, 이 스크립트가 만든 모델 결과물만 사용합니다.
+
+- MNIST 데이터는 처음 한 번만 내려받아 data/ 폴더에 .npy로 저장하고, 이후에는 메모리 맵으로 읽습니다.
+- 학습 데이터는 tf.data 파이프라인으로 섞고(shuffle) 배치로 묶은 뒤 미리 읽어(prefetch) 둡니다.
+- 결과물은 models/ 폴더에 버전 번호를 붙여 저장하고(Keras 모델 + NumPy 가중치),
+  파일별 SHA-256 체크섬을 models/manifest.json에 기록합니다.
+
+사용 예:
+    python train_model.py
+    python train_model.py --epochs 5 --batch-size 256 --seed 1
+    python train_model.py --from-h5 mnist_cnn.h5   # 이미 학습된 모델을 결과물로 변환
+"""
+
+import argparse
+import json
+import os
+import time
+import numpy as np
+
+from fast_inference import NumpyMLP
+from model_loader import MODEL_DIR, file_sha256
+
+# 데이터 캐시 폴더
+DATA_DIR = 'data'
+SPLITS = ('x_train', 'y_train', 'x_test', 'y_test')
+
+
+def cache_dataset(data_dir=DATA_DIR):
+    """MNIST를 .npy로 캐시하고 메모리 맵 배열로 반환 (x_train, y_train, x_test, y_test)"""
+    paths = {name: os.path.join(data_dir, f'mnist_{name}.npy') for name in SPLITS}
+    if not all(os.path.exists(path) for path in paths.values()):
+        from tensorflow.keras.datasets import mnist
+
+        print('MNIST 데이터를 내려받아 캐시합니다:', data_dir)
+        os.makedirs(data_dir, exist_ok=True)
+        (x_train, y_train), (x_test, y_test) = mnist.load_data()
+        for name, array in zip(SPLITS, (x_train, y_train, x_test, y_test)):
+            # 중간에 중단되어도 불완전한 파일이 남지 않도록 임시 파일에 쓴 뒤 이름 변경
+            tmp_path = paths[name] + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.save(f, array)
+            os.replace(tmp_path, paths[name])
+    return tuple(np.load(paths[name], mmap_mode='r') for name in SPLITS)
+
+
+def make_dataset(x, y, batch_size, shuffle=False, seed=None):
+    """메모리 맵 배열에서 배치를 읽는 tf.data 파이프라인
+
+    인덱스만 섞고 배치로 묶은 뒤, 배치마다 필요한 행만 메모리 맵에서 읽어 0~1로 변환합니다.
+    """
+    import tensorflow as tf
+
+    def load_batch(indices):
+        # 메모리 맵은 정렬된 인덱스로 읽을 때 빠름 (배치 안의 순서는 학습에 영향 없음)
+        indices = np.sort(indices)
+        return x[indices].astype(np.float32) / 255.0, y[indices].astype(np.int64)
+
+    def set_shapes(images, labels):
+        images.set_shape([None, *x.shape[1:]])
+        labels.set_shape([None])
+        return images, labels
+
+    dataset = tf.data.Dataset.range(len(x))
+    if shuffle:
+        dataset = dataset.shuffle(len(x), seed=seed, reshuffle_each_iteration=True)
+    dataset = dataset.batch(batch_size)
+    dataset = dataset.map(lambda indices: tf.numpy_function(load_batch, [indices], (tf.float32, tf.int64)),
+                          num_parallel_calls=tf.data.AUTOTUNE, deterministic=True)
+    return dataset.map(set_shapes).prefetch(tf.data.AUTOTUNE)
+
+
+def build_model():
+    """앱에서 사용하는 MLP 구조 (Flatten -> Dense(128, relu) -> Dropout(0.2) -> Dense(10, softmax))"""
+    from tensorflow.keras.models import Sequential
+    from tensorflow.keras.layers import Input, Flatten, Dense, Dropout
+
+    model = Sequential([
+        Input(shape=(28, 28)),
+        Flatten(),
+        Dense(128, activation='relu'),
+        Dropout(0.2),
+        Dense(10, activation='softmax')
+    ])
+    model.compile(optimizer='adam',
+                  loss='sparse_categorical_crossentropy',
+                  metrics=['accuracy'])
+    return model
+
+
+def next_version(model_dir=MODEL_DIR):
+    """models/ 폴더에 있는 결과물 중 가장 큰 버전 + 1"""
+    versions = [0]
+    if os.path.isdir(model_dir):
+        for name in os.listdir(model_dir):
+            stem = os.path.splitext(name)[0]
+            if stem.startswith('mnist_mlp_v') and stem[len('mnist_mlp_v'):].isdigit():
+                versions.append(int(stem[len('mnist_mlp_v'):]))
+    return max(versions) + 1
+
+
+def save_artifact(model, info, model_dir=MODEL_DIR):
+    """모델을 새 버전으로 저장하고 매니페스트 갱신 (반환: 매니페스트)"""
+    os.makedirs(model_dir, exist_ok=True)
+    version = next_version(model_dir)
+    model_name = f'mnist_mlp_v{version}.h5'
+    model.save(os.path.join(model_dir, model_name))
+    files = [model_name]
+
+    # Dense 층만 있는 모델은 TensorFlow 없이 읽을 수 있는 가중치 파일도 저장
+    weights_name = None
+    try:
+        weights = NumpyMLP.from_keras(model)
+    except ValueError as e:
+        print('NumPy 가중치 파일을 만들 수 없습니다:', e)
+    else:
+        weights_name = f'mnist_mlp_v{version}.npz'
+        weights.save(os.path.join(model_dir, weights_name))
+        files.append(weights_name)
+
+    manifest = {
+        'version': version,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'model': model_name,
+        'weights': weights_name,
+        'files': {name: file_sha256(os.path.join(model_dir, name)) for name in files},
+        **info,
+    }
+    tmp_path = os.path.join(model_dir, 'manifest.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, os.path.join(model_dir, 'manifest.json'))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MNIST 모델 학습')
+    parser.add_argument('--epochs', type=int, default=3, help='학습 epoch 수')
+    parser.add_argument('--batch-size', type=int, default=128, help='배치 크기')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드 (같은 시드면 같은 결과)')
+    parser.add_argument('--data-dir', default=DATA_DIR, help='MNIST 캐시 폴더')
+    parser.add_argument('--model-dir', default=MODEL_DIR, help='모델 결과물 폴더')
+    parser.add_argument('--from-h5', help='학습 대신 이미 학습된 Keras 모델 파일을 결과물로 변환')
+    args = parser.parse_args()
+
+    import tensorflow as tf
+
+    if args.from_h5:
+        model = tf.keras.models.load_model(args.from_h5)
+        info = {'source': os.path.basename(args.from_h5)}
+    else:
+        tf.keras.utils.set_random_seed(args.seed)
+        x_train, y_train, x_test, y_test = cache_dataset(args.data_dir)
+        train = make_dataset(x_train, y_train, args.batch_size, shuffle=True, seed=args.seed)
+        test = make_dataset(x_test, y_test, args.batch_size)
+
+        model = build_model()
+        start = time.perf_counter()
+        model.fit(train, epochs=args.epochs, validation_data=test, verbose=2)
+        print(f'학습 시간: {time.perf_counter() - start:.1f}초')
+        loss, accuracy = model.evaluate(test, verbose=0)
+        info = {'epochs': args.epochs, 'batch_size': args.batch_size, 'seed': args.seed,
+                'test_accuracy': round(float(accuracy), 4)}
+
+    manifest = save_artifact(model, info, args.model_dir)
+    print(f"모델 v{manifest['version']} 저장: {os.path.join(args.model_dir, manifest['model'])}")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,40 +5,51 @@ Flask 웹 기반 챗봇 애플리케이션
 웹 브라우저에서 챗봇과 대화할 수 있는 인터페이스를 제공합니다.
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, make_response
+import json
 import random
+import re
+import secrets
+import socket
 from datetime import datetime
 import os
 
+from typing import List, Optional
+
+from rule_store import DEFAULT_RULES_PATH, RuleSet, RuleStore
+from session_store import SessionState, make_session_store
+
+try:
+    # WebSocket 지원 (선택 사항: 설치되어 있지 않으면 POST /chat만 사용)
+    from flask_sock import Sock
+except ImportError:
+    Sock = None
+
 app = Flask(__name__)
+# 클라이언트에 WebSocket 사용을 알릴지 여부 (WebSocket을 지원하지 않는 서버에서 실행하면 False로 설정)
+app.config['WEBSOCKET'] = Sock is not None
+
+# 빈 메시지에 대한 응답
+EMPTY_MESSAGE_RESPONSE = '메시지를 입력해주세요!'
+
+# 세션 쿠키 이름과 허용하는 세션 ID 형식 (secrets.token_urlsafe(16) = 22자)
+SESSION_COOKIE = 'chat_session'
+SESSION_ID_PATTERN = re.compile(r'[A-Za-z0-9_-]{16,64}')
+
+# 응답을 나눠 보낼 단위 (단어 + 뒤따르는 공백)
+CHUNK_PATTERN = re.compile(r'\S+\s*')
 
 class WebChatbot:
     """웹용 챗봇 클래스"""
     
-    def __init__(self):
-        """챗봇 초기화 - 대화 규칙과 패턴을 설정합니다."""
-        # 대화 규칙을 딕셔너리로 저장 (키워드: 응답)
-        self.conversation_rules = {
-            '안녕': ['안녕하세요!', '반갑습니다!', '안녕하세요, 무엇을 도와드릴까요?'],
-            '이름': ['제 이름은 WebBot입니다.', '저는 WebBot이라고 해요!'],
-            '날씨': ['오늘 날씨는 어떤가요?', '날씨 정보를 확인해보시는 건 어떨까요?'],
-            '시간': ['현재 시간을 확인해보세요!', '시계를 확인해보시는 건 어떨까요?'],
-            '도움': ['무엇을 도와드릴까요?', '질문이 있으시면 언제든 말씀해주세요!'],
-            '감사': ['천만에요!', '도움이 되어서 기뻐요!', '별 말씀을요!'],
-            '잘가': ['안녕히 가세요!', '다음에 또 만나요!', '좋은 하루 되세요!'],
-            '웹': ['웹에서 대화할 수 있어서 편리하죠!', '웹 인터페이스가 마음에 드시나요?'],
-            '파이썬': ['파이썬으로 만들어진 챗봇입니다!', '파이썬은 정말 멋진 언어죠!'],
-            'flask': ['Flask로 웹 서버를 구축했습니다!', 'Flask는 가벼운 웹 프레임워크예요!']
-        }
-        
-        # 기본 응답 (규칙에 맞지 않을 때)
-        self.default_responses = [
-            '죄송해요, 이해하지 못했어요.',
-            '다른 말로 표현해주실 수 있나요?',
-            '무엇을 도와드릴까요?',
-            '흥미로운 질문이네요!',
-            '더 구체적으로 말씀해주세요.'
-        ]
+    def __init__(self, rule_store: RuleStore):
+        """챗봇 초기화 - 규칙 저장소를 연결합니다 (규칙은 rules.json에서 읽음)."""
+        self.rule_store = rule_store
+    
+    @property
+    def rule_version(self) -> str:
+        """현재 사용 중인 규칙 버전"""
+        return self.rule_store.current.version
     
     def preprocess_user_input(self, user_input: str) -> str:
         """사용자 입력을 전처리합니다."""
@@ -46,28 +57,74 @@ class WebChatbot:
         processed_input = user_input.lower().strip()
         return processed_input
     
-    def find_matching_keyword(self, user_input: str) -> str:
-        """사용자 입력에서 매칭되는 키워드를 찾습니다."""
-        for keyword in self.conversation_rules.keys():
-            if keyword in user_input:
-                return keyword
-        return ""
+    def find_matching_keyword(self, user_input: str, rules: Optional[RuleSet] = None,
+                              session: Optional[SessionState] = None) -> str:
+        """사용자 입력과 일치하는 규칙 이름을 찾습니다 (여러 개면 규칙 순서상 앞선 규칙)."""
+        rules = rules or self.rule_store.current
+        return rules.find_rule(user_input, session.last_rule if session else "")
     
-    def get_response(self, keyword: str) -> str:
-        """키워드에 해당하는 응답을 반환합니다."""
-        if keyword in self.conversation_rules:
+    def get_response(self, keyword: str, rules: Optional[RuleSet] = None,
+                     session: Optional[SessionState] = None) -> str:
+        """키워드에 해당하는 응답을 반환합니다 (응답의 {슬롯}은 세션에 기억한 값으로 채움)."""
+        rules = rules or self.rule_store.current
+        candidates = rules.responses_for(keyword, session.slots if session else {})
+        if candidates:
             # 여러 응답 중에서 랜덤하게 선택
-            return random.choice(self.conversation_rules[keyword])
+            return random.choice(candidates)
         else:
-            return random.choice(self.default_responses)
+            return random.choice(rules.default_responses)
+    
+    def respond(self, user_message: str, session: Optional[SessionState] = None) -> str:
+        """메시지 하나에 대한 응답을 만듭니다.
+        
+        요청 처리 중에 규칙이 바뀌어도 매칭과 응답 선택이 같은 규칙을 쓰도록
+        시작할 때 받은 스냅샷 하나만 사용합니다. 세션이 있으면 직전 규칙을 문맥으로 쓰고,
+        일치한 규칙과 뽑아낸 슬롯 값을 세션에 기록합니다.
+        """
+        rules = self.rule_store.current
+        processed_input = self.preprocess_user_input(user_message)
+        if not processed_input:
+            return EMPTY_MESSAGE_RESPONSE
+        matching_keyword = self.find_matching_keyword(processed_input, rules, session)
+        if session is not None:
+            for slot, value in rules.capture_slots(matching_keyword, processed_input).items():
+                session.set_slot(slot, value)
+            session.record(matching_keyword)
+        return self.get_response(matching_keyword, rules, session)
+    
+    def respond_chunks(self, user_message: str, session: Optional[SessionState] = None) -> List[str]:
+        """응답을 단어 단위 조각으로 나눠 반환합니다 (WebSocket에서 받는 대로 바로 표시)."""
+        return CHUNK_PATTERN.findall(self.respond(user_message, session))
+
+# 규칙 저장소 생성 (규칙 파일이 바뀌면 감시 스레드가 새 규칙으로 교체)
+# CHATBOT_INTENT_MODEL에 sentence-transformers 모델 이름을 주면 의도 분류에 문장 임베딩 사용 (없으면 TF-IDF)
+rule_store = RuleStore(os.environ.get('CHATBOT_RULES_PATH', DEFAULT_RULES_PATH),
+                       intent_model=os.environ.get('CHATBOT_INTENT_MODEL')).start_watching()
 
 # 챗봇 인스턴스 생성
-chatbot = WebChatbot()
+chatbot = WebChatbot(rule_store)
+
+# 세션 저장소 생성 (CHATBOT_SESSION_URL에 redis:// 주소를 주면 Redis 호환 서버에 저장)
+session_store = make_session_store(os.environ.get('CHATBOT_SESSION_URL'))
+
+def session_id_from_request() -> str:
+    """요청 쿠키의 세션 ID를 반환합니다 (없거나 형식이 다르면 새로 만듦)."""
+    session_id = request.cookies.get(SESSION_COOKIE, '')
+    if not SESSION_ID_PATTERN.fullmatch(session_id):
+        session_id = secrets.token_urlsafe(16)
+    return session_id
+
+def set_session_cookie(response, session_id: str):
+    """세션 쿠키를 설정합니다 (사용할 때마다 만료 시간 갱신)."""
+    response.set_cookie(SESSION_COOKIE, session_id, max_age=int(session_store.ttl),
+                        httponly=True, samesite='Lax')
+    return response
 
 @app.route('/')
 def index():
-    """메인 페이지를 렌더링합니다."""
-    return render_template('index.html')
+    """메인 페이지를 렌더링합니다 (WebSocket 연결에서도 쓰도록 세션 쿠키를 미리 발급)."""
+    response = make_response(render_template('index.html'))
+    return set_session_cookie(response, session_id_from_request())
 
 @app.route('/chat', methods=['POST'])
 def chat():
@@ -77,32 +134,21 @@ def chat():
         data = request.get_json()
         user_message = data.get('message', '').strip()
         
-        # 빈 메시지 처리
-        if not user_message:
-            return jsonify({
-                'response': '메시지를 입력해주세요!',
-                'timestamp': datetime.now().strftime('%H:%M:%S')
-            })
-        
-        # 입력 전처리
-        processed_input = chatbot.preprocess_user_input(user_message)
+        # 세션 상태 (처음이거나 만료되었으면 새로 시작)
+        session_id = session_id_from_request()
+        session = session_store.get(session_id) or SessionState()
         
-        # 매칭되는 키워드 찾기
-        matching_keyword = chatbot.find_matching_keyword(processed_input)
-        
-        # 응답 생성
-        if matching_keyword:
-            bot_response = chatbot.get_response(matching_keyword)
-        else:
-            bot_response = chatbot.get_response("")  # 기본 응답
+        # 응답 생성 (입력 전처리 -> 키워드 매칭 -> 응답 선택, 빈 메시지는 안내 문구)
+        bot_response = chatbot.respond(user_message, session)
+        session_store.save(session_id, session)
         
         # 현재 시간
         current_time = datetime.now().strftime('%H:%M:%S')
         
-        return jsonify({
+        return set_session_cookie(jsonify({
             'response': bot_response,
             'timestamp': current_time
-        })
+        }), session_id)
         
     except Exception as error:
         # 오류 처리
@@ -111,10 +157,44 @@ def chat():
             'timestamp': datetime.now().strftime('%H:%M:%S')
         }), 500
 
+if Sock is not None:
+    sock = Sock(app)
+
+    @sock.route('/ws')
+    def chat_socket(ws):
+        """WebSocket 연결 하나로 메시지를 계속 주고받습니다.
+        
+        클라이언트는 {"id": 번호, "message": 내용}을 보내고, 서버는 같은 id로
+        응답 조각({"type": "chunk", "text": ...})을 차례로 보낸 뒤 {"type": "done", "timestamp": ...}을 보냅니다.
+        """
+        # 작은 프레임을 연달아 보내므로 Nagle 알고리즘을 꺼서 조각마다 ACK를 기다리지 않게 함 (없으면 메시지당 약 40ms 지연)
+        ws.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # 페이지를 열 때 받은 세션 쿠키 사용 (쿠키가 없으면 이 연결 동안만 유지되는 세션)
+        session_id = session_id_from_request()
+        while True:
+            # 클라이언트가 연결을 닫으면 receive()가 예외를 내고 flask-sock이 연결을 정리
+            raw_message = ws.receive()
+            message_id = None
+            try:
+                data = json.loads(raw_message)
+                message_id = data.get('id')
+                session = session_store.get(session_id) or SessionState()
+                chunks = chatbot.respond_chunks(str(data.get('message', '')), session)
+                session_store.save(session_id, session)
+                for chunk in chunks:
+                    ws.send(json.dumps({'id': message_id, 'type': 'chunk', 'text': chunk}, ensure_ascii=False))
+                ws.send(json.dumps({'id': message_id, 'type': 'done',
+                                    'timestamp': datetime.now().strftime('%H:%M:%S')}))
+            except (ValueError, AttributeError) as error:
+                ws.send(json.dumps({'id': message_id, 'type': 'error', 'error': str(error)}, ensure_ascii=False))
+
 @app.route('/health')
 def health_check():
     """서버 상태 확인용 엔드포인트"""
-    return jsonify({'status': 'healthy', 'message': '챗봇 서버가 정상 작동 중입니다.'})
+    return jsonify({'status': 'healthy', 'message': '챗봇 서버가 정상 작동 중입니다.',
+                    'rule_version': chatbot.rule_version,
+                    'websocket': app.config['WEBSOCKET'],
+                    'sessions': session_store.count()})
 
 if __name__ == '__main__':
     # 개발 서버 실행 (디버그 모드 활성화)
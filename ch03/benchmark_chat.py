@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+챗봇 서버 벤치마크
+서버(waitress 또는 Flask 개발 서버)를 직접 띄운 뒤 한국어 메시지 모음(chat_corpus.txt)을
+지정한 동시 클라이언트 수로 /chat에 보내고, /health도 측정해 처리량과 p50/p95/p99를 구합니다.
+또한 같은 메시지로 find_matching_keyword/get_response를 cProfile로 측정해
+결과를 JSON으로 저장하므로, 이전 결과 파일(--baseline)과 비교해 성능 저하를 확인할 수 있습니다.
+
+사용 예:
+    python benchmark_chat.py
+    python benchmark_chat.py --clients 1 10 100 --duration 5
+    python benchmark_chat.py --server dev --output results/dev.json
+    python benchmark_chat.py --baseline results/benchmark_chat_20240101_120000.json
+"""
+
+import argparse
+import asyncio
+import cProfile
+import json
+import os
+import platform
+import pstats
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import List, Optional
+
+from load_test import print_summary, raise_open_file_limit, run, summarize
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CORPUS = os.path.join(APP_DIR, 'chat_corpus.txt')
+RESULTS_DIR = os.path.join(APP_DIR, 'results')
+
+# 비교할 때 표시하는 지표 (값이 클수록 좋은 지표는 rps뿐)
+COMPARE_KEYS = ('rps', 'p50_ms', 'p95_ms', 'p99_ms')
+
+
+def load_corpus(path: str) -> List[str]:
+    """한 줄에 메시지 하나인 파일을 읽습니다 (빈 줄 제외)."""
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def start_server(server: str, port: int, threads: int) -> subprocess.Popen:
+    """서버를 별도 프로세스로 띄우고 /health가 응답할 때까지 기다립니다."""
+    if server == 'waitress':
+        command = [sys.executable, 'serve.py', '--host', '127.0.0.1', '--port', str(port),
+                   '--threads', str(threads)]
+    else:
+        command = [sys.executable, '-c', f'from app import app; app.run(host="127.0.0.1", port={port})']
+    process = subprocess.Popen(command, cwd=APP_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'서버가 시작되지 않았습니다: {" ".join(command)}')
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/health', timeout=1) as response:
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError('서버가 30초 안에 준비되지 않았습니다.')
+
+
+def profile_matching(messages: List[str], repeat: int) -> dict:
+    """find_matching_keyword/get_response를 cProfile로 측정합니다 (서버와 같은 규칙 파일 사용)."""
+    from app import chatbot
+
+    rules = chatbot.rule_store.current
+    inputs = [chatbot.preprocess_user_input(message) for message in messages] * repeat
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    for text in inputs:
+        keyword = chatbot.find_matching_keyword(text, rules)
+        chatbot.get_response(keyword, rules)
+    profiler.disable()
+    total = time.perf_counter() - start
+
+    stats = pstats.Stats(profiler)
+    functions = {}
+    for (filename, line, name), (_, calls, own, cumulative, _) in stats.stats.items():
+        if name in ('find_matching_keyword', 'get_response') and filename.endswith('app.py'):
+            functions[name] = {'calls': calls, 'cumulative_ms': round(cumulative * 1000, 2),
+                               'per_call_us': round(cumulative / calls * 1e6, 2)}
+    # 누적 시간이 큰 함수 10개 (어디서 시간이 드는지 확인용)
+    top = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:10]
+    return {
+        'messages': len(inputs),
+        'wall_ms': round(total * 1000, 2),
+        'functions': functions,
+        'top_cumulative': [{'function': f'{os.path.basename(filename)}:{line}({name})',
+                            'calls': calls, 'cumulative_ms': round(cumulative * 1000, 2)}
+                           for (filename, line, name), (_, calls, _, cumulative, _) in top],
+    }
+
+
+def git_commit() -> Optional[str]:
+    """현재 커밋 해시 (git이 없으면 None)"""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=APP_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """이전 결과와 지표별 변화율을 출력합니다."""
+    print(f"\n=== 이전 결과와 비교 ({baseline.get('created')}, 커밋 {baseline.get('commit')}) ===")
+    old_runs = {(run['endpoint'], run['clients']): run for run in baseline.get('runs', [])}
+    for new in results['runs']:
+        old = old_runs.get((new['endpoint'], new['clients']))
+        if old is None:
+            continue
+        changes = []
+        for key in COMPARE_KEYS:
+            if old[key]:
+                changes.append(f"{key} {old[key]} -> {new[key]} ({(new[key] - old[key]) / old[key] * 100:+.1f}%)")
+        print(f"  {new['endpoint']} x{new['clients']}: " + ', '.join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='챗봇 서버 벤치마크')
+    parser.add_argument('--server', choices=('waitress', 'dev'), default='waitress', help='측정할 서버')
+    parser.add_argument('--port', type=int, default=5099, help='벤치마크용 서버 포트')
+    parser.add_argument('--threads', type=int, default=8, help='waitress 스레드 수')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS, help='메시지 모음 파일 (한 줄에 하나)')
+    parser.add_argument('--clients', type=int, nargs='+', default=[1, 10, 100], help='동시 클라이언트 수 (여러 개 가능)')
+    parser.add_argument('--warmup', type=float, default=1.0, help='측정 전 워밍업 시간 (초)')
+    parser.add_argument('--duration', type=float, default=5.0, help='측정 시간 (초)')
+    parser.add_argument('--profile-repeat', type=int, default=200, help='프로파일링할 때 메시지 모음을 반복할 횟수')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: results/benchmark_chat_날짜_시각.json)')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON')
+    args = parser.parse_args()
+
+    messages = load_corpus(args.corpus)
+    raise_open_file_limit(max(args.clients) + 100)
+    results = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'server': args.server,
+        'corpus': {'path': os.path.relpath(args.corpus, APP_DIR), 'messages': len(messages)},
+        'runs': [],
+    }
+
+    server = start_server(args.server, args.port, args.threads)
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{args.port}/health') as response:
+            results['rule_version'] = json.loads(response.read()).get('rule_version')
+        for endpoint, endpoint_messages in (('/chat', messages), ('/health', None)):
+            for clients in args.clients:
+                latencies, errors, elapsed = asyncio.run(run(
+                    f'http://127.0.0.1:{args.port}{endpoint}', clients, args.warmup, args.duration,
+                    timeout=10.0, seed=0, messages=endpoint_messages))
+                summary = summarize(latencies, errors, elapsed)
+                print_summary(f'{args.server} {endpoint} (클라이언트 {clients}개)', summary)
+                results['runs'].append({'endpoint': endpoint, 'clients': clients, **summary})
+    finally:
+        server.terminate()
+        server.wait()
+
+    profile = profile_matching(messages, args.profile_repeat)
+    results['profile'] = profile
+    print(f"\n=== 키워드 매칭 프로파일 (메시지 {profile['messages']}개, {profile['wall_ms']:.1f} ms) ===")
+    for name, stat in profile['functions'].items():
+        print(f"  {name}: {stat['calls']}회, 호출당 {stat['per_call_us']:.1f} µs")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"benchmark_chat_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            compare(results, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
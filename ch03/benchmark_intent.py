@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+의도 분류 벤치마크
+의도 N개(기본 5,000개, 의도마다 예문 4개)로 IntentClassifier를 만들고,
+예문에 없던 문장(같은 의도의 단어를 다른 순서/조사로 조합)의 분류 시간 p50/p95/p99와 정확도를 측정합니다.
+
+사용 예:
+    python benchmark_intent.py
+    python benchmark_intent.py --intents 5000 --queries 2000
+    python benchmark_intent.py --model sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2
+"""
+
+import argparse
+import random
+import time
+
+from benchmark_matcher import random_word
+from intent_classifier import NO_MATCH, IntentClassifier, embedder_factory
+from korean_tokenizer import PARTICLES
+
+# 여러 의도에 두루 나오는 흔한 단어
+FILLERS = ['좀', '오늘', '지금', '그냥', '혹시', '진짜', '너무', '알려줘', '궁금해', '해줘']
+
+
+def make_sentence(rng: random.Random, words) -> str:
+    """의도의 단어 2~3개에 조사와 흔한 단어를 섞은 문장"""
+    chosen = [word + rng.choice(('',) + PARTICLES[-10:]) for word in rng.sample(words, rng.randint(2, 3))]
+    chosen += rng.sample(FILLERS, rng.randint(0, 2))
+    rng.shuffle(chosen)
+    return ' '.join(chosen)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='의도 분류 벤치마크')
+    parser.add_argument('--intents', type=int, default=5000, help='의도 수')
+    parser.add_argument('--examples', type=int, default=4, help='의도별 예문 수')
+    parser.add_argument('--queries', type=int, default=1000, help='측정할 문장 수')
+    parser.add_argument('--model', help='sentence-transformers 모델 이름 (없으면 TF-IDF)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # 의도마다 고유한 단어 4개 (2~3음절)
+    intent_words = [[random_word(rng, 2, 3, 2000) for _ in range(4)] for _ in range(args.intents)]
+    examples = [[make_sentence(rng, words) for _ in range(args.examples)] for words in intent_words]
+    queries = [(intent_id, make_sentence(rng, intent_words[intent_id]))
+               for intent_id in (rng.randrange(args.intents) for _ in range(args.queries))]
+
+    start = time.perf_counter()
+    classifier = IntentClassifier(examples, embedder_factory(args.model)())
+    build_sec = time.perf_counter() - start
+
+    for _, text in queries[:50]:  # 워밍업
+        classifier.classify(text)
+    latencies = []
+    correct = unmatched = 0
+    for intent_id, text in queries:
+        start = time.perf_counter()
+        predicted, _ = classifier.classify(text)
+        latencies.append(time.perf_counter() - start)
+        correct += predicted == intent_id
+        unmatched += predicted == NO_MATCH
+    latencies.sort()
+
+    def percentile(percent):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percent / 100))] * 1000
+
+    print(f"=== 의도 {len(classifier)}개 (예문 {args.examples}개씩), 문장 {len(queries)}개, "
+          f"{type(classifier.embedder).__name__} ===")
+    print(f"  행렬 생성: {build_sec:6.2f} s (행렬 {classifier.matrix.shape}, {classifier.nbytes / 1024 / 1024:.1f} MB)")
+    print(f"  분류 시간: p50 {percentile(50):.2f} ms, p95 {percentile(95):.2f} ms, p99 {percentile(99):.2f} ms")
+    print(f"  정확도: {correct / len(queries) * 100:.1f}% (기준 미달로 일치 없음: {unmatched}개)")
+
+
+if __name__ == '__main__':
+    main()
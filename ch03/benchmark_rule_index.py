@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+규칙 역색인 벤치마크
+규칙 N개(기본 10,000개, 일부는 키워드 2~3개)로 RuleIndex를 만들 때의 시간과 메모리,
+그리고 메시지당 처리 시간을 규칙 전체를 훑는 방식과 비교하고 결과가 같은지 확인합니다.
+
+사용 예:
+    python benchmark_rule_index.py
+    python benchmark_rule_index.py --rules 10000 --messages 2000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from typing import List, Sequence, Set
+
+from benchmark_matcher import random_word
+from korean_tokenizer import PARTICLES, tokenize
+from rule_index import NO_MATCH, RuleIndex
+
+
+def linear_scan(rule_keywords: List[Sequence[str]], tokens: Set[str]) -> int:
+    """비교용: 규칙 순서대로 모든 키워드가 토큰에 있는지 검사"""
+    for rule_id, keywords in enumerate(rule_keywords):
+        if all(keyword in tokens for keyword in keywords):
+            return rule_id
+    return NO_MATCH
+
+
+def main():
+    parser = argparse.ArgumentParser(description='규칙 역색인 벤치마크')
+    parser.add_argument('--rules', type=int, default=10000, help='규칙 수')
+    parser.add_argument('--messages', type=int, default=1000, help='메시지 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary = list(dict.fromkeys(random_word(rng, 2, 4, 400) for _ in range(args.rules)))
+    # 규칙의 70%는 키워드 1개, 나머지는 2~3개
+    rule_keywords = [tuple(rng.sample(vocabulary, 1 if rng.random() < 0.7 else rng.randint(2, 3)))
+                     for _ in range(args.rules)]
+    messages = []
+    for _ in range(args.messages):
+        words = [random_word(rng, 1, 4, 400) for _ in range(rng.randint(3, 10))]
+        for keyword in rng.choice(rule_keywords) if rng.random() < 0.8 else ():
+            # 키워드 뒤에 조사를 붙여 문장에 섞음
+            words.insert(rng.randrange(len(words) + 1), keyword + rng.choice(('',) + PARTICLES[-10:]))
+        messages.append(' '.join(words))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    index = RuleIndex(rule_keywords)
+    build_sec = time.perf_counter() - start
+    index_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    expected = [linear_scan(rule_keywords, tokenize(message)) for message in messages]
+    scan_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [index.find_best(message) for message in messages]
+    index_sec = time.perf_counter() - start
+
+    mismatches = sum(a != b for a, b in zip(expected, actual))
+    matched = sum(rule_id != NO_MATCH for rule_id in expected)
+    print(f"=== 규칙 {len(rule_keywords)}개 (키워드 여러 개: {sum(len(k) > 1 for k in rule_keywords)}개), 메시지 {len(messages)}개 ===")
+    print(f"  색인 생성:    {build_sec * 1000:8.1f} ms (토큰 {len(index.postings)}개, 메모리 {index_bytes / 1024 / 1024:.2f} MB)")
+    print(f"  규칙 전체 검사: {scan_sec / len(messages) * 1e6:8.1f} µs/메시지")
+    print(f"  역색인:         {index_sec / len(messages) * 1e6:8.1f} µs/메시지 -> {scan_sec / index_sec:.1f}배 빠름")
+    print(f"  규칙이 일치한 메시지: {matched}개, 결과 불일치: {mismatches}개")
+
+
+if __name__ == '__main__':
+    main()
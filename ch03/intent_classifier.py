@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+의도(intent) 분류 모듈
+규칙마다 적어 둔 예문('examples')을 시작할 때 한 번 벡터로 바꿔 (의도 수 x 차원) 행렬로 만들어 두고,
+메시지는 벡터 하나로 바꾼 뒤 행렬 곱 한 번으로 모든 의도와의 유사도를 계산합니다.
+키워드가 정확히 들어 있지 않은 바꿔 말하기('고마워' -> 감사)를 찾는 데 사용합니다.
+
+- 기본: 글자 n-gram TF-IDF를 해시로 고정 차원에 담는 방식 (NumPy만 사용, 학습 불필요)
+- 선택: sentence-transformers가 설치되어 있으면 작은 문장 임베딩 모델 사용 (CPU)
+"""
+
+import zlib
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from korean_tokenizer import split_words, tokenize
+
+# 해시 벡터 차원 (의도 5,000개 x 1,024차원 float32 = 약 20 MB)
+HASH_DIM = 1024
+
+# 유사도가 이보다 낮으면 일치하는 의도가 없다고 봄
+MIN_SIMILARITY = 0.25
+
+# 일치하는 의도가 없을 때의 번호
+NO_MATCH = -1
+
+
+class HashingTfidfEmbedder:
+    """글자 n-gram TF-IDF 임베딩 (특징을 해시로 HASH_DIM 차원에 담음)
+
+    한국어는 띄어쓰기와 조사에 따라 단어 모양이 쉽게 바뀌므로 단어 대신 단어 안의 글자 1~3-gram과
+    조사/어미를 뗀 어간을 특징으로 사용합니다.
+    """
+
+    def __init__(self, dim: int = HASH_DIM):
+        self.dim = dim
+        self.idf = np.ones(dim, dtype=np.float32)
+
+    def features(self, text: str) -> np.ndarray:
+        """메시지의 특징 해시 번호 배열 (같은 특징이 여러 번 나오면 여러 번 포함)"""
+        keys = ['w:' + token for token in tokenize(text)]
+        for word in split_words(text):
+            padded = f' {word} '
+            keys.extend(word)
+            for n in (2, 3):
+                keys.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+        # crc32는 실행할 때마다 값이 같으므로 프로세스가 달라도 같은 벡터가 나옴
+        return np.array([zlib.crc32(key.encode('utf-8')) % self.dim for key in keys], dtype=np.int64)
+
+    def fit(self, texts: Sequence[str]) -> 'HashingTfidfEmbedder':
+        """예문 전체에서 특징별 IDF(드물게 나오는 특징일수록 큰 가중치)를 계산합니다."""
+        doc_freq = np.zeros(self.dim, dtype=np.float64)
+        for text in texts:
+            doc_freq[np.unique(self.features(text))] += 1
+        self.idf = (np.log((1 + len(texts)) / (1 + doc_freq)) + 1).astype(np.float32)
+        return self
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """메시지들을 길이 1로 정규화한 (개수 x dim) float32 행렬로 바꿉니다."""
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            counts = np.bincount(self.features(text), minlength=self.dim)
+            vectors[row] = np.log1p(counts) * self.idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+class SentenceEmbedder:
+    """sentence-transformers 문장 임베딩 (선택 사항, 만들 때 모델을 읽음)"""
+
+    def __init__(self, model_name: str):
+        # 설치되어 있지 않으면 ImportError가 발생하므로 호출한 쪽에서 TF-IDF로 대체
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name, device='cpu')
+
+    def fit(self, texts: Sequence[str]) -> 'SentenceEmbedder':
+        """미리 학습된 모델이므로 할 일이 없습니다."""
+        return self
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """메시지들을 길이 1로 정규화한 float32 행렬로 바꿉니다."""
+        return self.model.encode(list(texts), normalize_embeddings=True,
+                                 convert_to_numpy=True).astype(np.float32)
+
+
+def embedder_factory(model_name: Optional[str] = None) -> Callable[[], object]:
+    """규칙 스냅샷마다 쓸 임베딩 생성 함수를 반환합니다.
+
+    모델 이름이 있고 sentence-transformers를 쓸 수 있으면 모델을 한 번만 읽어 모든 스냅샷이 공유하고,
+    아니면 스냅샷마다 새 TF-IDF 임베딩을 만듭니다 (IDF가 규칙에 따라 달라지므로 공유하지 않음).
+    """
+    if model_name:
+        try:
+            embedder = SentenceEmbedder(model_name)
+            return lambda: embedder
+        except ImportError:
+            print('sentence-transformers가 설치되어 있지 않아 TF-IDF로 의도를 분류합니다.')
+    return HashingTfidfEmbedder
+
+
+class IntentClassifier:
+    """예문 임베딩 행렬 기반 의도 분류기
+
+    의도마다 예문 벡터의 평균(중심)을 한 행으로 저장하므로, 예문이 많아도 행렬 크기는 의도 수에만 비례합니다.
+    """
+
+    def __init__(self, examples: Sequence[Sequence[str]], embedder=None,
+                 min_similarity: float = MIN_SIMILARITY):
+        """의도별 예문 목록으로 (의도 수 x 차원) 행렬을 만듭니다 (의도 번호 = 전달된 순서)."""
+        self.embedder = embedder or HashingTfidfEmbedder()
+        self.min_similarity = min_similarity
+        self.embedder.fit([text for texts in examples for text in texts])
+
+        rows = []
+        for texts in examples:
+            centroid = self.embedder.embed(list(texts)).mean(axis=0) if texts else None
+            rows.append(centroid)
+        dim = next((row.shape[0] for row in rows if row is not None), 1)
+        self.matrix = np.zeros((len(rows), dim), dtype=np.float32)
+        for intent_id, row in enumerate(rows):
+            if row is not None:
+                self.matrix[intent_id] = row / max(float(np.linalg.norm(row)), 1e-12)
+
+    def similarities(self, text: str) -> np.ndarray:
+        """메시지와 모든 의도의 코사인 유사도 (행렬 곱 한 번)"""
+        return self.matrix @ self.embedder.embed([text])[0]
+
+    def classify(self, text: str) -> Tuple[int, float]:
+        """가장 비슷한 의도의 (번호, 유사도)를 반환합니다 (기준보다 낮으면 번호는 NO_MATCH)."""
+        if not len(self.matrix):
+            return NO_MATCH, 0.0
+        scores = self.similarities(text)
+        best = int(np.argmax(scores))
+        score = float(scores[best])
+        return (best if score >= self.min_similarity else NO_MATCH), score
+
+    @property
+    def nbytes(self) -> int:
+        """의도 행렬이 차지하는 메모리 (바이트)"""
+        return self.matrix.nbytes
+
+    def __len__(self) -> int:
+        return len(self.matrix)
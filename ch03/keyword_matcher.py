@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다중 키워드 매칭 모듈
+Aho-Corasick 오토마톤으로 여러 키워드를 메시지에서 한 번에 찾습니다.
+규칙마다 부분 문자열 검색을 반복하면 (규칙 수 x 메시지 길이)만큼 시간이 들지만,
+오토마톤은 시작할 때 한 번 만들어 두면 메시지를 한 번만 훑어서 모든 키워드를 찾습니다.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+# 일치하는 키워드가 없을 때의 우선순위
+NO_MATCH = -1
+
+
+class KeywordMatcher:
+    """Aho-Corasick 기반 키워드 매처
+
+    키워드의 우선순위는 전달된 순서입니다 (앞에 있을수록 우선).
+    여러 키워드가 메시지에 들어 있으면 항상 우선순위가 가장 높은 키워드를 돌려주므로,
+    규칙을 순서대로 검사해 처음 일치한 키워드를 고르던 기존 방식과 결과가 같습니다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """키워드 목록으로 오토마톤을 만듭니다."""
+        self.keywords: List[str] = []
+        # 노드별 다음 문자 -> 노드 번호, 실패 링크, 이 노드에서 끝나는 키워드 번호
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[List[int]] = [[]]
+        # 실패 링크를 따라가며 만나는 키워드 중 우선순위가 가장 높은 번호 (없으면 NO_MATCH)
+        self.best: List[int] = [NO_MATCH]
+
+        seen = set()
+        for keyword in keywords:
+            if not keyword or keyword in seen:
+                continue
+            seen.add(keyword)
+            self._add(keyword, len(self.keywords))
+            self.keywords.append(keyword)
+        self._build_links()
+
+    def _add(self, keyword: str, index: int) -> None:
+        """트라이에 키워드를 추가합니다."""
+        node = 0
+        for char in keyword:
+            next_node = self.transitions[node].get(char)
+            if next_node is None:
+                next_node = len(self.transitions)
+                self.transitions[node][char] = next_node
+                self.transitions.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+                self.best.append(NO_MATCH)
+            node = next_node
+        self.outputs[node].append(index)
+        if self.best[node] == NO_MATCH:
+            self.best[node] = index
+
+    def _build_links(self) -> None:
+        """너비 우선 탐색으로 실패 링크와 노드별 최우선 키워드를 계산합니다."""
+        queue = deque(self.transitions[0].values())
+        while queue:
+            node = queue.popleft()
+            fail_best = self.best[self.fail[node]]
+            if fail_best != NO_MATCH and (self.best[node] == NO_MATCH or fail_best < self.best[node]):
+                self.best[node] = fail_best
+            for char, child in self.transitions[node].items():
+                # 부모의 실패 링크를 따라가며 같은 문자로 이어지는 노드를 찾음
+                state = self.fail[node]
+                while state and char not in self.transitions[state]:
+                    state = self.fail[state]
+                target = self.transitions[state].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                queue.append(child)
+
+    def _step(self, node: int, char: str) -> int:
+        """현재 노드에서 문자 하나를 읽은 다음 노드를 반환합니다."""
+        transitions = self.transitions
+        while node and char not in transitions[node]:
+            node = self.fail[node]
+        return transitions[node].get(char, 0)
+
+    def find_best(self, text: str) -> str:
+        """메시지에 들어 있는 키워드 중 우선순위가 가장 높은 키워드를 반환합니다 (없으면 빈 문자열)."""
+        best = NO_MATCH
+        node = 0
+        for char in text:
+            node = self._step(node, char)
+            candidate = self.best[node]
+            if candidate != NO_MATCH and (best == NO_MATCH or candidate < best):
+                best = candidate
+                if best == 0:
+                    break
+        return self.keywords[best] if best != NO_MATCH else ""
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """메시지에 들어 있는 모든 키워드를 (끝 위치, 키워드) 목록으로 반환합니다."""
+        matches = []
+        node = 0
+        for position, char in enumerate(text):
+            node = self._step(node, char)
+            state = node
+            while state:
+                for index in self.outputs[state]:
+                    matches.append((position, self.keywords[index]))
+                state = self.fail[state]
+        return matches
+
+    def __len__(self) -> int:
+        return len(self.keywords)
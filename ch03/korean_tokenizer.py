@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+한국어 토큰화 모듈
+메시지를 단어로 나누고 단어 끝의 조사와 어미를 떼어 낸 어간 후보를 만듭니다.
+형태소 분석기 없이 자주 쓰는 조사/어미 목록만으로 처리하므로 가볍고 빠르지만,
+떼어 낸 결과가 틀릴 수 있어 원래 단어도 함께 돌려줍니다 (예: '고양이' -> '고양이', '고양').
+"""
+
+import re
+from typing import List, Set
+
+# 한글, 영문, 숫자가 이어진 부분을 한 단어로 봄
+WORD_PATTERN = re.compile(r'[가-힣]+|[a-z0-9]+')
+
+# 단어 끝에서 떼어 낼 어미 (말투: 안녕하세요, 감사합니다, 이름이에요 ...)
+ENDINGS = (
+    '하십니까', '하세요', '합니다', '해요', '했어요', '할까요', '인가요', '이에요', '입니다',
+    '습니까', '습니다', '세요', '에요', '예요', '어요', '아요', '네요', '나요', '까요', '니다',
+    '요', '야', '다',
+)
+
+# 단어 끝에서 떼어 낼 조사 (이름이, 날씨는, 파이썬으로 ...)
+PARTICLES = (
+    '에서는', '으로는', '에게서', '한테서', '이라고', '까지', '부터', '에서', '에게', '한테', '께서',
+    '으로', '처럼', '보다', '이랑', '라고', '하고', '은', '는', '이', '가', '을', '를', '에', '의',
+    '로', '와', '과', '도', '만', '랑',
+)
+
+# 어간은 최소 한 글자를 남김
+MIN_STEM_LENGTH = 1
+
+
+# 길이별 집합으로 묶어 두어 단어마다 목록 전체가 아니라 길이 수만큼만 비교
+ENDING_SETS = [(length, frozenset(s for s in ENDINGS if len(s) == length))
+               for length in sorted({len(s) for s in ENDINGS}, reverse=True)]
+PARTICLE_SETS = [(length, frozenset(s for s in PARTICLES if len(s) == length))
+                 for length in sorted({len(s) for s in PARTICLES}, reverse=True)]
+
+
+def _strip_suffixes(word: str, suffix_sets: list) -> List[str]:
+    """단어 끝이 접미사 중 하나와 같으면 떼어 낸 어간들을 반환합니다."""
+    return [word[:-length] for length, suffixes in suffix_sets
+            if len(word) - length >= MIN_STEM_LENGTH and word[-length:] in suffixes]
+
+
+def word_forms(word: str) -> Set[str]:
+    """단어 하나의 원형 후보 (원래 단어, 어미를 뗀 형태, 다시 조사까지 뗀 형태)"""
+    forms = {word}
+    if not ('가' <= word[-1] <= '힣'):
+        return forms
+    for stem in [word] + _strip_suffixes(word, ENDING_SETS):
+        forms.add(stem)
+        forms.update(_strip_suffixes(stem, PARTICLE_SETS))
+    return forms
+
+
+def split_words(text: str) -> List[str]:
+    """소문자로 바꾼 메시지를 단어 목록으로 나눕니다 (문장 부호와 공백은 버림)."""
+    return WORD_PATTERN.findall(text.lower())
+
+
+def tokenize(text: str) -> Set[str]:
+    """메시지에 들어 있는 모든 단어의 원형 후보 집합을 반환합니다."""
+    tokens = set()
+    for word in split_words(text):
+        tokens.update(word_forms(word))
+    return tokens
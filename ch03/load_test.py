@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+챗봇 서버 부하 테스트
+asyncio로 클라이언트 N개(기본 1,000개)를 동시에 띄워, 각자 keep-alive 연결 하나로
+/chat에 요청을 계속 보내고 초당 요청 수와 응답 시간 백분위수(p50/p95/p99)를 출력합니다.
+클라이언트마다 서버가 준 세션 쿠키를 보관해 다시 보내고, 메시지를 순서대로 보내므로
+실제 사용자처럼 세션 하나로 여러 턴에 걸쳐 대화합니다 (이전 대화에 따라 답하는 규칙도 측정).
+외부 패키지 없이 HTTP/1.1 요청을 직접 보내므로 클라이언트 쪽 부담이 작습니다.
+
+사용 예:
+    python serve.py                 # 다른 터미널에서 서버 실행
+    python load_test.py
+    python load_test.py --url http://127.0.0.1:5000/chat --clients 1000 --warmup 3 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# 부하 테스트에 보낼 메시지
+MESSAGES = [
+    '안녕하세요', '이름이 뭐예요?', '내일 날씨는 어때요', '지금 시간 알려줘', '도움이 필요해요',
+    '감사합니다', '잘가요', '웹으로 대화하는 거 좋네요', '파이썬으로 만들었어?', 'flask 좋아요',
+    '오늘 뭐 먹지', '아무 말이나 해봐',
+]
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """정렬된 값에서 백분위수 (가장 가까운 순위 방식)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def build_request(host: str, path: str, message: Optional[str], cookie: Optional[str] = None) -> bytes:
+    """/chat POST 요청 바이트 (message가 None이면 GET 요청, 예: /health, cookie는 'name=value' 형식)"""
+    cookie_header = f'Cookie: {cookie}\r\n' if cookie else ''
+    if message is None:
+        return (f'GET {path} HTTP/1.1\r\nHost: {host}\r\n{cookie_header}'
+                f'Connection: keep-alive\r\n\r\n').encode('ascii')
+    body = json.dumps({'message': message}, ensure_ascii=False).encode('utf-8')
+    head = (f'POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n{cookie_header}'
+            f'Content-Length: {len(body)}\r\nConnection: keep-alive\r\n\r\n')
+    return head.encode('ascii') + body
+
+
+async def read_response(reader: asyncio.StreamReader) -> Tuple[int, bool, Optional[str]]:
+    """응답 하나를 끝까지 읽고 (상태 코드, 연결 유지 여부, 받은 쿠키)를 반환합니다 (Content-Length 응답만 지원).
+
+    쿠키는 Set-Cookie의 'name=value' 부분이며 (속성 제외), 없으면 None입니다.
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('서버가 연결을 닫았습니다.')
+    version, status = status_line.split()[:2]
+    # HTTP/1.1은 기본이 연결 유지, HTTP/1.0(Flask 개발 서버)은 기본이 응답 후 연결 종료
+    keep_alive = version == b'HTTP/1.1'
+    length = 0
+    cookie = None
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.partition(b':')
+        name = name.strip().lower()
+        if name == b'content-length':
+            length = int(value)
+        elif name == b'connection':
+            keep_alive = value.strip().lower() == b'keep-alive'
+        elif name == b'set-cookie':
+            cookie = value.split(b';', 1)[0].strip().decode('latin-1')
+    await reader.readexactly(length)
+    return int(status), keep_alive, cookie
+
+
+async def client(host: str, port: int, path: str, messages: Optional[List[str]], measure_from: float,
+                 deadline: float, timeout: float, latencies: List[float], errors: List[str],
+                 rng: random.Random) -> None:
+    """연결 하나로 마감 시각까지 요청을 반복합니다 (연결이 끊기거나 시간이 초과되면 다시 연결).
+
+    measure_from 이전에 시작한 요청(워밍업)은 응답 시간과 오류를 기록하지 않습니다.
+    메시지는 임의의 위치부터 순서대로 보내고, 서버가 준 세션 쿠키를 다음 요청부터 보냅니다
+    (다시 연결해도 같은 세션 유지).
+    """
+    reader = writer = None
+    cookie = None
+    position = rng.randrange(len(messages)) if messages else 0
+    while time.perf_counter() < deadline:
+        # 연결이 없으면 다시 연결하는 시간까지 응답 시간에 포함
+        start = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+            message = None
+            if messages:
+                message = messages[position % len(messages)]
+                position += 1
+            writer.write(build_request(host, path, message, cookie))
+            status, keep_alive, new_cookie = await asyncio.wait_for(read_response(reader), timeout)
+            end = time.perf_counter()
+            cookie = new_cookie or cookie
+            if not keep_alive:
+                writer.close()
+                reader = writer = None
+            if start < measure_from:
+                continue
+            latencies.append(end - start)
+            if status != 200:
+                errors.append(f'HTTP {status}')
+        except (OSError, ValueError, IndexError, asyncio.IncompleteReadError, asyncio.TimeoutError) as error:
+            if start >= measure_from:
+                errors.append(type(error).__name__)
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+            await asyncio.sleep(0.05)
+    if writer is not None:
+        writer.close()
+
+
+async def run(url: str, clients: int, warmup: float, duration: float, timeout: float, seed: int,
+              messages: Optional[List[str]] = MESSAGES):
+    """클라이언트를 동시에 실행하고 (지연 시간 목록, 오류 목록, 측정 시간)을 반환합니다.
+
+    messages를 클라이언트마다 임의의 위치부터 순서대로 POST로 보내며, messages가 None이면 GET 요청을 보냅니다.
+    처음 warmup초 동안은 연결 1,000개가 한꺼번에 맺어지는 구간이라 측정에서 뺍니다.
+    """
+    parts = urlsplit(url)
+    host, port, path = parts.hostname, parts.port or 80, parts.path or '/'
+    latencies: List[float] = []
+    errors: List[str] = []
+    measure_from = time.perf_counter() + warmup
+    deadline = measure_from + duration
+    await asyncio.gather(*(client(host, port, path, messages, measure_from, deadline, timeout, latencies, errors,
+                                  random.Random(seed + i))
+                           for i in range(clients)))
+    return latencies, errors, time.perf_counter() - measure_from
+
+
+def summarize(latencies: List[float], errors: List[str], elapsed: float) -> dict:
+    """측정 결과 요약 (처리량, 백분위수 ms, 오류 종류별 개수)"""
+    latencies = sorted(latencies)
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'error_kinds': {kind: errors.count(kind) for kind in set(errors)},
+        'elapsed_sec': round(elapsed, 3),
+        'rps': round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'max_ms': round(latencies[-1] * 1000, 2) if latencies else 0.0,
+    }
+
+
+def print_summary(title: str, summary: dict) -> None:
+    """요약 결과 출력"""
+    print(f"=== {title} ({summary['elapsed_sec']:.1f}초) ===")
+    print(f"  완료 요청: {summary['requests']}개, 오류: {summary['errors']}개")
+    if summary['error_kinds']:
+        print(f"  오류 종류: {summary['error_kinds']}")
+    print(f"  처리량: {summary['rps']:8.1f} req/s")
+    for percent in (50, 95, 99):
+        print(f"  p{percent}: {summary[f'p{percent}_ms']:8.1f} ms")
+    print(f"  최대: {summary['max_ms']:8.1f} ms")
+
+
+def raise_open_file_limit(needed: int) -> None:
+    """동시 연결 수만큼 파일 디스크립터를 쓸 수 있도록 한도를 올립니다 (Windows는 해당 없음)."""
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < needed:
+        new_soft = needed if hard == resource.RLIM_INFINITY else min(needed, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (new_soft, hard))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='챗봇 서버 부하 테스트')
+    parser.add_argument('--url', default='http://127.0.0.1:5000/chat', help='/chat 주소')
+    parser.add_argument('--clients', type=int, default=1000, help='동시 클라이언트 수')
+    parser.add_argument('--warmup', type=float, default=3.0, help='측정 전 워밍업 시간 (초)')
+    parser.add_argument('--duration', type=float, default=10.0, help='측정 시간 (초)')
+    parser.add_argument('--timeout', type=float, default=10.0, help='요청 하나의 제한 시간 (초)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    raise_open_file_limit(args.clients + 100)
+    latencies, errors, elapsed = asyncio.run(run(args.url, args.clients, args.warmup,
+                                                    args.duration, args.timeout, args.seed))
+    print_summary(f'{args.url} (클라이언트 {args.clients}개)', summarize(latencies, errors, elapsed))
+
+
+if __name__ == '__main__':
+    main()
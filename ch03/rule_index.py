@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+규칙 역색인 모듈
+토큰 -> 그 토큰을 키워드로 쓰는 규칙 번호 목록을 시작할 때 한 번 만들어 둡니다.
+메시지를 토큰화한 뒤 토큰마다 색인을 한 번씩만 찾으므로, 규칙이 많아도
+메시지에 나온 토큰과 관련된 규칙만 살펴봅니다.
+키워드가 여러 개인 규칙은 모든 키워드가 메시지에 있어야 일치합니다.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Sequence
+
+from korean_tokenizer import split_words, tokenize
+
+# 일치하는 규칙이 없을 때의 규칙 번호
+NO_MATCH = -1
+
+
+class RuleIndex:
+    """토큰 기반 규칙 역색인
+
+    규칙 번호는 전달된 순서이며, 여러 규칙이 일치하면 번호가 가장 작은 규칙을 고릅니다.
+    """
+
+    def __init__(self, rule_keywords: Iterable[Sequence[str]]):
+        """규칙별 필수 키워드 목록으로 색인을 만듭니다."""
+        # 토큰 -> 규칙 번호 배열 (array는 리스트보다 규칙 번호당 메모리를 적게 씀)
+        self.postings: Dict[str, array] = {}
+        # 규칙별로 일치해야 하는 서로 다른 토큰 수
+        self.required = array('H')
+
+        for rule_id, keywords in enumerate(rule_keywords):
+            tokens = {word for keyword in keywords for word in split_words(keyword)}
+            for token in tokens:
+                posting = self.postings.get(token)
+                if posting is None:
+                    posting = self.postings[token] = array('I')
+                posting.append(rule_id)
+            self.required.append(len(tokens))
+
+    def find_all(self, text: str) -> List[int]:
+        """메시지와 일치하는 모든 규칙 번호를 작은 순서로 반환합니다."""
+        hits: Dict[int, int] = {}
+        postings = self.postings
+        for token in tokenize(text):
+            posting = postings.get(token)
+            if posting is not None:
+                for rule_id in posting:
+                    hits[rule_id] = hits.get(rule_id, 0) + 1
+        required = self.required
+        return sorted(rule_id for rule_id, count in hits.items() if count == required[rule_id])
+
+    def find_best(self, text: str) -> int:
+        """메시지와 일치하는 규칙 중 번호가 가장 작은 규칙 번호를 반환합니다 (없으면 NO_MATCH)."""
+        matches = self.find_all(text)
+        return matches[0] if matches else NO_MATCH
+
+    def __len__(self) -> int:
+        return len(self.required)
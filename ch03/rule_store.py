@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대화 규칙 저장소 모듈
+대화 규칙을 JSON 파일에서 읽어 토큰 역색인, 키워드 매처, 의도 분류기까지 미리 만든 스냅샷(RuleSet)으로 보관합니다.
+감시 스레드가 파일 변경을 확인해 새 스냅샷을 만든 뒤 참조 하나만 바꿔 끼우므로,
+처리 중인 요청은 잠금 없이 자기가 받은 스냅샷을 끝까지 사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from string import Formatter
+from typing import Callable, Dict, List, Optional, Pattern, Set, Tuple
+
+from intent_classifier import HashingTfidfEmbedder, IntentClassifier, embedder_factory
+from keyword_matcher import KeywordMatcher
+from korean_tokenizer import split_words
+from rule_index import NO_MATCH, RuleIndex
+
+# 기본 규칙 파일 경로 (이 파일과 같은 폴더의 rules.json)
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rules.json')
+
+# 파일 변경을 확인하는 주기 (초)
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+def rule_keywords_of(rule: dict) -> List[str]:
+    """규칙의 필수 키워드 목록 ('keyword' 하나 또는 'keywords' 여러 개)"""
+    if 'keywords' in rule:
+        return [keyword for keyword in rule['keywords'] if keyword]
+    return [rule['keyword']] if rule.get('keyword') else []
+
+
+class RuleSet:
+    """한 시점의 대화 규칙 스냅샷 (만든 뒤에는 바꾸지 않음)"""
+
+    def __init__(self, rules: List[dict], default_responses: List[str], version: str,
+                 make_embedder: Callable[[], object] = HashingTfidfEmbedder):
+        """규칙 목록으로 키워드 -> 응답 사전, 토큰 역색인, 키워드 매처, 의도 분류기를 만듭니다."""
+        self.version = version
+        self.loaded_at = time.strftime('%Y-%m-%d %H:%M:%S')
+        self.default_responses = list(default_responses)
+        # 규칙 이름(키워드를 공백으로 이은 문자열): 응답 목록 (규칙 파일 순서 = 우선순위)
+        self.conversation_rules: Dict[str, List[str]] = {}
+        # 규칙 이름: 응답별로 채워야 하는 슬롯 이름 ('{user_name}님' -> {'user_name'})
+        self.response_fields: Dict[str, List[Set[str]]] = {}
+        # 규칙 이름: (슬롯 이름, 값을 뽑을 정규식) 목록
+        self.captures: Dict[str, List[Tuple[str, Pattern]]] = {}
+        # 규칙 번호별 문맥 (직전에 이 이름의 규칙이 일치했을 때만 사용, 없으면 None)
+        self.rule_contexts: List[Optional[str]] = []
+        rule_keywords = []
+        rule_examples = []
+        for rule in rules:
+            keywords = tuple(keyword.lower() for keyword in rule_keywords_of(rule))
+            context = rule.get('context')
+            name = ' '.join(keywords) if context is None else f'{context} > {" ".join(keywords)}'
+            if name not in self.conversation_rules:
+                self.conversation_rules[name] = list(rule['responses'])
+                self.response_fields[name] = [{field for _, field, _, _ in Formatter().parse(response) if field}
+                                              for response in rule['responses']]
+                self.captures[name] = [(slot, re.compile(pattern))
+                                       for slot, pattern in rule.get('capture', {}).items()]
+                self.rule_contexts.append(context)
+                rule_keywords.append(keywords)
+                # 문맥 규칙은 직전 대화가 있어야 의미가 있으므로 토큰 일치로만 찾음
+                rule_examples.append([example.lower() for example in rule.get('examples', [])]
+                                     if context is None else [])
+        self.rule_names = list(self.conversation_rules)
+        # 1순위: 조사/어미를 뗀 토큰으로 규칙 찾기 (키워드 여러 개인 규칙, 문맥 규칙 포함)
+        self.rule_index = RuleIndex(rule_keywords)
+        # 2순위: 띄어쓰기 없이 붙여 쓴 메시지('오늘날씨어때')는 키워드 하나짜리 규칙을 부분 문자열로 찾기
+        self.keyword_matcher = KeywordMatcher(keywords[0] for keywords, context in zip(rule_keywords, self.rule_contexts)
+                                              if len(keywords) == 1 and context is None)
+        # 3순위: 키워드가 없으면 예문('examples')이 있는 규칙 중 의미가 가장 비슷한 규칙 찾기
+        self.intent_rule_ids = [rule_id for rule_id, examples in enumerate(rule_examples) if examples]
+        self.intent_classifier = None
+        if self.intent_rule_ids:
+            self.intent_classifier = IntentClassifier([rule_examples[rule_id] for rule_id in self.intent_rule_ids],
+                                                      make_embedder())
+
+    def find_rule(self, text: str, previous_rule: str = "") -> str:
+        """메시지와 일치하는 규칙 이름을 반환합니다 (없으면 빈 문자열).
+
+        토큰 일치를 먼저 찾고, 메시지가 띄어쓰기 없는 한 덩어리일 때만 부분 문자열로 다시 찾습니다.
+        띄어 쓴 메시지에서는 '시간표'처럼 다른 단어 안에 들어 있는 키워드와 일치시키지 않습니다.
+        키워드로 찾지 못한 메시지만 의도 분류기로 넘기므로, 대부분의 메시지는 빠른 경로에서 끝납니다.
+        문맥 규칙은 직전에 일치한 규칙(previous_rule)이 규칙의 context와 같을 때만 고릅니다.
+        """
+        for rule_id in self.rule_index.find_all(text):
+            context = self.rule_contexts[rule_id]
+            if context is None or context == previous_rule:
+                return self.rule_names[rule_id]
+        if len(split_words(text)) == 1:
+            keyword = self.keyword_matcher.find_best(text)
+            if keyword:
+                return keyword
+        if self.intent_classifier is not None:
+            intent_id, _ = self.intent_classifier.classify(text)
+            if intent_id != NO_MATCH:
+                return self.rule_names[self.intent_rule_ids[intent_id]]
+        return ""
+
+    def capture_slots(self, rule_name: str, text: str) -> Dict[str, str]:
+        """규칙의 capture 정규식으로 메시지에서 슬롯 값을 뽑습니다."""
+        slots = {}
+        for slot, pattern in self.captures.get(rule_name, ()):
+            match = pattern.search(text)
+            if match:
+                slots[slot] = match.group(1) if pattern.groups else match.group(0)
+        return slots
+
+    def responses_for(self, rule_name: str, slots: Dict[str, str]) -> List[str]:
+        """슬롯 값을 채울 수 있는 응답 목록 (슬롯을 쓰는 응답을 우선, 하나도 없으면 빈 목록)"""
+        candidates = [(response, fields) for response, fields
+                      in zip(self.conversation_rules.get(rule_name, ()), self.response_fields.get(rule_name, ()))
+                      if fields <= slots.keys()]
+        with_slots = [response.format_map(slots) for response, fields in candidates if fields]
+        return with_slots or [response for response, _ in candidates]
+
+    @classmethod
+    def from_file(cls, path: str, make_embedder: Callable[[], object] = HashingTfidfEmbedder) -> 'RuleSet':
+        """JSON 규칙 파일을 읽어 스냅샷을 만듭니다 (형식이 잘못되면 예외 발생)."""
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw.decode('utf-8'))
+        rules = data['rules']
+        default_responses = data['default_responses']
+        if not default_responses:
+            raise ValueError('default_responses가 비어 있습니다.')
+        for rule in rules:
+            if not rule_keywords_of(rule) or not rule.get('responses'):
+                raise ValueError(f'keyword(또는 keywords)와 responses가 필요합니다: {rule}')
+        # 파일 내용의 해시를 버전으로 사용 (같은 파일을 읽은 프로세스는 모두 같은 버전)
+        version = hashlib.sha256(raw).hexdigest()[:12]
+        return cls(rules, default_responses, version, make_embedder)
+
+    def __len__(self) -> int:
+        return len(self.conversation_rules)
+
+
+class RuleStore:
+    """규칙 파일을 감시하며 최신 RuleSet을 제공하는 저장소"""
+
+    def __init__(self, path: str = DEFAULT_RULES_PATH, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 intent_model: Optional[str] = None):
+        """규칙 파일을 처음 읽습니다 (실패하면 예외가 발생해 서버가 시작되지 않음).
+
+        intent_model에 sentence-transformers 모델 이름을 주면 의도 분류에 문장 임베딩을 사용합니다.
+        """
+        self.path = path
+        self.poll_interval = poll_interval
+        self.make_embedder = embedder_factory(intent_model)
+        self._mtime = self._stat()
+        self.current: RuleSet = RuleSet.from_file(path, self.make_embedder)
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    def _stat(self) -> Optional[int]:
+        """파일 수정 시각 (ns, 파일이 없으면 None)"""
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def reload(self) -> bool:
+        """파일을 다시 읽어 스냅샷을 교체합니다 (실패하면 이전 스냅샷 유지, 교체했으면 True)."""
+        try:
+            rule_set = RuleSet.from_file(self.path, self.make_embedder)
+        except Exception as error:
+            print(f'규칙 파일 다시 읽기 실패 ({self.path}): {error}')
+            return False
+        if rule_set.version == self.current.version:
+            return False
+        # 참조 하나만 바꾸므로 처리 중인 요청은 이전 스냅샷을 그대로 사용
+        self.current = rule_set
+        print(f'규칙 다시 읽음: 버전 {rule_set.version}, 규칙 {len(rule_set)}개')
+        return True
+
+    def check_for_changes(self) -> bool:
+        """파일 수정 시각이 바뀌었으면 다시 읽습니다."""
+        mtime = self._stat()
+        if mtime is None or mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        return self.reload()
+
+    def _watch(self) -> None:
+        """감시 스레드 본체"""
+        while not self._stop.wait(self.poll_interval):
+            self.check_for_changes()
+
+    def start_watching(self) -> 'RuleStore':
+        """파일 감시 스레드를 시작합니다."""
+        if self._watcher is None:
+            self._watcher = threading.Thread(target=self._watch, name='rule-watcher', daemon=True)
+            self._watcher.start()
+        return self
+
+    def stop_watching(self) -> None:
+        """파일 감시 스레드를 멈춥니다."""
+        self._stop.set()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+운영용 챗봇 서버 실행 스크립트
+Flask 개발 서버(app.py 직접 실행) 대신 waitress WSGI 서버로 같은 app을 실행합니다.
+/chat, /health 등 API는 그대로이며, 디버그 모드와 자동 재시작 없이 스레드 풀로 요청을 처리합니다.
+waitress는 순수 파이썬 서버라 Windows와 Linux에서 똑같이 동작합니다.
+
+사용 예:
+    python serve.py
+    python serve.py --port 8000 --threads 8 --connection-limit 2000
+"""
+
+import argparse
+
+from waitress import serve
+
+from app import app
+
+
+def main():
+    parser = argparse.ArgumentParser(description='챗봇 서버 (waitress)')
+    parser.add_argument('--host', default='0.0.0.0', help='바인드할 주소')
+    parser.add_argument('--port', type=int, default=5000, help='포트')
+    # /chat은 짧은 CPU 작업이라 스레드를 많이 두어도 GIL 때문에 빨라지지 않고 전환 비용만 늘어남
+    parser.add_argument('--threads', type=int, default=8, help='요청 처리 스레드 수')
+    # 동시 연결(keep-alive 포함)은 스레드 수와 따로 관리되므로 많은 클라이언트를 받을 수 있음
+    parser.add_argument('--connection-limit', type=int, default=2000, help='최대 동시 연결 수')
+    parser.add_argument('--backlog', type=int, default=2048, help='소켓 대기열 크기')
+    args = parser.parse_args()
+
+    # waitress는 WebSocket을 지원하지 않으므로 브라우저는 POST /chat으로 대화
+    app.config['WEBSOCKET'] = False
+
+    print(f'챗봇 서버 시작: http://{args.host}:{args.port} '
+          f'(스레드 {args.threads}개, 최대 연결 {args.connection_limit}개)')
+    serve(app, host=args.host, port=args.port, threads=args.threads,
+          connection_limit=args.connection_limit, backlog=args.backlog,
+          channel_timeout=60, ident='WebBot',
+          # select()는 파일 디스크립터 1024개까지만 지원하므로 poll() 사용
+          asyncore_use_poll=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대화 세션 저장소 모듈
+세션 쿠키별로 최근에 일치한 규칙과 기억한 값(슬롯)을 보관해 여러 턴에 걸친 대화를 가능하게 합니다.
+
+- 기본: 프로세스 메모리 (마지막 사용 후 TTL이 지나면 삭제, 세션 수 상한을 넘으면 가장 오래 안 쓴 세션부터 삭제)
+- 선택: Redis 호환 서버 (redis 패키지 필요, 여러 서버 프로세스가 세션을 공유)
+세션 하나의 크기도 제한하므로 트래픽이 몰려도 메모리 사용량은 (세션 수 상한 x 세션 최대 크기)를 넘지 않습니다.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# 마지막 사용 후 세션을 보관하는 시간 (초)
+DEFAULT_TTL = 30 * 60
+
+# 메모리 저장소의 최대 세션 수
+DEFAULT_MAX_SESSIONS = 10000
+
+# 세션 하나에 보관하는 최근 규칙 수, 슬롯 수, 슬롯 값 길이
+MAX_HISTORY = 3
+MAX_SLOTS = 8
+MAX_SLOT_LENGTH = 50
+
+
+class SessionState:
+    """세션 하나의 대화 상태 (최근 일치한 규칙 이름과 슬롯 값)"""
+
+    __slots__ = ('history', 'slots')
+
+    def __init__(self, history=(), slots: Optional[Dict[str, str]] = None):
+        self.history = tuple(history)[-MAX_HISTORY:]
+        self.slots: Dict[str, str] = dict(slots or {})
+
+    @property
+    def last_rule(self) -> str:
+        """직전에 일치한 규칙 이름 (없으면 빈 문자열)"""
+        return self.history[-1] if self.history else ""
+
+    def record(self, rule_name: str) -> None:
+        """일치한 규칙을 기록합니다 (최근 MAX_HISTORY개만 보관)."""
+        self.history = (self.history + (rule_name,))[-MAX_HISTORY:]
+
+    def set_slot(self, name: str, value: str) -> None:
+        """슬롯 값을 저장합니다 (슬롯 수와 값 길이 제한)."""
+        if name not in self.slots and len(self.slots) >= MAX_SLOTS:
+            return
+        self.slots[name] = value[:MAX_SLOT_LENGTH]
+
+    def copy(self) -> 'SessionState':
+        """독립적으로 고칠 수 있는 복사본"""
+        return SessionState(self.history, self.slots)
+
+    def to_json(self) -> str:
+        return json.dumps({'history': self.history, 'slots': self.slots}, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, raw: str) -> 'SessionState':
+        data = json.loads(raw)
+        return cls(data.get('history', ()), data.get('slots'))
+
+
+class MemorySessionStore:
+    """프로세스 메모리 세션 저장소 (TTL + 세션 수 상한)"""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        # 세션 ID -> (마지막 사용 시각, 상태), 가장 오래 안 쓴 세션이 앞쪽
+        self._sessions: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float) -> None:
+        """만료된 세션과 상한을 넘는 세션을 앞쪽(오래된 쪽)부터 삭제합니다 (잠금 안에서 호출)."""
+        sessions = self._sessions
+        while sessions:
+            used_at, _ = next(iter(sessions.values()))
+            if now - used_at < self.ttl and len(sessions) <= self.max_sessions:
+                break
+            sessions.popitem(last=False)
+
+    def get(self, session_id: str) -> Optional[SessionState]:
+        """세션 상태의 복사본을 반환합니다 (없거나 만료되었으면 None).
+
+        같은 쿠키로 동시에 들어온 요청이 한 객체를 잠금 없이 함께 고치지 않도록 복사본을 주며,
+        고친 상태는 save로 저장합니다 (Redis 저장소와 같이 나중에 저장한 쪽이 남음).
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            entry = self._sessions.get(session_id)
+            return entry[1].copy() if entry else None
+
+    def save(self, session_id: str, state: SessionState) -> None:
+        """세션 상태를 저장하고 마지막 사용 시각을 갱신합니다."""
+        now = time.monotonic()
+        with self._lock:
+            self._sessions[session_id] = (now, state)
+            self._sessions.move_to_end(session_id)
+            self._evict(now)
+
+    def count(self) -> Optional[int]:
+        """보관 중인 세션 수"""
+        return len(self._sessions)
+
+
+class RedisSessionStore:
+    """Redis 호환 서버 세션 저장소 (만료는 Redis TTL, 메모리 상한은 서버의 maxmemory 설정으로 관리)"""
+
+    def __init__(self, url: str, ttl: float = DEFAULT_TTL, prefix: str = 'chat_session:'):
+        # redis 패키지가 없으면 ImportError가 발생하므로 호출한 쪽에서 메모리 저장소로 대체
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl = int(ttl)
+        self.prefix = prefix
+
+    def get(self, session_id: str) -> Optional[SessionState]:
+        raw = self.client.get(self.prefix + session_id)
+        return SessionState.from_json(raw) if raw else None
+
+    def save(self, session_id: str, state: SessionState) -> None:
+        self.client.set(self.prefix + session_id, state.to_json(), ex=self.ttl)
+
+    def count(self) -> Optional[int]:
+        """세션 수를 세려면 키 전체를 훑어야 하므로 None (알 수 없음)"""
+        return None
+
+
+def make_session_store(url: Optional[str] = None, ttl: float = DEFAULT_TTL,
+                       max_sessions: int = DEFAULT_MAX_SESSIONS):
+    """redis:// 주소가 있고 redis 패키지를 쓸 수 있으면 Redis 저장소, 아니면 메모리 저장소"""
+    if url:
+        try:
+            return RedisSessionStore(url, ttl)
+        except ImportError:
+            print('redis 패키지가 설치되어 있지 않아 메모리 세션 저장소를 사용합니다.')
+    return MemorySessionStore(ttl, max_sessions)
@@ -8,6 +8,8 @@
 import re
 from typing import Dict, List, Tuple
 
+from keyword_matcher import KeywordMatcher
+
 class SimpleChatbot:
     """간단한 룰 기반 챗봇 클래스"""
     
@@ -24,6 +26,9 @@ class SimpleChatbot:
             '잘가': ['안녕히 가세요!', '다음에 또 만나요!', '좋은 하루 되세요!']
         }
         
+        # 모든 키워드를 메시지 한 번 훑기로 찾는 매처 (시작할 때 한 번만 생성)
+        self.keyword_matcher = KeywordMatcher(self.conversation_rules.keys())
+        
         # 기본 응답 (규칙에 맞지 않을 때)
         self.default_responses = [
             '죄송해요, 이해하지 못했어요.',
@@ -41,11 +46,8 @@ class SimpleChatbot:
         return processed_input
     
     def find_matching_keyword(self, user_input: str) -> str:
-        """사용자 입력에서 매칭되는 키워드를 찾습니다."""
-        for keyword in self.conversation_rules.keys():
-            if keyword in user_input:
-                return keyword
-        return ""
+        """사용자 입력에서 매칭되는 키워드를 찾습니다 (여러 개면 규칙 순서상 앞선 키워드)."""
+        return self.keyword_matcher.find_best(user_input)
     
     def get_response(self, keyword: str) -> str:
         """키워드에 해당하는 응답을 반환합니다."""
@@ -11,6 +11,12 @@ const welcomeTime = document.getElementById("welcomeTime");
 // 전역 변수
 let isProcessing = false;
 
+// WebSocket 연결 (서버가 지원하지 않거나 연결이 끊겨 있으면 POST /chat 사용)
+let chatSocket = null;
+let socketRetryDelay = 1000;
+let nextMessageId = 1;
+const pendingReplies = new Map(); // 메시지 id -> 응답 조각을 표시할 말풍선과 Promise 콜백
+
 // 페이지 로드 시 초기화
 document.addEventListener("DOMContentLoaded", function () {
   // 환영 메시지 시간 설정
@@ -19,6 +25,9 @@ document.addEventListener("DOMContentLoaded", function () {
   // 이벤트 리스너 등록
   setupEventListeners();
 
+  // 서버가 WebSocket을 지원하면 연결
+  checkWebSocketSupport();
+
   // 입력 필드에 포커스
   messageInput.focus();
 });
@@ -87,23 +96,13 @@ async function sendMessage() {
     // 로딩 인디케이터 표시
     showLoadingIndicator();
 
-    // 서버에 메시지 전송
-    const response = await fetch("/chat", {
-      method: "POST",
-      headers: {
-        "Content-Type": "application/json",
-      },
-      body: JSON.stringify({ message: message }),
-    });
+    // WebSocket으로 보내고 응답 조각을 받는 대로 표시 (불가능하면 POST로 전송)
+    if (!(await sendOverSocket(message))) {
+      const data = await postMessage(message);
 
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
+      // 봇 응답 표시
+      addBotMessage(data.response, data.timestamp);
     }
-
-    const data = await response.json();
-
-    // 봇 응답 표시
-    addBotMessage(data.response, data.timestamp);
   } catch (error) {
     console.error("메시지 전송 오류:", error);
     addBotMessage(
@@ -121,6 +120,117 @@ async function sendMessage() {
   }
 }
 
+// POST /chat으로 메시지 전송
+async function postMessage(message) {
+  const response = await fetch("/chat", {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json",
+    },
+    body: JSON.stringify({ message: message }),
+  });
+
+  if (!response.ok) {
+    throw new Error(`HTTP error! status: ${response.status}`);
+  }
+
+  return response.json();
+}
+
+// 서버의 WebSocket 지원 여부 확인
+async function checkWebSocketSupport() {
+  if (!("WebSocket" in window)) {
+    return;
+  }
+  try {
+    const response = await fetch("/health");
+    const data = await response.json();
+    if (data.websocket) {
+      connectSocket();
+    }
+  } catch (error) {
+    console.log("WebSocket 없이 POST로 대화합니다.", error);
+  }
+}
+
+// WebSocket 연결 (끊기면 점점 간격을 늘려 다시 연결)
+function connectSocket() {
+  const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
+  const socket = new WebSocket(`${protocol}//${window.location.host}/ws`);
+
+  socket.addEventListener("open", function () {
+    chatSocket = socket;
+    socketRetryDelay = 1000;
+  });
+
+  socket.addEventListener("message", function (event) {
+    handleSocketMessage(JSON.parse(event.data));
+  });
+
+  socket.addEventListener("close", function () {
+    chatSocket = null;
+    // 응답을 기다리던 메시지는 POST로 다시 보내도록 실패 처리
+    pendingReplies.forEach((pending) => pending.fail());
+    pendingReplies.clear();
+    setTimeout(connectSocket, socketRetryDelay);
+    socketRetryDelay = Math.min(socketRetryDelay * 2, 30000);
+  });
+}
+
+// WebSocket으로 메시지 전송 (응답이 끝나면 true, 보낼 수 없거나 실패하면 false)
+function sendOverSocket(message) {
+  if (!chatSocket || chatSocket.readyState !== WebSocket.OPEN) {
+    return Promise.resolve(false);
+  }
+  return new Promise(function (resolve) {
+    const id = nextMessageId++;
+    const pending = {
+      element: null,
+      done: () => resolve(true),
+      fail: function () {
+        // 일부만 표시된 응답은 지우고 POST로 다시 받음
+        if (pending.element) {
+          pending.element.remove();
+        }
+        resolve(false);
+      },
+    };
+    pendingReplies.set(id, pending);
+    chatSocket.send(JSON.stringify({ id: id, message: message }));
+  });
+}
+
+// WebSocket 응답 처리 (chunk: 응답 조각, done: 응답 끝, error: 처리 실패)
+function handleSocketMessage(data) {
+  const pending = pendingReplies.get(data.id);
+  if (!pending) {
+    return;
+  }
+
+  if (data.type === "error") {
+    pendingReplies.delete(data.id);
+    pending.fail();
+    return;
+  }
+
+  // 첫 조각이 오면 로딩 인디케이터 대신 말풍선을 표시하고 이후 조각을 이어 붙임
+  if (!pending.element) {
+    hideLoadingIndicator();
+    pending.element = createBotMessageElement("", "");
+    chatMessages.appendChild(pending.element);
+  }
+  const [textDiv, timeDiv] = pending.element.firstChild.children;
+
+  if (data.type === "chunk") {
+    textDiv.textContent += data.text;
+  } else if (data.type === "done") {
+    timeDiv.textContent = data.timestamp;
+    pendingReplies.delete(data.id);
+    pending.done();
+  }
+  scrollToBottom();
+}
+
 // 사용자 메시지 추가
 function addUserMessage(message) {
   const messageElement = createUserMessageElement(message, getCurrentTime());
@@ -1,11 +1,13 @@
 import os
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from typing import List, Optional, Tuple
 from flask import Flask, render_template, request, jsonify
 from PIL import Image
 from werkzeug.datastructures import FileStorage
 
 # 내부 모듈 임포트
 from image_analyzer import ImageAnalyzer
+from inference_queue import InferenceQueue
 
 # Flask 앱 생성
 app = Flask(__name__)
@@ -14,18 +16,65 @@ app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
 app.config['ALLOWED_EXTENSIONS'] = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'}
 
-# 이미지 분석기 전역 초기화
+# /analyze_batch 요청 하나에 받을 수 있는 최대 이미지 수
+MAX_BATCH_IMAGES = 32
+
+# /analyze_batch에서 이미지 URL을 동시에 내려받는 최대 개수와 전체 제한 시간(초)
+URL_FETCH_WORKERS = 8
+URL_FETCH_TIMEOUT = 15
+url_fetch_pool = ThreadPoolExecutor(max_workers=URL_FETCH_WORKERS, thread_name_prefix='url-fetch')
+
+# 추론 큐 설정: 배치 최대 이미지 수, 요청을 더 모으는 최대 대기 시간(초), 결과를 기다리는 최대 시간(초)
+app.config['INFERENCE_MAX_BATCH_SIZE'] = int(os.environ.get('INFERENCE_MAX_BATCH_SIZE', 16))
+app.config['INFERENCE_MAX_DELAY'] = float(os.environ.get('INFERENCE_MAX_DELAY', 0.01))
+app.config['INFERENCE_TIMEOUT'] = float(os.environ.get('INFERENCE_TIMEOUT', 30))
+
+# 이미지 분석기 전역 초기화 (모델은 추론 큐의 작업 스레드만 사용)
 image_analyzer: Optional[ImageAnalyzer] = None
+inference_queue: Optional[InferenceQueue] = None
 
 
 def init_analyzer() -> None:
-    """서버 시작 시 이미지 분석기를 초기화"""
-    global image_analyzer
+    """서버 시작 시 이미지 분석기와 추론 큐를 초기화"""
+    global image_analyzer, inference_queue
     image_analyzer = ImageAnalyzer()
     loaded = image_analyzer.load_model()
     if not loaded:
         # 초기화 실패 시에도 앱은 기동되지만, 요청 시 에러 반환
         print("[경고] 이미지 분석기 초기화 실패")
+        return
+    inference_queue = InferenceQueue(
+        image_analyzer,
+        max_batch_size=app.config['INFERENCE_MAX_BATCH_SIZE'],
+        max_delay=app.config['INFERENCE_MAX_DELAY'],
+    )
+    inference_queue.start()
+
+
+def model_unavailable_response():
+    """모델이 로드되지 않았을 때의 응답"""
+    return jsonify({
+        'success': False,
+        'error': '서버 초기화 중 문제로 모델이 로드되지 않았습니다. 잠시 후 다시 시도해주세요.'
+    }), 503
+
+
+def run_inference(images: List[Image.Image]):
+    """추론 큐에 이미지 분석을 요청하고 결과를 기다림
+    반환: (이미지별 분석 결과 목록, 오류 응답)
+    """
+    future = inference_queue.submit(images)
+    if future is None:
+        return None, (jsonify({'success': False, 'error': '요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.'}), 503)
+    try:
+        batch_results = future.result(timeout=app.config['INFERENCE_TIMEOUT'])
+    except FutureTimeoutError:
+        # 아직 배치에 들어가지 않았으면 취소해 작업 스레드가 건너뛰게 함
+        future.cancel()
+        return None, (jsonify({'success': False, 'error': '이미지 분석 시간이 초과되었습니다.'}), 504)
+    if batch_results is None:
+        return None, (jsonify({'success': False, 'error': '이미지 분석에 실패했습니다.'}), 500)
+    return batch_results, None
 
 
 def is_allowed_file(filename: str) -> bool:
@@ -44,11 +93,25 @@ def load_image_from_filestorage(file_storage: FileStorage) -> Tuple[Optional[Ima
         if not is_allowed_file(file_storage.filename):
             return None, f"지원하지 않는 파일 형식입니다. 허용 확장자: {', '.join(sorted(app.config['ALLOWED_EXTENSIONS']))}"
         image = Image.open(file_storage.stream)
+        # open은 헤더만 읽으므로 여기서 끝까지 디코딩해 손상/잘린 파일을 이 항목의 오류로 처리
+        image.load()
         return image, None
     except Exception:
         return None, "이미지 파일을 열 수 없습니다. 손상되었거나 잘못된 형식일 수 있습니다."
 
 
+def simplify_results(analysis_results: List[dict]) -> List[dict]:
+    """상위 결과를 간단히 정리"""
+    return [
+        {
+            'label': item['label'],
+            'confidence': item['confidence'],
+            'probability': item['probability']
+        }
+        for item in analysis_results
+    ]
+
+
 @app.route('/', methods=['GET'])
 def index():
     """메인 페이지 렌더링"""
@@ -60,11 +123,8 @@ def analyze():
     """이미지 분석 API 엔드포인트
     - 업로드 파일 또는 이미지 URL 중 하나를 받아 분석 결과(JSON) 반환
     """
-    if image_analyzer is None or not image_analyzer.is_loaded:
-        return jsonify({
-            'success': False,
-            'error': '서버 초기화 중 문제로 모델이 로드되지 않았습니다. 잠시 후 다시 시도해주세요.'
-        }), 503
+    if inference_queue is None:
+        return model_unavailable_response()
 
     # 입력 소스 식별: 파일 또는 URL
     image: Optional[Image.Image] = None
@@ -93,28 +153,94 @@ def analyze():
             'error': error_message or '이미지 파일 또는 URL을 제공해주세요.'
         }), 400
 
-    # 분석 수행
-    analysis_results = image_analyzer.analyze_image(image)
-    if not analysis_results:
-        return jsonify({'success': False, 'error': '이미지 분석에 실패했습니다.'}), 500
+    # 분석 수행 (추론 큐에서 다른 요청과 함께 배치로 처리)
+    batch_results, error_response = run_inference([image])
+    if error_response is not None:
+        return error_response
+    analysis_results = batch_results[0]
 
     description = image_analyzer.describe_image(analysis_results)
 
-    # 상위 결과를 간단히 정리하여 반환
-    simplified_results = [
-        {
-            'label': item['label'],
-            'confidence': item['confidence'],
-            'probability': item['probability']
-        }
-        for item in analysis_results
-    ]
-
     return jsonify({
         'success': True,
         'source_type': source_type,
         'description': description,
-        'results': simplified_results
+        'results': simplify_results(analysis_results)
+    })
+
+
+@app.route('/analyze_batch', methods=['POST'])
+def analyze_batch():
+    """여러 이미지 분석 API 엔드포인트
+    - 업로드 파일 여러 개('images')와 이미지 URL 여러 개('image_urls')를 받아 한 번에 분석
+    - 이미지별 결과를 요청 순서대로 반환 (불러오지 못한 이미지는 해당 항목에만 오류 표시)
+    """
+    if inference_queue is None:
+        return model_unavailable_response()
+
+    # 이미지 수를 먼저 확인해 너무 많으면 다운로드/디코딩 전에 거절
+    uploaded_files = request.files.getlist('images')
+    image_urls = [image_url.strip() for image_url in request.form.getlist('image_urls') if image_url.strip()]
+    item_count = len(uploaded_files) + len(image_urls)
+    if item_count == 0:
+        return jsonify({'success': False, 'error': '이미지 파일 또는 URL을 하나 이상 제공해주세요.'}), 400
+    if item_count > MAX_BATCH_IMAGES:
+        return jsonify({'success': False, 'error': f'한 번에 최대 {MAX_BATCH_IMAGES}장까지 분석할 수 있습니다.'}), 400
+
+    # 입력 목록: (출처, 이름, 이미지, 오류메시지)
+    items = []
+    for uploaded_file in uploaded_files:
+        image, error_message = load_image_from_filestorage(uploaded_file)
+        items.append(('file', uploaded_file.filename, image, error_message))
+    # URL은 동시에 내려받고, 전체 제한 시간 안에 끝나지 않은 URL은 해당 항목만 오류로 처리
+    fetches = [url_fetch_pool.submit(image_analyzer.load_image_from_url, image_url) for image_url in image_urls]
+    wait(fetches, timeout=URL_FETCH_TIMEOUT)
+    for image_url, fetch in zip(image_urls, fetches):
+        if not fetch.done():
+            fetch.cancel()
+            items.append(('url', image_url, None, 'URL에서 이미지를 불러오는 시간이 초과되었습니다.'))
+            continue
+        image = fetch.result()
+        items.append(('url', image_url, image,
+                      None if image is not None else 'URL에서 이미지를 불러오지 못했습니다. URL을 확인해주세요.'))
+
+    # 불러온 이미지만 모아 한 번에 분석 요청
+    images = [image for _, _, image, _ in items if image is not None]
+    batch_results = []
+    if images:
+        batch_results, error_response = run_inference(images)
+        if error_response is not None:
+            return error_response
+
+    responses = []
+    analyzed = iter(batch_results)
+    for source_type, name, image, error_message in items:
+        if image is None:
+            responses.append({'success': False, 'source_type': source_type, 'name': name, 'error': error_message})
+            continue
+        analysis_results = next(analyzed)
+        responses.append({
+            'success': True,
+            'source_type': source_type,
+            'name': name,
+            'description': image_analyzer.describe_image(analysis_results),
+            'results': simplify_results(analysis_results)
+        })
+
+    return jsonify({'success': True, 'count': len(images), 'items': responses})
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """추론 큐 지표 (큐 길이, 배치 크기 분포, 대기/추론 시간)"""
+    if inference_queue is None:
+        return jsonify({'model_loaded': False})
+    return jsonify({
+        'model_loaded': True,
+        'queue_depth': inference_queue.depth,
+        'max_batch_size': inference_queue.max_batch_size,
+        'max_delay_ms': inference_queue.max_delay * 1000,
+        **inference_queue.metrics.snapshot()
     })
 
 
@@ -0,0 +1,67 @@
+"""
+배치 분석 벤치마크
+같은 이미지 N장을 한 장씩 분석(analyze_image)할 때와 배치로 분석(analyze_images)할 때의
+초당 처리 이미지 수를 비교하고, 두 방식의 결과가 같은지 확인합니다.
+
+사용 예:
+    python benchmark_batch.py
+    python benchmark_batch.py --count 64 --batch-sizes 1 8 16 32
+"""
+
+import argparse
+import time
+
+import torch
+from PIL import Image, ImageOps
+
+from image_analyzer import ImageAnalyzer
+
+
+def make_images(path, count):
+    """테스트 이미지를 뒤집고 잘라서 서로 다른 이미지 count장을 만듭니다."""
+    base = Image.open(path).convert('RGB')
+    width, height = base.size
+    images = []
+    for i in range(count):
+        image = ImageOps.mirror(base) if i % 2 else base
+        margin = (i // 2) % 8 * 0.02
+        images.append(image.crop((int(width * margin), int(height * margin),
+                                  int(width * (1 - margin)), int(height * (1 - margin)))))
+    return images
+
+
+def main():
+    parser = argparse.ArgumentParser(description='배치 분석 벤치마크')
+    parser.add_argument('--image', default='test_cat.jpg', help='테스트 이미지 경로')
+    parser.add_argument('--count', type=int, default=32, help='분석할 이미지 수')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[8, 16, 32], help='비교할 배치 크기')
+    args = parser.parse_args()
+
+    analyzer = ImageAnalyzer()
+    if not analyzer.load_model():
+        return
+    images = make_images(args.image, args.count)
+    print(f"디바이스: {analyzer.device}, torch 스레드: {torch.get_num_threads()}, 이미지 {args.count}장")
+
+    # 워밍업
+    analyzer.analyze_images(images[:2])
+
+    start = time.perf_counter()
+    single = [analyzer.analyze_image(image) for image in images]
+    single_sec = time.perf_counter() - start
+    print(f"  한 장씩:       {args.count / single_sec:6.1f} 장/초")
+
+    for batch_size in args.batch_sizes:
+        start = time.perf_counter()
+        batched = []
+        for i in range(0, len(images), batch_size):
+            batched.extend(analyzer.analyze_images(images[i:i + batch_size]))
+        batch_sec = time.perf_counter() - start
+        # 배치 안의 연산 순서 차이로 확률은 아주 조금 다를 수 있으므로 1순위 라벨만 비교
+        same = sum(a[0]['label'] == b[0]['label'] for a, b in zip(single, batched))
+        print(f"  배치 {batch_size:3d}장:   {args.count / batch_sec:6.1f} 장/초 "
+              f"-> {single_sec / batch_sec:.2f}배 (1순위 라벨 일치 {same}/{args.count})")
+
+
+if __name__ == '__main__':
+    main()
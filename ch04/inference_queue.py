@@ -0,0 +1,228 @@
+"""
+추론 큐 모듈
+모델을 가진 작업 스레드 하나가 요청 큐에서 요청을 꺼내 마이크로 배치(최대 크기 / 최대 대기 시간)로 묶어
+한 번에 분석하고, 요청마다 Future로 결과를 돌려줍니다.
+요청 스레드들이 각자 순전파를 실행하며 CPU 스레드를 두고 다투는 대신, 순전파는 항상 작업 스레드에서 하나씩만 실행됩니다.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+# 배치 하나에 담는 최대 이미지 수
+DEFAULT_MAX_BATCH_SIZE = 16
+
+# 첫 요청을 꺼낸 뒤 다른 요청을 더 기다리는 최대 시간 (초)
+DEFAULT_MAX_DELAY = 0.01
+
+# 큐에 쌓아 둘 수 있는 최대 요청 수 (넘으면 바로 거절)
+DEFAULT_MAX_QUEUE_SIZE = 256
+
+# 대기 시간 백분위를 계산할 때 보관하는 최근 요청 수
+METRICS_WINDOW = 1000
+
+
+class InferenceMetrics:
+    """추론 큐 지표 (배치 크기 분포, 대기 시간, 추론 시간)"""
+
+    def __init__(self, window=METRICS_WINDOW):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.rejected = 0
+        self.batches = 0
+        self.images = 0
+        # 배치 크기(이미지 수) -> 배치 수
+        self.batch_sizes = {}
+        # 최근 요청의 대기 시간(큐에 넣은 뒤 배치에 들어가기까지)과 최근 배치의 추론 시간 (초)
+        self.wait_times = deque(maxlen=window)
+        self.inference_times = deque(maxlen=window)
+
+    def record_rejected(self):
+        with self._lock:
+            self.rejected += 1
+
+    def record_batch(self, batch_size, wait_times, inference_time):
+        """배치 하나의 처리 결과를 기록"""
+        with self._lock:
+            self.requests += len(wait_times)
+            self.batches += 1
+            self.images += batch_size
+            self.batch_sizes[batch_size] = self.batch_sizes.get(batch_size, 0) + 1
+            self.wait_times.extend(wait_times)
+            self.inference_times.append(inference_time)
+
+    def snapshot(self):
+        """현재 지표를 dict로 반환 (시간은 ms)"""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'rejected': self.rejected,
+                'batches': self.batches,
+                'images': self.images,
+                'average_batch_size': round(self.images / self.batches, 2) if self.batches else 0,
+                'batch_sizes': {str(size): count for size, count in sorted(self.batch_sizes.items())},
+                'wait_ms': percentiles(self.wait_times),
+                'inference_ms': percentiles(self.inference_times),
+            }
+
+
+def percentiles(values):
+    """p50/p95/p99/최댓값 (ms, 값이 없으면 0)"""
+    ordered = sorted(values)
+    if not ordered:
+        return {'p50': 0, 'p95': 0, 'p99': 0, 'max': 0}
+
+    def pick(percent):
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))] * 1000, 2)
+
+    return {'p50': pick(50), 'p95': pick(95), 'p99': pick(99), 'max': round(ordered[-1] * 1000, 2)}
+
+
+class InferenceQueue:
+    """이미지 분석 요청을 마이크로 배치로 묶어 처리하는 작업 스레드"""
+
+    def __init__(self, analyzer, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_delay=DEFAULT_MAX_DELAY,
+                 max_queue_size=DEFAULT_MAX_QUEUE_SIZE):
+        """analyzer는 작업 스레드만 사용하므로 다른 곳에서 analyze_images를 직접 호출하지 않아야 함"""
+        self.analyzer = analyzer
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        # 요청: (큐에 넣은 시각, 이미지 목록, Future), None은 종료 신호
+        self._requests = queue.Queue(maxsize=max_queue_size)
+        self.metrics = InferenceMetrics()
+        # 이전 배치에 넣지 못하고 넘겨받은 요청
+        self._carry = None
+        self._thread = None
+
+    def start(self):
+        """작업 스레드 시작"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='inference-worker', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """남은 요청을 처리한 뒤 작업 스레드 종료"""
+        if self._thread is not None:
+            self._requests.put(None)
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def depth(self):
+        """큐에서 기다리는 요청 수"""
+        return self._requests.qsize()
+
+    def submit(self, images):
+        """이미지 목록 분석을 요청하고 Future 반환 (큐가 가득 차면 None)
+        Future의 결과는 이미지별 분석 결과 목록 (분석에 실패하면 None)
+        디코딩할 수 없는 이미지가 있으면 큐에 넣지 않고 바로 None 결과를 돌려주므로 다른 요청에 영향이 없습니다.
+        """
+        future = Future()
+        # 이미지 디코딩/RGB 변환은 요청 스레드에서 미리 해 두어 작업 스레드는 추론만 함
+        # (Image.open은 지연 로딩이므로 RGB 이미지도 load로 끝까지 디코딩해 업로드 스트림과의 연결을 끊음)
+        try:
+            decoded = []
+            for image in images:
+                image.load()
+                decoded.append(image if image.mode == 'RGB' else image.convert('RGB'))
+        except Exception as e:
+            print(f"이미지를 디코딩할 수 없습니다: {e}")
+            future.set_result(None)
+            return future
+        images = decoded
+        try:
+            self._requests.put_nowait((time.perf_counter(), images, future))
+        except queue.Full:
+            self.metrics.record_rejected()
+            return None
+        return future
+
+    def _collect_batch(self, first):
+        """첫 요청에 이어 최대 크기나 최대 대기 시간에 이를 때까지 요청을 모음 (종료 신호를 받으면 stopping=True)
+        첫 요청 하나가 최대 크기보다 크면 그대로 한 배치로 처리 (analyze_images가 나눠서 추론)
+        """
+        batch = [first]
+        size = len(first[1])
+        deadline = time.perf_counter() + self.max_delay
+        while size < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            if size + len(item[1]) > self.max_batch_size:
+                # 요청은 나누지 않으므로 최대 크기를 넘기는 요청은 다음 배치의 첫 요청으로 넘김
+                self._carry = item
+                break
+            batch.append(item)
+            size += len(item[1])
+        return batch, False
+
+    def _run(self):
+        """작업 스레드: 큐에서 요청을 모아 배치 단위로 분석
+
+        반복 한 번에서 어떤 오류가 나도 그 배치의 요청에는 실패(None)를 돌려주고 다음 배치를 계속 처리하므로,
+        작업 스레드가 멈춰 이후 요청이 모두 시간 초과되는 일이 없습니다.
+        """
+        stopping = False
+        while not stopping or self._carry is not None:
+            first, self._carry = self._carry, None
+            if first is None:
+                first = self._requests.get()
+                if first is None:
+                    break
+            batch = [first]
+            try:
+                batch, stopping = self._collect_batch(first)
+                self._process_batch(batch)
+            except Exception as e:
+                print(f"배치 처리 중 오류가 발생했습니다: {e}")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+
+    def _analyze(self, images):
+        """이미지 목록 분석 (실패하거나 결과 수가 이미지 수와 다르면 None)"""
+        try:
+            batch_results = self.analyzer.analyze_images(images) if images else []
+        except Exception as e:
+            print(f"배치 분석 중 오류가 발생했습니다: {e}")
+            return None
+        if batch_results is not None and len(batch_results) != len(images):
+            print(f"배치 분석 결과 수가 이미지 수와 다릅니다: {len(batch_results)} / {len(images)}")
+            return None
+        return batch_results
+
+    def _process_batch(self, batch):
+        """배치 하나를 분석하고 요청 순서대로 결과를 나눠 돌려줌
+
+        시간 초과로 취소된 요청은 건너뛰고, 배치 전체가 실패하면 요청마다 따로 다시 분석해
+        한 요청의 입력 때문에 같은 배치의 다른 요청까지 실패하지 않도록 합니다.
+        """
+        batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        started = time.perf_counter()
+        images = [image for _, request_images, _ in batch for image in request_images]
+
+        batch_results = self._analyze(images)
+        if batch_results is None and len(batch) > 1:
+            print(f"배치 분석에 실패해 요청 {len(batch)}개를 하나씩 다시 분석합니다.")
+            for _, request_images, future in batch:
+                future.set_result(self._analyze(request_images))
+        else:
+            offset = 0
+            for _, request_images, future in batch:
+                if batch_results is None:
+                    future.set_result(None)
+                else:
+                    future.set_result(batch_results[offset:offset + len(request_images)])
+                offset += len(request_images)
+        self.metrics.record_batch(len(images), [started - queued_at for queued_at, _, _ in batch],
+                                  time.perf_counter() - started)